@@ -5,6 +5,7 @@ action_registry.py – central action catalogue & timing helpers
 
 Public surface (stable):
     ACTIONS          – dict[id, ActionSpec]
+    ACTION_CODE      – dict[id, int] dense integer code per action (sorted ids)
     CHAINS           – list[ChainMod]
     ENC_MULT         – {"armor": {...}, "weapon": {...}}
     effective_ticks  – stat-, encumbrance-, fatigue-aware duration calculator
@@ -26,6 +27,7 @@ from typing import Callable, Dict, List, Set
 
 __all__ = [
     "ACTIONS",
+    "ACTION_CODE",
     "CHAINS",
     "ENC_MULT",
     "effective_ticks",
@@ -125,6 +127,9 @@ _load_group("locomotion", Phase.MOVE)
 _load_group("attacks", Phase.ATTACK)
 _load_group("defence", Phase.DEFEND)
 
+# stable int codes for per-action lookup tables (index = code)
+ACTION_CODE: Dict[str, int] = {aid: i for i, aid in enumerate(sorted(ACTIONS))}
+
 # ---------- chain rules ------------------------------------------------------------
 
 
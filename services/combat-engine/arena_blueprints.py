@@ -1,6 +1,6 @@
 # arena_blueprints.py
 from movement_collision import _require_store, Position2D, CollisionRadius
-from attack import _build_maul, Weapon, Opponent, AttackSystem
+from attack import _build_maul, Opponent, AttackSystem, give_weapon
 
 DEFAULT_SEPARATION = 0.30  # m – ensures the weapon can overlap if swung
 DEFAULT_RADIUS     = 0.30  # collision radius for both fighters
@@ -28,8 +28,8 @@ def spawn_fighters_pair(world,
 
     # 4. Attach a weapon and Opponent to each
     weapon = _build_maul()                    
-    _require_store(world, Weapon).add(a, weapon)
-    _require_store(world, Weapon).add(b, weapon)
+    give_weapon(world, a, weapon)
+    give_weapon(world, b, weapon)
 
     _require_store(world, Opponent).add(a, Opponent(b))
     _require_store(world, Opponent).add(b, Opponent(a))
@@ -6,11 +6,15 @@ ecs.world.World (deterministic RNG).
 """
 from __future__ import annotations
 
+import heapq
 import math
 import random
 import time
+from collections import defaultdict
 from dataclasses import dataclass
 from enum import StrEnum, auto
+from itertools import count
+from operator import itemgetter
 from typing import Callable, List, Literal, Tuple, Dict
 
 # ── components / helpers from movement_collision ───────────────────────────
@@ -25,7 +29,10 @@ Vec2 = Tuple[float, float]
 # OLD: ANG120 = math.radians(120.0)
 # NEW: We'll define a 90° arc and do the degrees ourselves below:
 ANG90 = math.radians(90.0)     # <--- ADDED
+_ARC_START_DEG = 30.0
+_ARC_END_DEG   = -60.0
 
+from action_registry import ACTION_CODE
 from fatigue_morale import ActivitySampleEvent as _ASE
 
 ##############################################################################
@@ -48,6 +55,36 @@ class AttackProfile:
     active_ticks: int
     recovery_ticks: int
     path_fn: Callable[[float, Vec2, Vec2], Vec2]  # kept for future use
+    # per active-tick (c, s, deg): c/s already scaled by thrust extension
+    arc_table: Tuple[Tuple[float, float, float], ...] = ()  # populated in __post_init__
+    # (windup, active, recovery, v_lin_coeff, is_swing, arc_table) – one
+    # unpack in the hot loop instead of several slot reads
+    hot: tuple = ()                                           # populated in __post_init__
+    action_code: int = -1                                     # populated in __post_init__
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "action_code", ACTION_CODE.get(self.action_id, -1))
+        n = self.active_ticks
+        rows = []
+        for idx in range(max(1, n)):
+            # progress t in [0..1): 0→start of active phase
+            t = idx / n if n else 0.0
+            if self.kind == "swing":
+                # arc from +30° to -60° over t in [0..1]
+                deg = _ARC_START_DEG + t * (_ARC_END_DEG - _ARC_START_DEG)
+                rad = math.radians(deg)
+                rows.append((math.cos(rad), math.sin(rad), deg))
+            else:
+                # thrust is a direct line extending with t
+                rows.append((t, 0.0, 0.0))
+        object.__setattr__(self, "arc_table", tuple(rows))
+
+        # v_lin = reach * coeff  (swing, 90° arc)  |  reach * coeff / dt_s  (thrust)
+        is_swing = self.kind == "swing"
+        coeff = ((ANG90 if is_swing else 1.0) / n) if n else 0.0
+        object.__setattr__(self, "hot", (
+            self.windup_ticks, n, self.recovery_ticks, coeff, is_swing, self.arc_table,
+        ))
 
 
 @dataclass(slots=True)
@@ -64,10 +101,15 @@ class Weapon:
     mass_kg: float = 1.0
     edge_type: str = "blunt"
     max_offset: float = 0.0          # populated in __post_init__
+    # flattened (offset_m, radius_m, tag) rows – populated in __post_init__
+    seg_rows: Tuple[Tuple[float, float, str], ...] = ()
 
     def __post_init__(self) -> None:
         object.__setattr__(self, "max_offset",
                            max(seg.offset_m for seg in self.hit_segments))
+        object.__setattr__(self, "seg_rows",
+                           tuple((seg.offset_m, seg.radius_m, seg.tag)
+                                 for seg in self.hit_segments))
 
 
 @dataclass(slots=True)
@@ -106,16 +148,48 @@ def _ensure_event_api(world) -> None:
     if hasattr(world, "post_event"):
         return
 
-    world._event_q: List[object] = []
-
-    def _post(evt):             
-        world._event_q.append(evt)
-    def _consume():             
-        q, world._event_q = world._event_q, []
-        return q
+    # type → [(seq, event), …]; the same list is also filed under the class
+    # name so string-keyed peeks (``peek_events("ImpactEvent")``) stay O(1).
+    # *seq* lets a tuple consume merge its buckets back into post order.
+    world._event_q: Dict[object, List[object]] = defaultdict(list)
+    seq = count(1)
+
+    def _post(evt):
+        q = world._event_q
+        cls = evt.__class__
+        bucket = q.get(cls)
+        if bucket is None:
+            bucket = q[cls] = q[cls.__name__] = []
+        bucket.append((next(seq), evt))
+    def _consume(cls):
+        q, tails = world._event_q, []
+        for kind in (cls if isinstance(cls, tuple) else (cls,)):
+            bucket = q.get(kind)
+            if bucket:
+                tails.append(bucket[:])
+                bucket.clear()
+        if len(tails) == 1:
+            return [e for _, e in tails[0]]
+        return [e for _, e in heapq.merge(*tails, key=itemgetter(0))]
+    def _peek(cls):
+        bucket = world._event_q.get(cls)
+        return [e for _, e in bucket] if bucket else []
+    def _flush():
+        world._event_q.clear()
 
     world.post_event = _post            # type: ignore[attr-defined]
     world.consume_events = _consume     # type: ignore[attr-defined]
+    world.peek_events = _peek           # type: ignore[attr-defined]
+    if not hasattr(world, "flush"):
+        world.flush = _flush            # type: ignore[attr-defined]
+
+
+def give_weapon(world, eid: int, weapon: Weapon) -> None:
+    """Attach *weapon* to *eid* together with a fresh AttackState."""
+    _require_store(world, Weapon).add(eid, weapon)
+    st_s = _require_store(world, AttackState)
+    if st_s.get(eid) is None:
+        st_s.add(eid, AttackState())
 
 
 ##############################################################################
@@ -123,12 +197,52 @@ def _ensure_event_api(world) -> None:
 ##############################################################################
 
 
+def _first_contact(
+    ax: float, ay: float, bx: float, by: float, def_r: float,
+    ct: float, st: float, seg_rows: Tuple[Tuple[float, float, str], ...],
+) -> Tuple[str, float, float, float, float] | None:
+    """
+    First blade segment touching the defender, or ``None``.
+
+    (ax, ay) is the attacker, (bx, by) the defender with body radius
+    *def_r*; *seg_rows* holds ``(offset, radius, tag)`` per segment along the
+    blade.  The blade direction is the attacker→defender heading (Hx,Hy)
+    rotated by the cached (cos θ, sin θ) = (*ct*, *st*) towards its
+    right-hand perpendicular (-Hy,Hx).  Returns ``(tag, cx, cy, dist,
+    limit)``: segment tag, its centre, centre-to-defender distance and the
+    contact limit it beat.
+    """
+    dx, dy = bx - ax, by - ay
+    dist = math.hypot(dx, dy) or 1e-9
+    hx, hy = dx / dist, dy / dist
+    ux = ct * hx - st * hy
+    uy = ct * hy + st * hx
+    for off, seg_r, tag in seg_rows:
+        cx = ax + ux * off
+        cy = ay + uy * off
+        ddx, ddy = bx - cx, by - cy
+        dist_to_def = math.sqrt(ddx*ddx + ddy*ddy)
+        limit = seg_r + def_r
+        if dist_to_def <= limit:
+            return tag, cx, cy, dist_to_def, limit
+    return None
+
+
 class AttackSystem:
     """Fixed-step melee FSM + circle-circle contact check."""
 
     DEFAULT_AUTOSWING = 60  # (unchanged) ticks between auto-intents
 
+    def __init__(self) -> None:
+        self._n_weapons = -1    # weapon-store size at the last bootstrap
+        self._active_ids: set[int] = set()   # eids whose FSM is not IDLE
+
     def __call__(self, world, dt_ns: int) -> None:  # noqa: N802
+        tick  = world.tick
+        # idle fast path: nothing in flight and no auto-intent this tick
+        if not self._active_ids and tick % self.DEFAULT_AUTOSWING:
+            return
+
         _ensure_event_api(world)
 
         pos_s = _require_store(world, Position2D)
@@ -136,13 +250,17 @@ class AttackSystem:
         wep_s = _require_store(world, Weapon)
         st_s  = _require_store(world, AttackState)
         opp_s = _require_store(world, Opponent)
+        xs, ys = pos_s.arrays()
+        (rs,)  = col_s.arrays()
 
         dt_s  = dt_ns * 1e-9
-        tick  = world.tick
+        active = self._active_ids
 
-        # bootstrap states
-        for eid in wep_s._data:                     # type: ignore[attr-defined]
-            st_s._data.setdefault(eid, AttackState())   # type: ignore[attr-defined]
+        # bootstrap states – only for weapons added without give_weapon()
+        if len(wep_s._data) != self._n_weapons:     # type: ignore[attr-defined]
+            for eid in wep_s._data:                 # type: ignore[attr-defined]
+                st_s._data.setdefault(eid, AttackState())   # type: ignore[attr-defined]
+            self._n_weapons = len(wep_s._data)      # type: ignore[attr-defined]
 
         for eid, state in st_s.items():
             print(f"[DEBUG: AttackSystem] eid={eid} tick={tick} "
@@ -159,7 +277,7 @@ class AttackSystem:
                 state.profile_idx  = 0
                 prof               = weapon.profiles[0]
                 state.phase        = Phase.WINDUP
-                state.ticks_left   = prof.windup_ticks
+                state.ticks_left   = prof.hot[0]
                 state.target_id    = opp_id
                 state.has_hit      = False
 
@@ -167,103 +285,76 @@ class AttackSystem:
             if state.phase is not Phase.IDLE:
                 state.ticks_left -= 1
                 if state.ticks_left <= 0:
-                    prof = weapon.profiles[state.profile_idx]
+                    _, ac, rc, _, _, _ = weapon.profiles[state.profile_idx].hot
                     if state.phase is Phase.WINDUP:
-                        state.phase, state.ticks_left = Phase.ACTIVE, prof.active_ticks
+                        state.phase, state.ticks_left = Phase.ACTIVE, ac
                     elif state.phase is Phase.ACTIVE:
-                        state.phase, state.ticks_left = Phase.RECOVERY, prof.recovery_ticks
+                        state.phase, state.ticks_left = Phase.RECOVERY, rc
                     else:  # RECOVERY
                         state.phase, state.swing_id = Phase.IDLE, state.swing_id + 1
 
+            if state.phase is Phase.IDLE:
+                active.discard(eid)
+            else:
+                active.add(eid)
+
             # ── early-out
             if state.phase is not Phase.ACTIVE or state.has_hit:
                 continue
 
             prof  = weapon.profiles[state.profile_idx]
-            ap    = pos_s.get(eid)
-            dp    = pos_s.get(state.target_id)      
-            dc    = col_s.get(state.target_id)
-            if ap is None or dp is None or dc is None:
+            tid   = state.target_id
+            if eid not in pos_s or tid not in pos_s or tid not in col_s:
                 continue
+            # cached (cos θ, sin θ) for this active tick
+            _, ac, _, vlc, is_swing, arc = prof.hot
+            ct, st, theta_deg = arc[ac - state.ticks_left]
 
-            # direction from attacker to defender
-            dx, dy = dp.x - ap.x, dp.y - ap.y
-            dist   = math.hypot(dx, dy) or 1e-9
-            Hx, Hy = dx / dist, dy / dist
-
-            # progress t in [0..1]: 0→start of active phase, 1→end
-            t = 1.0 - (state.ticks_left / prof.active_ticks)
-
-            if prof.kind == "swing":
-                # We define an arc from +30° to -60° over t in [0..1]
-                start_deg = 30.0
-                end_deg   = -60.0
-                delta_deg = end_deg - start_deg  # -90 deg total
-                theta_deg = start_deg + t * delta_deg
-                theta_rad = math.radians(theta_deg)
-
-                # This rotates forward vector (Hx,Hy) by `theta_rad`.
-                # Rx,Ry is perpendicular (to the right).
-                Rx, Ry = -Hy, Hx
-                ux = math.cos(theta_rad) * Hx + math.sin(theta_rad) * Rx
-                uy = math.cos(theta_rad) * Hy + math.sin(theta_rad) * Ry
-
-            else:
-                # thrust is just a direct line
-                ux, uy = Hx, Hy
+            hit = _first_contact(xs[eid], ys[eid], xs[tid], ys[tid], rs[tid],
+                                 ct, st, weapon.seg_rows)
+            if hit is None:
+                continue
+            tag, cx, cy, dist_to_def, limit = hit
 
             # linear speed (m s⁻¹)
-            reach = weapon.max_offset
-            if prof.kind == "swing":
-                # We still assume a 90° total arc
-                v_lin = (reach * ANG90) / prof.active_ticks
-            else:
-                v_lin = reach / (prof.active_ticks * dt_s)
-
-            factor_const = 1.0 if prof.kind == "swing" else t
-            for seg in weapon.hit_segments:
-                cx = ap.x + ux * seg.offset_m * factor_const
-                cy = ap.y + uy * seg.offset_m * factor_const
-                ddx, ddy = dp.x - cx, dp.y - cy
-                dist_to_def = math.sqrt(ddx*ddx + ddy*ddy)
-                limit = seg.radius_m + dc.r
-
-                # Optional debug
-                print(f"[DEBUG] tick={tick} e{eid} sw={state.swing_id} "
-                      f"phase={state.phase} seg={seg.tag} distToDef={dist_to_def:.3f} "
-                      f"limit={limit:.3f} t={t:.3f} arcDeg={theta_deg:.1f}")
-
-                if dist_to_def <= limit:
-                    print(
-                    f"!!! IMPACT DETECTED: e{eid} vs e{state.target_id}, "
-                    f"dist={dist_to_def:.3f} <= limit={limit:.3f} (arcDeg={theta_deg:.1f})"
-                    )
-                    world.post_event(
-                        ImpactEvent(
-                            tick=tick,
-                            attacker_id=eid,
-                            defender_id=state.target_id,
-                            contact_xy=(cx, cy),
-                            relative_speed=v_lin,
-                            weapon_mass=weapon.mass_kg,
-                            edge_type=weapon.edge_type,
-                            contact_part=seg.tag,
-                        )
-                    )
-                    # stamina drain sample – one tick, zero travel
-                    world.post_event(_ASE(
-                        tick=tick,
-                        entity_id=eid,
-                        action_id=prof.action_id,
-                        metres_moved=0.0)
-                    )
-                    state.has_hit = True
-                    break
+            v_lin = weapon.max_offset * vlc if is_swing else weapon.max_offset * vlc / dt_s
+
+            print(
+            f"!!! IMPACT DETECTED: e{eid} vs e{tid}, "
+            f"dist={dist_to_def:.3f} <= limit={limit:.3f} (arcDeg={theta_deg:.1f})"
+            )
+            # positional: these constructors are on the hot path
+            world.post_event(
+                ImpactEvent(
+                    tick,               # tick
+                    eid,                # attacker_id
+                    tid,                # defender_id
+                    (cx, cy),           # contact_xy
+                    v_lin,              # relative_speed
+                    weapon.mass_kg,     # weapon_mass
+                    weapon.edge_type,   # edge_type
+                    tag,                # contact_part
+                )
+            )
+            # stamina drain sample – one tick, zero travel
+            world.post_event(_ASE(
+                tick,                   # tick
+                eid,                    # entity_id
+                prof.action_id,         # action_id
+                0.0,                    # metres_moved
+                prof.action_code)       # action_code
+            )
+            state.has_hit = True
 
 
 ##############################################################################
 # ─────────────────────────  Minimal demo  ─────────────────────────────────
 ##############################################################################
+def _path_noop(*_) -> Vec2:
+    """Shared placeholder trajectory (one function object for every profile)."""
+    return (0.0, 0.0)
+
+
 def _json_to_profile(row: dict) -> AttackProfile:
     """Translate one attacks.json entry into an AttackProfile."""
     return AttackProfile(
@@ -272,7 +363,7 @@ def _json_to_profile(row: dict) -> AttackProfile:
         windup_ticks   = row["wind"],
         active_ticks   = row["hit"],
         recovery_ticks = row["reco"],
-        path_fn        = lambda *_: (0.0, 0.0),   # TODO: fancy trajectories later, swap the lambda for a real spline.
+        path_fn        = _path_noop,   # TODO: fancy trajectories later, swap for a real spline.
     )
     
 _JSON_ATTACKS: List[Dict] = [
@@ -311,8 +402,8 @@ if __name__ == "__main__":  # pragma: no cover
     _require_store(world, Position2D).add(b, Position2D( 0.20, 0.0))
     _require_store(world, CollisionRadius).add(a, CollisionRadius(0.25))
     _require_store(world, CollisionRadius).add(b, CollisionRadius(0.25))
-    _require_store(world, Weapon).add(a, weapon)
-    _require_store(world, Weapon).add(b, weapon)
+    give_weapon(world, a, weapon)
+    give_weapon(world, b, weapon)
     _require_store(world, Opponent).add(a, Opponent(b))
     _require_store(world, Opponent).add(b, Opponent(a))
 
@@ -349,8 +440,8 @@ def test_two_dummies_register_hits():  # type: ignore
     _require_store(world, Position2D).add(b, Position2D( 0.20, 0.0))
     _require_store(world, CollisionRadius).add(a, CollisionRadius(0.25))
     _require_store(world, CollisionRadius).add(b, CollisionRadius(0.25))
-    _require_store(world, Weapon).add(a, weapon)
-    _require_store(world, Weapon).add(b, weapon)
+    give_weapon(world, a, weapon)
+    give_weapon(world, b, weapon)
     _require_store(world, Opponent).add(a, Opponent(b))
     _require_store(world, Opponent).add(b, Opponent(a))
 
@@ -367,6 +458,26 @@ def test_two_dummies_register_hits():  # type: ignore
     assert hit_flag, "no ImpactEvent and no AttackState.has_hit ⇒ swing logic broken"
 
 
+@pytest.mark.skipif(pytest is None, reason="pytest unavailable")  # type: ignore
+def test_event_shim_post_order_and_peek_copy():  # type: ignore
+    class _Bare:                        # no post_event: gets the shim
+        pass
+
+    world = _Bare()
+    _ensure_event_api(world)
+    e1 = ImpactEvent(1, 1, 2, (0.0, 0.0), 3.0, 2.0, "blunt", "head")
+    e2 = ImpactEvent(2, 2, 1, (0.0, 0.0), 3.0, 2.0, "blunt", "torso")
+    world.post_event(e1)
+    world.post_event(_ASE(1, 1, "attack"))
+    world.post_event(e2)
+
+    world.peek_events("ImpactEvent").clear()   # a copy: the queue is untouched
+    assert world.peek_events(ImpactEvent) == [e1, e2]
+    drained = world.consume_events((_ASE, ImpactEvent))
+    assert drained[0] is e1 and drained[2] is e2 and isinstance(drained[1], _ASE)
+    assert world.consume_events(ImpactEvent) == []
+
+
 @pytest.mark.skipif(
     __import__("os").environ.get("ARENA_FAST_MACHINE") != "1",
     reason="perf test runs only when ARENA_FAST_MACHINE=1",
@@ -388,8 +499,8 @@ def test_perf_200_entities():  # type: ignore
         _require_store(world, Position2D).add(b, Position2D(float(i) + 0.75, 0.0))
         _require_store(world, CollisionRadius).add(a, CollisionRadius(0.25))
         _require_store(world, CollisionRadius).add(b, CollisionRadius(0.25))
-        _require_store(world, Weapon).add(a, weapon)
-        _require_store(world, Weapon).add(b, weapon)
+        give_weapon(world, a, weapon)
+        give_weapon(world, b, weapon)
         _require_store(world, Opponent).add(a, Opponent(b))
         _require_store(world, Opponent).add(b, Opponent(a))
 
@@ -1,6 +1,8 @@
-"""Type-safe component store (stdlib-only)."""
+"""Type-safe component stores (stdlib-only)."""
 from __future__ import annotations
-from typing import TypeVar, Generic, Dict, Iterator, Tuple
+from array import array
+from dataclasses import fields as dc_fields
+from typing import TypeVar, Generic, Dict, Iterator, List, Sequence, Tuple
 
 T = TypeVar("T")
 
@@ -22,3 +24,114 @@ class ComponentStore(Generic[T]):
 
     def items(self) -> Iterator[Tuple[int, T]]:
         return self._data.items()
+
+
+def _view_type(comp_type: type, names: Sequence[str]) -> type:
+    """Build a write-through row view exposing *names* as attributes."""
+    def _prop(col: int) -> property:
+        def _set(v, val) -> None:
+            v._cols[col][v._eid] = val
+            v._store._version += 1
+
+        return property(lambda v: v._cols[col][v._eid], _set)
+
+    def _repr(v) -> str:
+        body = ", ".join(f"{n}={getattr(v, n)!r}" for n in names)
+        return f"{comp_type.__name__}({body})"
+
+    ns = {n: _prop(i) for i, n in enumerate(names)}
+    ns.update(__slots__=("_cols", "_eid", "_store"), __repr__=_repr)
+    return type(f"{comp_type.__name__}View", (), ns)
+
+
+class DenseStore(Generic[T]):
+    """
+    SoA store: one ``array('d')`` column per numeric field of *T*.
+
+    Columns are indexed directly by ``EntityID`` (ids are dense and monotonic),
+    so two dense stores line up without any per-tick join.  ``get`` returns a
+    write-through view for code that still wants ``p.x += …``; bulk consumers
+    should read ``arrays()`` once and index by eid.
+
+    ``version`` changes on every ``add``/``remove`` and view write, so
+    derived values (e.g. a column max) can be cached until it moves.
+    Writes straight into ``arrays()`` do not bump it.
+    """
+    __slots__ = ("_names", "_cols", "_present", "_eids", "_views", "_view_t",
+                 "_version")
+
+    def __init__(self, comp_type: type, names: Sequence[str] | None = None) -> None:
+        self._names = tuple(names or (f.name for f in dc_fields(comp_type)))
+        self._cols = tuple(array("d") for _ in self._names)
+        self._present = bytearray()
+        self._eids: List[int] = []                 # insertion order
+        self._views: List[object | None] = []      # eid → view | None
+        self._view_t = _view_type(comp_type, self._names)
+        self._version = 0
+
+    def _grow(self, eid: int) -> None:
+        n = eid + 1 - len(self._present)
+        if n > 0:
+            pad = array("d", bytes(8 * n))
+            for col in self._cols:
+                col.extend(pad)
+            self._present.extend(bytes(n))
+            self._views.extend([None] * n)
+
+    def add(self, eid: int, comp: T) -> None:
+        if eid < 0:
+            raise ValueError(f"entity id must be >= 0, got {eid}")
+        self._grow(eid)
+        for col, name in zip(self._cols, self._names):
+            col[eid] = getattr(comp, name)
+        self._version += 1
+        if not self._present[eid]:
+            view = self._view_t()
+            view._cols, view._eid, view._store = self._cols, eid, self
+            self._present[eid] = 1
+            self._views[eid] = view
+            self._eids.append(eid)
+
+    def get(self, eid: int) -> T | None:
+        if eid not in self:                 # also rejects negative ids
+            return None
+        return self._views[eid]  # type: ignore[return-value]
+
+    def remove(self, eid: int) -> None:
+        if eid in self:
+            for col in self._cols:
+                col[eid] = 0.0
+            self._present[eid] = 0
+            self._views[eid] = None
+            self._eids.remove(eid)
+            self._version += 1
+
+    def items(self) -> List[Tuple[int, T]]:
+        """(eid, view) pairs as a list, so ``remove()`` inside the loop is safe."""
+        views = self._views
+        return [(eid, views[eid]) for eid in self._eids]
+
+    def __contains__(self, eid: object) -> bool:
+        return (isinstance(eid, int) and 0 <= eid < len(self._present)
+                and self._present[eid] == 1)
+
+    def __len__(self) -> int:
+        return len(self._eids)
+
+    @property
+    def version(self) -> int:
+        """Change counter for add/remove/view writes (see class notes)."""
+        return self._version
+
+    # ── bulk access (do not resize the returned containers) ─────────────
+    def arrays(self) -> Tuple[array, ...]:
+        """Field columns in declaration order, indexed by eid."""
+        return self._cols
+
+    def eids(self) -> List[int]:
+        """Live entity ids in insertion order."""
+        return self._eids
+
+    def mask(self) -> bytearray:
+        """Presence flags indexed by eid (may be shorter than other stores)."""
+        return self._present
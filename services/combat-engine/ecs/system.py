@@ -5,6 +5,12 @@ from typing import Protocol, runtime_checkable, List, Callable, TYPE_CHECKING
 if TYPE_CHECKING:  # avoid circular import at runtime
     from .world import World
 
+# Systems and kernels: a system reads the world (stores, events), resolves
+# entities to column slots / plain values and posts the resulting events.
+# The numeric loop itself lives in a module-level ``_*_kernel`` function
+# that touches only its arguments, so it can be tested and tuned without
+# building a world.
+
 @runtime_checkable
 class System(Protocol):
     """Callable chunk of game logic executed each fixed tick."""
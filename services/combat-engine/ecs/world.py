@@ -1,11 +1,16 @@
 from __future__ import annotations
+import heapq
 import random
-from collections import deque
+from bisect import bisect_right
 from dataclasses import dataclass, field
-from typing import Dict, Any, Callable, List
+from operator import itemgetter
+from typing import Dict, Any, Callable, List, Tuple
 
 from .entity import EntityIDGenerator
 
+_SEQ = itemgetter(0)
+
+
 @dataclass
 class World:
     """Shared simulation state object handed to every System."""
@@ -13,7 +18,8 @@ class World:
     tick: int = 0
     entities: EntityIDGenerator = field(default_factory=EntityIDGenerator)
     components: Dict[type, Any] = field(default_factory=dict)  # type -> ComponentStore
-    events: deque = field(default_factory=deque)               # transient per-tick queues
+    # transient per-tick queues: type → [(seq, event), …] in post order
+    events: Dict[type, List[Tuple[int, Any]]] = field(default_factory=dict)
     deferred: list[Any] = field(default_factory=list)
     
     # >>>>>>>>>>>>>>>  NEW stores for the health module  <<<<<<<<<<<<<<<<<
@@ -23,6 +29,9 @@ class World:
 
     # simple ordered system list
     _systems: List[Callable[["World", int], None]] = field(default_factory=list)
+    _event_seq: int = 0  # monotone, never reset by flush()
+    # class __name__ → event class, for peek_events("Name"); kept by post_event
+    _event_types: Dict[str, type] = field(default_factory=dict)
     # >>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>
 
     # Sprint-0: just wipe transient queues; more later
@@ -34,15 +43,60 @@ class World:
     def add_system(self, fn: Callable[["World", int], None]) -> None:
         self._systems.append(fn)
 
+    @property
+    def event_seq(self) -> int:
+        """Sequence number of the most recently posted event."""
+        return self._event_seq
+
     def post_event(self, evt: Any) -> None:
-        self.events.append(evt)
-
-    def consume_events(self, cls: type) -> list:
-        matched, rest = [], []
-        for e in self.events:
-            (matched if isinstance(e, cls) else rest).append(e)
-        self.events = deque(rest)
-        return matched
+        self._event_seq = seq = self._event_seq + 1
+        cls = evt.__class__
+        bucket = self.events.get(cls)
+        if bucket is None:
+            bucket = self.events[cls] = []
+            self._event_types[cls.__name__] = cls
+        bucket.append((seq, evt))
+
+    def consume_events(self, cls: type | tuple, since_seq: int = 0) -> list:
+        """
+        Drain events of *cls* (a class or tuple of classes), in post order.
+        With *since_seq* only events posted after that ``event_seq`` are
+        drained; older ones stay queued.
+
+        Dispatch is by exact class (``type(e) is cls``) – subclasses do not
+        match; event types are sealed leaf dataclasses.  A runtime-checkable
+        ``Protocol`` still matches structurally.
+        """
+        events = self.events
+        tails = []
+        for kind in (cls if isinstance(cls, tuple) else (cls,)):
+            if getattr(kind, "_is_protocol", False):
+                buckets = [b for b in events.values() if b and isinstance(b[0][1], kind)]
+            else:
+                bucket = events.get(kind)
+                buckets = (bucket,) if bucket else ()
+            for bucket in buckets:
+                if not bucket:
+                    continue
+                cut = bisect_right(bucket, since_seq, key=_SEQ) if since_seq else 0
+                tails.append(bucket[cut:])
+                del bucket[cut:]
+        if not tails:
+            return []
+        if len(tails) == 1:
+            return [e for _, e in tails[0]]
+        return [e for _, e in heapq.merge(*tails, key=_SEQ)]
+
+    def peek_events(self, cls: type | str) -> list:
+        """
+        Queued events of *cls* (a class or its ``__name__``), in post order,
+        without draining them.  A name is resolved through the name → class
+        index post_event keeps, so either form is two dict lookups.
+        """
+        if isinstance(cls, str):
+            cls = self._event_types.get(cls)
+        bucket = self.events.get(cls)
+        return [e for _, e in bucket] if bucket else []
 
     # optional: single-step loop (if you want it)
     def step(self, dt_ns: int = 20_000_000) -> None:
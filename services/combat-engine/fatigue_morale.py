@@ -8,7 +8,10 @@ Public surface
 --------------
 create_fatigue_morale_systems(world)  → injects the three systems & new stores
 ActivitySampleEvent                   → importable for one-liner shims
+ActivitySampleBatch                   → one action sampled for many entities
 Stamina, Morale, MoraleState          → components
+StaminaStore, MoraleStore             → SoA stores behind world.stamina / world.morale
+run_shard, run_shards                 → independent-bout batch driver (process pool)
 
 Design snapshot 2025-04-30 – matches “Topic 4-A” spec with all subsequent
 clarifications.
@@ -17,10 +20,14 @@ from __future__ import annotations
 
 # ───────────────────────────────────── stdlib
 import enum
+import inspect
 import time
+from array import array
+from bisect import bisect_right
 from collections import defaultdict
 from dataclasses import dataclass, field
-from typing import Dict, List, Literal, Sequence, Tuple, Type
+from functools import partial
+from typing import Callable, Dict, List, Literal, Sequence, Tuple, Type
 # ──────────────────────────────────── type aliases
 EntityId = int
 Tick     = int
@@ -62,6 +69,167 @@ class Morale:
     state: MoraleState = MoraleState.DETERMINED
 
 
+# ── SoA stores ──────────────────────────────────────────────────────────────
+# Systems index the columns by slot; ``store[eid]`` hands out a write-through
+# view with the same attributes as the dataclass for tests / demos.
+
+# uint8 state codes, ascending by band
+_STATE_BY_CODE: Tuple[MoraleState, ...] = (
+    MoraleState.DESPERATE,
+    MoraleState.FRACTURED,
+    MoraleState.UNCERTAIN,
+    MoraleState.COMPOSED,
+    MoraleState.DETERMINED,
+)
+_CODE_OF_STATE: Dict[MoraleState, int] = {s: i for i, s in enumerate(_STATE_BY_CODE)}
+_DESPERATE = _CODE_OF_STATE[MoraleState.DESPERATE]
+# band lower bounds aligned with _STATE_BY_CODE → code = bisect_right(...) - 1
+_BAND_LOWERS: Tuple[int, ...] = tuple(MORALE_BANDS[s] for s in _STATE_BY_CODE)
+
+
+def _col(name: str, decode=None, encode=None, touch: bool = False) -> property:
+    """
+    View property reading/writing ``store.<name>[slot]``; with *touch* a
+    write also calls ``store.touch(slot)``.
+    """
+    def fget(v):
+        x = getattr(v._s, name)[v._i]
+        return decode(x) if decode else x
+
+    def fset(v, x) -> None:
+        getattr(v._s, name)[v._i] = encode(x) if encode else x
+        if touch:
+            v._s.touch(v._i)
+
+    return property(fget, fset)
+
+
+class _SlotView:
+    __slots__ = ("_s", "_i")
+
+    def __init__(self, store, slot: int) -> None:
+        self._s, self._i = store, slot
+
+
+class _StaminaView(_SlotView):
+    __slots__ = ()
+    max_pts        = _col("max_pts", touch=True)
+    curr_pts       = _col("curr_pts", touch=True)
+    regen_per_tick = _col("regen_per_tick")
+    exhausted      = _col("exhausted", bool, int, touch=True)
+
+
+class _MoraleView(_SlotView):
+    __slots__ = ()
+    value = _col("value")
+    state = _col("state", _STATE_BY_CODE.__getitem__, _CODE_OF_STATE.__getitem__)
+
+
+class _SlotStore:
+    """Dense slot allocation + dict-like facade shared by the SoA stores."""
+    __slots__ = ("slot_of", "eids", "_views")
+    _view_t: type = _SlotView
+
+    def __init__(self) -> None:
+        self.slot_of: Dict[EntityId, int] = {}
+        self.eids: List[EntityId] = []          # slot → eid
+        self._views: List[_SlotView] = []
+
+    def _append(self, comp) -> None:            # pragma: no cover – abstract
+        raise NotImplementedError
+
+    def _assign(self, slot: int, comp) -> None:  # pragma: no cover – abstract
+        raise NotImplementedError
+
+    def __setitem__(self, eid: EntityId, comp) -> None:
+        slot = self.slot_of.get(eid)
+        if slot is None:
+            self.slot_of[eid] = len(self.eids)
+            self.eids.append(eid)
+            self._views.append(self._view_t(self, len(self._views)))
+            self._append(comp)
+        else:
+            self._assign(slot, comp)
+
+    def __getitem__(self, eid: EntityId):
+        return self._views[self.slot_of[eid]]
+
+    def get(self, eid: EntityId, default=None):
+        slot = self.slot_of.get(eid)
+        return default if slot is None else self._views[slot]
+
+    def __contains__(self, eid: object) -> bool:
+        return eid in self.slot_of
+
+    def __iter__(self):
+        return iter(self.eids)
+
+    def __len__(self) -> int:
+        return len(self.eids)
+
+    def items(self):
+        return zip(self.eids, self._views)
+
+    def values(self):
+        return iter(self._views)
+
+
+class StaminaStore(_SlotStore):
+    """
+    SoA ``Stamina`` columns: float64 pts/regen, uint8 exhausted flag.
+
+    ``needs_regen`` holds the slots RecoverySystem has to visit: any slot
+    written through the store / views or drained by FatigueSystem joins it,
+    and RecoverySystem drops slots once they are back at ``max_pts``.
+    """
+    __slots__ = ("max_pts", "curr_pts", "regen_per_tick", "exhausted", "needs_regen")
+    _view_t = _StaminaView
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.max_pts        = array("l")
+        self.curr_pts       = array("d")
+        self.regen_per_tick = array("d")
+        self.exhausted      = bytearray()
+        self.needs_regen: set[int] = set()
+
+    def touch(self, slot: int) -> None:
+        self.needs_regen.add(slot)
+
+    def _append(self, comp: Stamina) -> None:
+        self.needs_regen.add(len(self.curr_pts))
+        self.max_pts.append(comp.max_pts)
+        self.curr_pts.append(comp.curr_pts)
+        self.regen_per_tick.append(comp.regen_per_tick)
+        self.exhausted.append(int(comp.exhausted))
+
+    def _assign(self, slot: int, comp: Stamina) -> None:
+        self.needs_regen.add(slot)
+        self.max_pts[slot] = comp.max_pts
+        self.curr_pts[slot] = comp.curr_pts
+        self.regen_per_tick[slot] = comp.regen_per_tick
+        self.exhausted[slot] = int(comp.exhausted)
+
+
+class MoraleStore(_SlotStore):
+    """SoA ``Morale`` columns: int value, uint8 state code (see _STATE_BY_CODE)."""
+    __slots__ = ("value", "state")
+    _view_t = _MoraleView
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.value = array("l")
+        self.state = bytearray()
+
+    def _append(self, comp: Morale) -> None:
+        self.value.append(comp.value)
+        self.state.append(_CODE_OF_STATE[comp.state])
+
+    def _assign(self, slot: int, comp: Morale) -> None:
+        self.value[slot] = comp.value
+        self.state[slot] = _CODE_OF_STATE[comp.state]
+
+
 # ---------------------------------------------------------------------------#
 #                               2 - EVENTS                                   #
 # ---------------------------------------------------------------------------#
@@ -73,6 +241,21 @@ class ActivitySampleEvent:
     entity_id: EntityId
     action_id: str
     metres_moved: float = 0.0
+    action_code: int = -1        # action_registry.ACTION_CODE; -1 ⇒ look up action_id
+
+
+@dataclass(slots=True)
+class ActivitySampleBatch:
+    """
+    ActivitySampleEvent for a whole crowd at once: one *action_id* sampled
+    for every id in *entity_ids* (``metres_moved`` is parallel to it).
+    Posted by per-tick emitters such as locomotion instead of N events.
+    """
+    tick: Tick
+    action_id: str
+    entity_ids: Sequence[EntityId]   # may be shared between batches: read-only
+    metres_moved: array              # array('d'), one entry per entity id
+    action_code: int = -1
 
 
 @dataclass(slots=True)
@@ -94,34 +277,129 @@ class SurrenderEvent:
 
 # Constants
 TICK_LEN_S: float = 0.05                             # 20 Hz engine step
-_BLOOD_WINDOW_TICKS: int = int(10 / TICK_LEN_S)      # 10 s ⇒ 200 ticks
 _MAX_NEG_SHOCK: int = 15                             # used for look-ahead
 
 
+# ── numeric kernels ─────────────────────────────────────────────────────────
+# Loops over stamina/morale columns by slot; the systems below resolve
+# events to slots and post whatever the kernels report back.
+
+def _fatigue_kernel(
+    curr: array, exhausted: bytearray, idx: Sequence[int], drain: Sequence[float],
+) -> List[int]:
+    """Apply ``drain[k]`` to slot ``idx[k]``; return slots newly exhausted."""
+    newly: List[int] = []
+    for i, d in zip(idx, drain):
+        c = curr[i] - d
+        c = c if c > 0.0 else 0.0   # == max(0.0, c), without the builtin call
+        curr[i] = c
+        if c <= 0.0 and not exhausted[i]:
+            exhausted[i] = 1
+            newly.append(i)
+    return newly
+
+
+def _recovery_kernel(
+    curr: array, max_pts: array, regen: array, exhausted: bytearray,
+    m_state: bytearray, m_slot: array, seen: array, tick: int,
+    cand: set,
+) -> None:
+    """
+    Regenerate idle, non-exhausted slots in *cand* (quarter rate when
+    DESPERATE); slots that end up full are removed from *cand*.
+    """
+    full: List[int] = []
+    for i in cand:
+        # idle if no ActivitySample this tick; no regen while exhausted
+        if seen[i] == tick or exhausted[i]:
+            continue
+
+        r = regen[i]
+        if m_state[m_slot[i]] == _DESPERATE:
+            r *= 0.25
+
+        c = curr[i] + r
+        m = max_pts[i]
+        if not c < m:               # == min(m, c), without the builtin call
+            c = m
+            full.append(i)
+        curr[i] = c
+
+        # auto-clear exhausted once above 25% reserve
+        if exhausted[i] and curr[i] >= 0.25 * max_pts[i]:
+            exhausted[i] = 0
+    cand.difference_update(full)
+
+
+def _morale_kernel(
+    value: array, state: bytearray, exhausted: bytearray,
+    m_idx: Sequence[int], s_idx: Sequence[int], deltas: Sequence[float],
+) -> List[Tuple[int, bool]]:
+    """
+    Apply clamped morale deltas and re-band; return ``(k, exhausted)`` for
+    every entry *k* that lands in DESPERATE with a surrender condition.
+    """
+    bands = _BAND_LOWERS
+    out: List[Tuple[int, bool]] = []
+    for k, (j, i, d) in enumerate(zip(m_idx, s_idx, deltas)):
+        v = max(0, min(100, int(value[j] + d)))
+        value[j] = v
+        code = bisect_right(bands, v) - 1            # v ∈ [0, 100] ⇒ code ≥ 0
+        state[j] = code
+
+        # Check surrender conditions if DESPERATE
+        if code == _DESPERATE:
+            ex = bool(exhausted[i])
+            if v - _MAX_NEG_SHOCK < 10 or ex:
+                out.append((k, ex))
+    return out
+
+
 class FatigueSystem:
     """
-    Consumes ActivitySampleEvent and drains stamina.
+    Consumes ActivitySampleEvent / ActivitySampleBatch and drains stamina.
 
-    Drain per tick = ACTIONS[action_id].stamina / ACTIONS[action_id].ticks.
+    Drain per tick = ACTIONS[action_id].stamina / ACTIONS[action_id].ticks,
+    precomputed once per action: ``_drain_arr`` indexed by ``action_code``,
+    ``_drain_for`` keyed by id for events posted without a code.
     """
 
     def __init__(self, world):
         self.world = world
-        from action_registry import ACTIONS   # global catalogue
+        from action_registry import ACTIONS, ACTION_CODE   # global catalogue
         self.actions = ACTIONS
+        self._drain_for: Dict[str, float] = {
+            aid: spec.stamina / spec.ticks for aid, spec in ACTIONS.items()
+        }
+        self._drain_arr = array("d", (self._drain_for[aid] for aid in ACTION_CODE))
         self.post_event = world.post_event
+        # world-lifetime refs, bound once (stores are grown in place)
+        self._bound = (world.stamina, world.consume_events)
 
     def __call__(self) -> None:
-        for ev in self.world.consume_events(ActivitySampleEvent):
-            stamina: Stamina = self.world.stamina[ev.entity_id]
-
-            spec = self.actions[ev.action_id]
-            drain = spec.stamina / spec.ticks
-            stamina.curr_pts = max(0.0, stamina.curr_pts - drain)
-
-            if not stamina.exhausted and stamina.curr_pts <= 0.0:
-                stamina.exhausted = True
-                self.post_event(ExhaustionEvent(self.world.tick, ev.entity_id))
+        stam, consume = self._bound
+        evs = consume((ActivitySampleEvent, ActivitySampleBatch))
+        if not evs:
+            return
+        slot_of = stam.slot_of
+        drain_arr, drain_for = self._drain_arr, self._drain_for
+        idx: List[int] = []
+        drain: List[float] = []
+        for ev in evs:                                   # post order across both kinds
+            c = ev.action_code
+            d = drain_arr[c] if c >= 0 else drain_for[ev.action_id]
+            if ev.__class__ is ActivitySampleBatch:
+                ids = ev.entity_ids
+                idx.extend([slot_of[e] for e in ids])
+                drain.extend([d] * len(ids))
+            else:
+                idx.append(slot_of[ev.entity_id])
+                drain.append(d)
+
+        stam.needs_regen.update(idx)
+        post, tick, eids = self.post_event, self.world.tick, stam.eids
+        for i in _fatigue_kernel(stam.curr_pts, stam.exhausted, idx, drain):
+            post(ExhaustionEvent(tick, eids[i]))
 
 
 class RecoverySystem:
@@ -129,32 +407,36 @@ class RecoverySystem:
 
     def __init__(self, world):
         self.world = world
-        self._activity_seen: defaultdict[EntityId, Tick] = defaultdict(int)
+        self._activity_seen = array("q")   # stamina slot → last active tick
+        self._m_slot = array("l")          # stamina slot → morale slot
+        self._bound = (world.stamina, world.morale, world.peek_events)
 
     def __call__(self) -> None:
         tick = self.world.tick
-        # record activity for this tick
-        for ev in self.world.peek_events(ActivitySampleEvent):
-            self._activity_seen[ev.entity_id] = tick
-
-        for eid, stamina in self.world.stamina.items():
-            # idle if no ActivitySample this tick
-            if self._activity_seen.get(eid, -1) == tick:
-                continue
-
-            morale = self.world.morale[eid]
-            if stamina.exhausted:
-                continue  # no regen while exhausted
-
-            regen = stamina.regen_per_tick
-            if morale.state is MoraleState.DESPERATE:
-                regen *= 0.25
-
-            stamina.curr_pts = min(stamina.max_pts, stamina.curr_pts + regen)
+        stam, mor, peek = self._bound
+        eids = stam.eids
+        m_slot, seen = self._m_slot, self._activity_seen
+        n_old = len(m_slot)
+        if n_old != len(eids):                     # stores only ever grow
+            m_slot_of = mor.slot_of
+            m_slot.extend([m_slot_of[e] for e in eids[n_old:]])
+            seen.extend(array("q", [-1]) * (len(eids) - n_old))
 
-            # auto-clear exhausted once above 25% reserve
-            if stamina.exhausted and stamina.curr_pts >= 0.25 * stamina.max_pts:
-                stamina.exhausted = False
+        # record activity for this tick
+        slot_of = stam.slot_of
+        for ev in peek(ActivitySampleEvent):
+            i = slot_of.get(ev.entity_id)
+            if i is not None:
+                seen[i] = tick
+        for ev in peek(ActivitySampleBatch):
+            for e in ev.entity_ids:
+                i = slot_of.get(e)
+                if i is not None:
+                    seen[i] = tick
+
+        _recovery_kernel(stam.curr_pts, stam.max_pts, stam.regen_per_tick,
+                         stam.exhausted, mor.state, m_slot, seen, tick,
+                         stam.needs_regen)
 
 
 class MoraleSystem:
@@ -166,59 +448,70 @@ class MoraleSystem:
     def __init__(self, world):
         self.world = world
         self.post_event = world.post_event
-        self._blood_tick_counter: Dict[EntityId, int] = defaultdict(int)
+        # per-tick shock accumulator, cleared rather than reallocated
+        self._delta: defaultdict[EntityId, float] = defaultdict(float)
+        self._bound = (world.stamina, world.morale, world.vitals,
+                       world.peek_events, world.consume_events)
 
     @staticmethod
     def _state_from_value(val: int) -> MoraleState:
-        for state, lower in MORALE_BANDS.items():
-            if val >= lower:
-                return state
-        return MoraleState.DESPERATE  # fallback
+        return _STATE_BY_CODE[max(0, bisect_right(_BAND_LOWERS, val) - 1)]
 
     def __call__(self) -> None:
-        tick = self.world.tick
-        delta: Dict[EntityId, float] = defaultdict(float)
+        stam, mor, vitals_of, peek, consume = self._bound
+        delta = self._delta
+        delta.clear()
 
         # (a) Impact & Death events
-        for ev in self.world.peek_events("ImpactEvent"):
+        for ev in peek("ImpactEvent"):
             delta[ev.attacker_id] += 5
             delta[ev.defender_id] -= 10
 
-        for ev in self.world.peek_events("DeathEvent"):
+        for ev in peek("DeathEvent"):
             delta[ev.entity_id] -= 100
 
         # (b) Exhaustion events => immediate big negative shock
-        for ev in self.world.consume_events(ExhaustionEvent):
+        for ev in consume(ExhaustionEvent):
             delta[ev.entity_id] -= _MAX_NEG_SHOCK
 
-        # (c) Blood-loss steady erosion
-        for eid, vitals in self.world.vitals.items():
-            self._blood_tick_counter[eid] += 1
-            if self._blood_tick_counter[eid] >= _BLOOD_WINDOW_TICKS:
-                self._blood_tick_counter[eid] = 0
+        # (c) Blood-loss steady erosion (every tick)
+        for eid, vitals in vitals_of.items():
             pct_lost = 100.0 * (1 - vitals.blood_ml / vitals.max_blood_ml)
             delta[eid] += -0.0025 * pct_lost
 
-        # Apply morale changes
-        for eid, d_moral in delta.items():
-            morale = self.world.morale[eid]
-            stamina = self.world.stamina[eid]
-
-            morale.value = max(0, min(100, int(morale.value + d_moral)))
-            morale.state = self._state_from_value(morale.value)
+        if not delta:
+            return
 
-            # Check surrender conditions if DESPERATE
-            if morale.state is MoraleState.DESPERATE:
-                projected = morale.value - _MAX_NEG_SHOCK
-                if projected < 10 or stamina.exhausted:
-                    cause = "exhaustion" if stamina.exhausted else "low_morale"
-                    self.post_event(SurrenderEvent(tick, eid, cause))
+        # Apply morale changes
+        tick = self.world.tick
+        m_slot_of, s_slot_of = mor.slot_of, stam.slot_of
+        eids = list(delta)
+        hits = _morale_kernel(
+            mor.value, mor.state, stam.exhausted,
+            [m_slot_of[e] for e in eids], [s_slot_of[e] for e in eids],
+            list(delta.values()),
+        )
+        for k, ex in hits:
+            cause = "exhaustion" if ex else "low_morale"
+            self.post_event(SurrenderEvent(tick, eids[k], cause))
 
 
 # ---------------------------------------------------------------------------#
 #                    4 - FACTORY & REGISTRATION                              #
 # ---------------------------------------------------------------------------#
 
+def _system_runner(world, sys, dt_ns: int) -> Callable[[], None]:
+    """
+    Zero-arg callable running *sys* once: world-bound systems (``sys()``)
+    as-is, engine-convention ones (``sys(world, dt_ns)``) partially applied.
+    """
+    try:
+        n_params = len(inspect.signature(sys).parameters)
+    except (TypeError, ValueError):     # builtins / C callables: assume engine form
+        n_params = 2
+    return sys if n_params == 0 else partial(sys, world, dt_ns)
+
+
 def create_fatigue_morale_systems(world) -> None:
     """
     Add morale/stamina logic to 'world'. This:
@@ -230,36 +523,37 @@ def create_fatigue_morale_systems(world) -> None:
     """
     from attack import _ensure_event_api
     from attack import AttackSystem
+    from engine_tick import DEFAULT_DT_NS
 
     _ensure_event_api(world)
-    world._event_q = getattr(world, "_event_q", [])
 
     if AttackSystem not in {type(s) for s in world._systems}:
         world.add_system(AttackSystem())
 
     if not hasattr(world, "tick_once"):
+        # calling convention resolved once per system, not per tick; the
+        # cache is keyed on the systems themselves, so a swap that keeps
+        # the list length (e.g. _simulate_bout's watcher) still rebuilds it
+        runners: List[Callable[[], None]] = []
+        cached: List[tuple] = [()]
+        world._system_runners = runners
+
         def _tick_once() -> None:
-            for sys in world._systems:
-                try:
-                    sys()
-                except TypeError:
-                    sys(world, 20_000_000)
+            systems = tuple(world._systems)
+            if systems != cached[0]:
+                runners[:] = [_system_runner(world, s, DEFAULT_DT_NS) for s in systems]
+                cached[0] = systems
+            for run in runners:
+                run()
             world.tick += 1
-
-        if not hasattr(world, "peek_events"):
-            def _peek_events(cls=None):
-                return [e for e in world._event_q
-                        if cls is None
-                        or isinstance(e, cls)
-                        or getattr(e, "__name__", None) == cls]
-            world.peek_events = _peek_events
+            world.flush()       # per-tick event queues, as World.step does
 
         world.tick = 0
         world.tick_once = _tick_once  # type: ignore[attr-defined]
 
     # Build brand-new stamina/morale stores
-    world.stamina = {}
-    world.morale  = {}
+    world.stamina = StaminaStore()
+    world.morale  = MoraleStore()
 
     # Seed from existing fighters
     for eid in getattr(world, "combatants", []):
@@ -289,20 +583,27 @@ def _simulate_bout(world, max_ticks: int = 100_000) -> Tuple[str, Tick]:
     Run until SurrenderEvent or DeathEvent is seen, or until a tick budget.
     """
     wanted = _terminal_events_for(world)
-    for i in range(max_ticks):
-        world.tick_once()
-        for ev in world.consume_events(wanted):
-            return ev.__class__.__name__, ev.tick
-    if i == max_ticks - 1:  # timed out
-        print("\n[DEBUG] timed-out after", max_ticks, "ticks")
-        print(" last 20 ImpactEvents:",
-              [e.tick for e in world.peek_events("ImpactEvent")[-20:]])
-        for eid in getattr(world, "combatants", []):
-            m = world.morale[eid].value
-            s = world.stamina[eid].curr_pts
-            print(f"  E{eid}: morale {m:3d}  stamina {s:5.1f}")
-        print("  queue contents:",
-              [e.__class__.__name__ for e in world._event_q][:10])
+    caught: List[object] = []
+
+    def _watch() -> None:               # last system: runs before the flush
+        caught.extend(world.consume_events(wanted))
+
+    world.add_system(_watch)
+    try:
+        tick_once = world.tick_once
+        for _ in range(max_ticks):
+            tick_once()
+            if caught:
+                ev = caught[0]
+                return ev.__class__.__name__, ev.tick
+    finally:
+        world._systems.remove(_watch)
+
+    print("\n[DEBUG] timed-out after", max_ticks, "ticks")
+    for eid in getattr(world, "combatants", []):
+        m = world.morale[eid].value
+        s = world.stamina[eid].curr_pts
+        print(f"  E{eid}: morale {m:3d}  stamina {s:5.1f}")
     raise RuntimeError("No terminal event within tick budget")
 
 
@@ -326,7 +627,7 @@ def _build_world(rng_seed: int = 42, n_pairs: int = 1):
                 Position2D,
                 CollisionRadius,
             )
-            from attack import _build_maul, Weapon, Opponent
+            from attack import _build_maul, Opponent, give_weapon
 
             a, b = world.entities.next_id(), world.entities.next_id()
 
@@ -336,8 +637,8 @@ def _build_world(rng_seed: int = 42, n_pairs: int = 1):
             _require_store(world, CollisionRadius).add(b, CollisionRadius(0.3))
 
             weapon = _build_maul()
-            _require_store(world, Weapon).add(a, weapon)
-            _require_store(world, Weapon).add(b, weapon)
+            give_weapon(world, a, weapon)
+            give_weapon(world, b, weapon)
 
             _require_store(world, Opponent).add(a, Opponent(b))
             _require_store(world, Opponent).add(b, Opponent(a))
@@ -358,7 +659,7 @@ def _build_world(rng_seed: int = 42, n_pairs: int = 1):
 
     # ---------------------------------------------------------------------
     # FINAL FALLBACK: ensure each fighter has a Weapon & Opponent
-    from attack import _build_maul, Weapon, Opponent
+    from attack import _build_maul, Weapon, Opponent, give_weapon
     from movement_collision import _require_store
     wstore_weapon    = _require_store(w, Weapon)
     wstore_opponent = _require_store(w, Opponent)
@@ -373,9 +674,9 @@ def _build_world(rng_seed: int = 42, n_pairs: int = 1):
 
         # fallback for Weapon
         if wstore_weapon.get(eid1) is None:
-            wstore_weapon.add(eid1, _build_maul())
+            give_weapon(w, eid1, _build_maul())
         if wstore_weapon.get(eid2) is None:
-            wstore_weapon.add(eid2, _build_maul())
+            give_weapon(w, eid2, _build_maul())
 
         # fallback for Opponent
         if wstore_opponent.get(eid1) is None:
@@ -392,6 +693,32 @@ def test_surrender_or_death_deterministic():
     assert all(o == outcomes[0] for o in outcomes), outcomes
 
 
+def test_system_added_after_bout_runs():
+    """A system added after _simulate_bout runs; the removed watcher does not."""
+    w = _build_world(rng_seed=123)
+    _simulate_bout(w)
+    calls = []
+    w._systems.append(lambda: calls.append(w.tick))
+    for _ in range(5):
+        w.tick_once()
+    assert len(calls) == 5
+    assert _simulate_bout(w)[0] in ("SurrenderEvent", "DeathEvent")
+
+
+def test_impact_shifts_morale_once():
+    """One ImpactEvent is +5 / -10 morale on the tick it lands, never again."""
+    from attack import ImpactEvent
+    w = _build_world(rng_seed=123)
+    w._systems[:] = [s for s in w._systems if isinstance(s, MoraleSystem)]
+    a, d = w.combatants[:2]
+    w.morale[a].value = w.morale[d].value = 50
+    w.post_event(ImpactEvent(w.tick, a, d, (0.0, 0.0), 1.0, 5.0,
+                             "blunt", "torso"))
+    for _ in range(5):
+        w.tick_once()
+        assert (w.morale[a].value, w.morale[d].value) == (55, 40)
+
+
 def test_perf_100_entities(pytestconfig):
     """Stress test the morale/stamina logic with 100 fighters."""
     import pytest
@@ -406,6 +733,34 @@ def test_perf_100_entities(pytestconfig):
     assert mean_ns <= 4_000_000, f"{mean_ns/1e6:.2f} ms / tick"
 
 
+def test_run_shards_matches_sequential():
+    """Pool results are per-seed, in seed order, identical to in-process runs."""
+    seeds = (5, 6)
+    assert run_shards(seeds, n_pairs=1, ticks=200, workers=2) == [
+        run_shard(s, 1, 200) for s in seeds
+    ]
+
+
+def test_activity_batch_drains_like_single_events():
+    """One ActivitySampleBatch drains exactly what N single samples would."""
+    from action_registry import ACTION_CODE
+    code = ACTION_CODE["walk_step"]
+    drained = []
+    for batched in (False, True):
+        w = _build_world(rng_seed=3, n_pairs=2)
+        fatigue = next(s for s in w._systems if isinstance(s, FatigueSystem))
+        ids = list(w.combatants)
+        if batched:
+            w.post_event(ActivitySampleBatch(w.tick, "walk_step", ids,
+                                             array("d", [0.1] * len(ids)), code))
+        else:
+            for e in ids:
+                w.post_event(ActivitySampleEvent(w.tick, e, "walk_step", 0.1, code))
+        fatigue()
+        drained.append([w.stamina[e].curr_pts for e in ids])
+    assert drained[0] == drained[1] and drained[0][0] < 100.0
+
+
 # ---------------------------------------------------------------------------#
 #                  6 - LIGHTWEIGHT DEMO / CLI DRIVER                         #
 # ---------------------------------------------------------------------------#
@@ -433,6 +788,33 @@ def _demo():
               f"morale {w.morale[eid].value} ({w.morale[eid].state})")
 
 
+# ---------------------------------------------------------------------------#
+#                  7 - BATCH DRIVER (independent bouts)                      #
+# ---------------------------------------------------------------------------#
+# For batch modes only (matchmaking / tournament sweeps): every shard is its
+# own world with its own seed and shares nothing, so shards scale across
+# cores.  Real-time play keeps the single-world tick_once path.
+
+def run_shard(seed: int, n_pairs: int, ticks: int) -> Tuple[List[float], List[int]]:
+    """Run one world for *ticks*; return final (stamina, morale) per fighter."""
+    w = _build_world(rng_seed=seed, n_pairs=n_pairs)
+    for _ in range(ticks):
+        w.tick_once()
+    return ([w.stamina[e].curr_pts for e in w.combatants],
+            [w.morale[e].value for e in w.combatants])
+
+
+def run_shards(
+    seeds: Sequence[int], n_pairs: int, ticks: int, workers: int | None = None,
+) -> List[Tuple[List[float], List[int]]]:
+    """``run_shard`` for each seed across a process pool; results in seed order."""
+    from concurrent.futures import ProcessPoolExecutor
+    from itertools import repeat
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(run_shard, seeds, repeat(n_pairs), repeat(ticks)))
+
+
 if __name__ == "__main__":
     import argparse, sys
     parser = argparse.ArgumentParser()
@@ -16,6 +16,8 @@ Exports
 from __future__ import annotations
 
 import math
+import random
+from bisect import bisect_right
 from dataclasses import dataclass
 from typing import (
     Dict,
@@ -33,6 +35,9 @@ from typing import (
 # ---------------------------------------------------------------------------
 
 
+# Limb HP stays in slot attributes on purpose: DamageSystem reads and
+# writes a handful of HP fields per impact, and CPython array item get/set
+# (which boxes a new int each read) costs more than a slot attribute access.
 @dataclass(slots=True)
 class Limb:
     """Mutable hit-point container for a body region (skin→muscle→bone)."""
@@ -166,6 +171,7 @@ LAYERS: Tuple[Tuple[str, float], ...] = (
     ("organ", 1.0),
 )
 TOTAL_STACK_CM: float = sum(t for _, t in LAYERS)
+_T_SKIN, _T_MUSCLE, _T_BONE, _T_ORGAN = (t for _, t in LAYERS)
 
 #   energy→bruise conversion for blunt < threshold
 SOFT_ENERGY_PER_HP_SKIN = 10.0
@@ -186,6 +192,13 @@ _PEN_TABLE: Dict[str, Tuple[float, float, float, float]] = {
     "slash": (0.05, 0.25, 0.60, 0.90),
     "pierce": (0.10, 0.40, 0.80, 1.00),
 }
+# flat (edge × speed-bin) view of _PEN_TABLE: index = code * _N_BINS + bin
+_N_BINS = len(SPEED_BINS) + 1
+_EDGE_CODE: Dict[str, int] = {e: i for i, e in enumerate(_PEN_TABLE)}
+_PEN_FLAT: Tuple[float, ...] = tuple(p for row in _PEN_TABLE.values() for p in row)
+_SHEAR_BY_CODE: Tuple[float, ...] = tuple(SHEAR_COEFF[e] for e in _EDGE_CODE)
+# limb_idx follows REGIONS order (see build_default_anatomy)
+_BONE_BREAK_BY_IDX: Tuple[int, ...] = tuple(BONE_BREAK_THRESHOLD_J[r] for r in REGIONS)
 
 # ---------------------------------------------------------------------------
 # 3.  ImpactEvent protocol – runtime-checkable
@@ -234,155 +247,195 @@ def build_default_anatomy() -> Tuple[List[Limb], List[Optional[List[Organ]]]]:
 
 def penetration_fraction(edge: str, speed: float) -> float:
     """Return penetration fraction *p* ∈ [0,1] given edge and speed."""
-    bins = _PEN_TABLE[edge]
-    if speed < SPEED_BINS[0]:
-        return bins[0]
-    if speed < SPEED_BINS[1]:
-        return bins[1]
-    if speed < SPEED_BINS[2]:
-        return bins[2]
-    return bins[3]
+    return _PEN_FLAT[_EDGE_CODE[edge] * _N_BINS + bisect_right(SPEED_BINS, speed)]
 
 
 def bone_break_threshold(region: str) -> int:
     return BONE_BREAK_THRESHOLD_J[region]
 
 
+def _bleed_stores(world) -> Tuple[Dict[int, List[BleedSource]], Dict[int, float]]:
+    """Per-entity wound lists and their running ml s⁻¹ totals."""
+    d = world.__dict__
+    return d.setdefault("_bleed_sources", {}), d.setdefault("_bleed_rate_total", {})
+
+
+def _open_wounds(
+    bleed_dict: Dict[int, List[BleedSource]],
+    rate_total: Dict[int, float],
+    ent_id: int,
+    wounds: List[BleedSource],
+) -> None:
+    """Record *wounds* (in order) and fold their rates into the running total."""
+    sources = bleed_dict.setdefault(ent_id, [])
+    total = rate_total.get(ent_id, 0.0)
+    for src in wounds:
+        sources.append(src)
+        total += src.rate_ml_s
+    rate_total[ent_id] = total
+
+
 # ---------------------------------------------------------------------------
 # 6.  Systems
 # ---------------------------------------------------------------------------
 
 
+def _impact_kernel(
+    limb: Limb,
+    organ_row: Optional[List[Organ]],
+    lidx: int,
+    weapon_mass: float,
+    speed: float,
+    edge: str,
+    rng: random.Random,
+) -> Tuple[List[BleedSource], int]:
+    """
+    Resolve one impact on *limb* (and the organs under it, if any).
+
+    Mutates only the limb / organ HP and draws from *rng*; returns the
+    wounds opened and the number of organ failures, in the order they
+    occurred, for the caller to record and broadcast.  *lidx* is the limb's
+    index into ``REGIONS``; *weapon_mass*, *speed* and *edge* come from the
+    ImpactEvent.
+    """
+    wounds: List[BleedSource] = []
+    failures = 0
+
+    edge_code = _EDGE_CODE[edge]
+
+    # -------  energy split  ----------------------------
+    ke_total = 0.5 * weapon_mass * speed**2
+    shear_coeff = _SHEAR_BY_CODE[edge_code]
+    ke_crush = ke_total * (1.0 - shear_coeff)
+
+    # ---------------------------------------------------
+    #  Crush / blunt pipeline
+    # ---------------------------------------------------
+    threshold = _BONE_BREAK_BY_IDX[lidx]
+    if ke_crush < threshold:
+        # soft-tissue bruise
+        limb.curr_skin = max(
+            0,
+            limb.curr_skin
+            - max(1, int(ke_crush * 0.33 / SOFT_ENERGY_PER_HP_SKIN)),
+        )
+        limb.curr_muscle = max(
+            0,
+            limb.curr_muscle
+            - max(1, int(ke_crush * 0.67 / SOFT_ENERGY_PER_HP_MUSCLE)),
+        )
+    else:
+        excess = ke_crush - threshold
+        bone_dmg_hp = max(1, int(round(excess / BONE_HARDNESS_FACTOR)))
+        limb.curr_bone = max(0, limb.curr_bone - bone_dmg_hp)
+
+        if limb.bone_fractured() and organ_row:
+            # one draw for the whole row: each organ owns a 2-bit lane and is
+            # nicked when its lane is 0 (p = 0.25 exactly)
+            lanes = rng.getrandbits(2 * len(organ_row))
+            for organ in organ_row:
+                nicked = not lanes & 3
+                lanes >>= 2
+                if nicked:
+                    organ.curr_hp = max(0, organ.curr_hp - 1)
+                    rate = max(K2_INTERNAL, organ.base_cat_rate)
+                    wounds.append(BleedSource(lidx, rate, True))  # internal
+                    if organ.curr_hp <= 0:
+                        failures += 1
+
+    # ---------------------------------------------------
+    #  Shear / penetration pipeline
+    # ---------------------------------------------------
+    p = _PEN_FLAT[edge_code * _N_BINS + bisect_right(SPEED_BINS, speed)]
+    remaining = p * TOTAL_STACK_CM
+    if remaining <= 0:
+        return wounds, failures
+
+    # LAYERS walk unrolled: skin → muscle → bone → organ, on local HP
+    ceil = math.ceil
+    cs, cm, cb = limb.curr_skin, limb.curr_muscle, limb.curr_bone
+
+    pool = min(remaining, _T_SKIN)
+    proportion = pool / _T_SKIN
+    prev = cs
+    cs = max(0, cs - max(1, ceil(proportion * limb.max_skin)))
+    if prev > 0 and cs == 0:
+        # rate ~ depth ratio
+        wounds.append(BleedSource(lidx, K1_EXTERNAL * proportion, False))  # external
+    remaining -= pool
+
+    if remaining > 0:
+        pool = min(remaining, _T_MUSCLE)
+        proportion = pool / _T_MUSCLE
+        prev = cm
+        cm = max(0, cm - max(1, ceil(proportion * limb.max_muscle)))
+        if prev > 0 and cm == 0:
+            wounds.append(BleedSource(lidx, K1_EXTERNAL * proportion, False))  # external
+        remaining -= pool
+
+    if remaining > 0:
+        pool = min(remaining, _T_BONE)
+        cb = max(0, cb - max(1, ceil(pool / _T_BONE * limb.max_bone)))
+        remaining -= pool
+
+    limb.curr_skin, limb.curr_muscle, limb.curr_bone = cs, cm, cb
+
+    if remaining > 0 and organ_row:
+        organ = rng.choice(organ_row)
+        proportion = min(1.0, remaining / _T_ORGAN)
+        dmg_hp = max(1, int(proportion * organ.max_hp))
+        organ.curr_hp = max(0, organ.curr_hp - dmg_hp)
+        rate = max(
+            organ.base_cat_rate,
+            K2_INTERNAL * (dmg_hp / organ.max_hp),
+        )
+        wounds.append(BleedSource(lidx, rate, True))  # internal
+        if organ.curr_hp <= 0:
+            failures += 1
+
+    return wounds, failures
+
+
 def DamageSystem(world, dt_ns: int) -> None:  # noqa: N802 – engine convention
     """Consume ImpactEvents, mutate anatomy, spawn BleedSources & DeathEvents."""
     evq: List[ImpactEvent] = world.consume_events(ImpactEvent)  # type: ignore[arg-type]
-    bleed_dict: Dict[int, List[BleedSource]] = world.__dict__.setdefault(
-        "_bleed_sources", {}
-    )
+    bleed_dict, rate_total = _bleed_stores(world)
 
     rng = world.rng  # cache hot-path attribute
-    sources_for = bleed_dict.setdefault
+    limbs_of, organs_of = world.limbs, world.organs  # type: ignore[attr-defined]
 
+    # Arrival order is kept (it fixes the RNG draw order); anatomy lookups
+    # are shared across each run of consecutive hits on the same defender.
+    last = limbs = organs = None
     for hit in evq:
-        limbs: List[Limb] = world.limbs[hit.defender_id]  # type: ignore[attr-defined]
-        organs = world.organs[hit.defender_id]            # type: ignore[attr-defined]
-        limb = limbs[hit.limb_idx]
-
-        # -------  energy split  ----------------------------
-        ke_total = 0.5 * hit.weapon_mass * hit.relative_speed**2
-        shear_coeff = SHEAR_COEFF.get(hit.edge_type, 0.0)
-        ke_shear = ke_total * shear_coeff
-        ke_crush = ke_total * (1.0 - shear_coeff)
-
-        # ---------------------------------------------------
-        #  Crush / blunt pipeline
-        # ---------------------------------------------------
-        threshold = bone_break_threshold(limb.name)
-        if ke_crush < threshold:
-            # soft-tissue bruise
-            limb.curr_skin = max(
-                0,
-                limb.curr_skin
-                - max(1, int(ke_crush * 0.33 / SOFT_ENERGY_PER_HP_SKIN)),
-            )
-            limb.curr_muscle = max(
-                0,
-                limb.curr_muscle
-                - max(1, int(ke_crush * 0.67 / SOFT_ENERGY_PER_HP_MUSCLE)),
-            )
-        else:
-            excess = ke_crush - threshold
-            bone_dmg_hp = max(1, int(round(excess / BONE_HARDNESS_FACTOR)))
-            limb.curr_bone = max(0, limb.curr_bone - bone_dmg_hp)
-
-            if limb.bone_fractured() and organs and organs[hit.limb_idx]:
-                for organ in organs[hit.limb_idx] or []:  # type: ignore[index]
-                    if rng.random() < 0.25:
-                        organ.curr_hp = max(0, organ.curr_hp - 1)
-                        rate = max(K2_INTERNAL, organ.base_cat_rate)
-                        sources_for(hit.defender_id, []).append(
-                            BleedSource(hit.limb_idx, rate, internal=True)
-                        )
-                        if organ.curr_hp <= 0:
-                            world.post_event(
-                                DeathEvent(world.tick, hit.defender_id, "organ_failure")
-                            )
-
-        # ---------------------------------------------------
-        #  Shear / penetration pipeline
-        # ---------------------------------------------------
-        p = penetration_fraction(hit.edge_type, hit.relative_speed)
-        remaining = p * TOTAL_STACK_CM
-
-        for layer_name, thickness in LAYERS:
-            if remaining <= 0:
-                break
-
-            if layer_name == "organ" and organs and organs[hit.limb_idx]:
-                organ: Organ = rng.choice(organs[hit.limb_idx])  # type: ignore[index]
-                proportion = min(1.0, remaining / thickness)
-                dmg_hp = max(1, int(proportion * organ.max_hp))
-                organ.curr_hp = max(0, organ.curr_hp - dmg_hp)
-                rate = max(
-                    organ.base_cat_rate,
-                    K2_INTERNAL * (dmg_hp / organ.max_hp),
-                )
-                sources_for(hit.defender_id, []).append(
-                    BleedSource(hit.limb_idx, rate, internal=True)
-                )
-                if organ.curr_hp <= 0:
-                    world.post_event(
-                        DeathEvent(world.tick, hit.defender_id, "organ_failure")
-                    )
-                break
-
-            damage_pool = min(remaining, thickness)
-            proportion = damage_pool / thickness
-
-            if layer_name == "skin":
-                prev = limb.curr_skin
-                dmg_hp = max(1, math.ceil(proportion * limb.max_skin))
-                limb.curr_skin = max(0, limb.curr_skin - dmg_hp)
-                if prev > 0 and limb.curr_skin == 0:
-                    sources_for(hit.defender_id, []).append(
-                        BleedSource(
-                            hit.limb_idx,
-                            K1_EXTERNAL * proportion,  # rate ~ depth ratio
-                            internal=False,
-                        )
-                    )
-
-            elif layer_name == "muscle":
-                prev = limb.curr_muscle
-                dmg_hp = max(1, math.ceil(proportion * limb.max_muscle))
-                limb.curr_muscle = max(0, limb.curr_muscle - dmg_hp)
-                if prev > 0 and limb.curr_muscle == 0:
-                    sources_for(hit.defender_id, []).append(
-                        BleedSource(
-                            hit.limb_idx,
-                            K1_EXTERNAL * proportion,
-                            internal=False,
-                        )
-                    )
-
-            elif layer_name == "bone":
-                dmg_hp = max(1, math.ceil(proportion * limb.max_bone))
-                limb.curr_bone = max(0, limb.curr_bone - dmg_hp)
-
-            remaining -= damage_pool
+        did, lidx = hit.defender_id, hit.limb_idx
+        if did != last:
+            last, limbs, organs = did, limbs_of[did], organs_of[did]
+        wounds, failures = _impact_kernel(
+            limbs[lidx],
+            organs[lidx] if organs else None,
+            lidx,
+            hit.weapon_mass,
+            hit.relative_speed,
+            hit.edge_type,
+            rng,
+        )
+        if wounds:
+            _open_wounds(bleed_dict, rate_total, did, wounds)
+        for _ in range(failures):
+            world.post_event(DeathEvent(world.tick, did, "organ_failure"))
 
 
 def BleedSystem(world, dt_ns: int) -> None:  # noqa: N802
     """Drain blood based on BleedSources; issue exsanguination DeathEvent."""
     dt_s = dt_ns / 1_000_000_000.0
-    bleed_dict: Dict[int, List[BleedSource]] = world.__dict__.setdefault(
-        "_bleed_sources", {}
-    )
+    # running totals are maintained by DamageSystem as wounds open
+    rate_of = _bleed_stores(world)[1].get
 
-    for ent_id, vit in list(world.vitals.items()):  # type: ignore[attr-defined]
+    for ent_id, vit in world.vitals.items():  # type: ignore[attr-defined]
         if not vit.is_alive:
             continue
-        total_rate = sum(src.rate_ml_s for src in bleed_dict.get(ent_id, []))
+        total_rate = rate_of(ent_id, 0.0)
         vit.blood_loss_rate_ml_s = total_rate
         vit.blood_ml -= total_rate * dt_s
         if vit.blood_ml <= 0:
@@ -19,27 +19,33 @@ from __future__ import annotations
 
 import math
 import os
+from array import array
 import time
 from dataclasses import dataclass
 from typing import Dict, List, Tuple
 
-from ecs.components import ComponentStore  # type: ignore
+from ecs.components import ComponentStore, DenseStore  # type: ignore
 from ecs.system import System  # type: ignore
 from ecs.world import World  # type: ignore
 from engine_tick import DEFAULT_DT_NS, FixedStepScheduler  # type: ignore
 # ── fatigue / morale shim ──────────────────────────────────────────────────
-from fatigue_morale import ActivitySampleEvent as _ASE     # ← NEW (1 LOC)
+from fatigue_morale import ActivitySampleBatch as _ASB
+from action_registry import ACTION_CODE
+
+_WALK_STEP_CODE = ACTION_CODE["walk_step"]
 
 __all__ = [
     "Position2D",
     "Velocity2D",
     "CollisionRadius",
     "orbit_velocity",
+    "orbit_velocity_batch",
     "create_movement_collision_systems",
 ]
 
 ARENA_RADIUS = 20.0  # metres
 EPSILON_NUDGE = 1e-6  # deterministic tiny push for coincident centres
+_ROW = float(1 << 32)  # spatial-hash key stride between cell columns
 
 # ───────────────────────── Components ──────────────────────────────
 
@@ -60,6 +66,10 @@ class CollisionRadius:
     r: float  # metres
 
 
+# hot numeric components kept as SoA columns (see ecs.components.DenseStore)
+_DENSE_TYPES = frozenset({Position2D, Velocity2D, CollisionRadius})
+
+
 # ───────────────────── helper: store plumbing ─────────────────────
 
 def _require_store(world: World, comp_type):
@@ -74,53 +84,188 @@ def _require_store(world: World, comp_type):
     if stores is None:
         stores = {}
         setattr(world, "_arena_stores", stores)
-    return stores.setdefault(comp_type, ComponentStore())
+    store = stores.get(comp_type)
+    if store is None:
+        store = DenseStore(comp_type) if comp_type in _DENSE_TYPES else ComponentStore()
+        stores[comp_type] = store
+    return store
 
 
 # ───────────────────────── Spatial‑hash ───────────────────────────
 
 class _SpatialHash:
+    """
+    Uniform grid keyed by one packed scalar per cell, ``cx·_ROW + cy``.
+
+    Cell coords stay as the floats ``x // cell`` yields (no ``int()`` and no
+    tuple per insert), and neighbours are plain offsets: ``±1`` in y,
+    ``+_ROW`` in x.  Packing is exact while |cx|, |cy| < 2**20.
+
+    ``x // cell`` is kept over a cached ``1/cell`` multiply: float floor
+    division needs no ``int()`` or ``math.floor`` call and no tuple per key
+    (``int(x*inv)`` would also truncate negatives toward 0).
+    A Teschner ``(p1·ix ^ p2·iy) & (m-1)`` flat table would need those int
+    cell coords, and its slot collisions would make merged cells resolve a
+    pair twice.  Buckets stay ``list``: ``array('i')`` buckets re-box every
+    eid on each read/slice in the pair kernel.
+    """
     __slots__ = ("cell", "_grid")
 
     def __init__(self, cell_size: float) -> None:
         self.cell = cell_size
-        self._grid: Dict[Tuple[int, int], List[int]] = {}
+        self._grid: Dict[float, List[int]] = {}
 
-    def _key(self, x: float, y: float) -> Tuple[int, int]:
+    def _key(self, x: float, y: float) -> float:
         edge = self.cell
-        return int(x // edge), int(y // edge)
+        return (x // edge) * _ROW + y // edge
 
     def clear(self) -> None:
         self._grid.clear()
 
+    def resize(self, cell_size: float) -> None:
+        """Change the cell edge in place; the bucket dict is kept and emptied."""
+        self.cell = cell_size
+        self._grid.clear()
+
     def insert(self, eid: int, x: float, y: float) -> None:
         self._grid.setdefault(self._key(x, y), []).append(eid)
 
+    def fill(self, eids, xs, ys, has_r, awake=None) -> set | None:
+        """
+        Rebuild from scratch with every collidable eid (bulk ``insert``).
+        With *awake* (a bytearray indexed by eid, at least as long as
+        *has_r*) returns the keys of cells holding a flagged eid; without it
+        returns ``None`` (every cell counts as awake).
+        """
+        grid = self._grid
+        grid.clear()
+        put = grid.setdefault
+        edge = self.cell
+        n_r = len(has_r)
+        if awake is None:
+            for eid in eids:
+                if eid < n_r and has_r[eid]:
+                    put((xs[eid] // edge) * _ROW + ys[eid] // edge, []).append(eid)
+            return None
+        hot = set()
+        for eid in eids:
+            if eid < n_r and has_r[eid]:
+                key = (xs[eid] // edge) * _ROW + ys[eid] // edge
+                put(key, []).append(eid)
+                if awake[eid]:
+                    hot.add(key)
+        return hot
+
 
 # ───────────────────────── MovementSystem ─────────────────────────
 
 class MovementSystem:
     """Euler‑integrates **Velocity2D** every fixed step."""
 
-    __slots__ = ("_pos", "_vel", "_dt")
+    __slots__ = ("_pos", "_vel", "_dt", "_movers", "_versions", "_rad", "_arena_r",
+                 "_safe2", "_rad_ver")
     priority = 10
 
-    def __init__(self, pos: ComponentStore[Position2D], vel: ComponentStore[Velocity2D]):
+    def __init__(
+        self,
+        pos: DenseStore[Position2D],
+        vel: DenseStore[Velocity2D],
+        rad: DenseStore[CollisionRadius] | None = None,
+        arena_radius: float | None = None,
+    ):
         self._pos = pos
         self._vel = vel
         self._dt = DEFAULT_DT_NS * 1e-9
+        # fused rim clamp (see create_movement_collision_systems(fused_rim=True))
+        self._rad = rad if arena_radius is not None else None
+        self._arena_r = arena_radius
+        self._safe2 = -1.0                          # (arena − max_r)², rim-safe zone
+        self._rad_ver = -1
+        self._movers: Tuple[int, ...] = ()          # eids with position + velocity
+        self._versions = (-1, -1)                   # store versions _movers was built at
 
     def __call__(self, world: World, dt_ns: int) -> None:  # noqa: D401
-        dt = self._dt
-        for eid, p in self._pos.items():
-            v = self._vel.get(eid)
-            if v:
-                p.x += v.vx * dt
-                p.y += v.vy * dt
-                
-                # stamina drain sample – locomotion stride                  # ← NEW (2 LOC)
-                moved = math.hypot(v.vx * dt, v.vy * dt)
-                world.post_event(_ASE(world.tick, eid, "walk_step", moved))
+        pos, vel = self._pos, self._vel
+        versions = (pos.version, vel.version)
+        if versions != self._versions:
+            self._versions = versions
+            has_v = vel.mask()
+            n_v = len(has_v)
+            self._movers = tuple(eid for eid in pos.eids() if eid < n_v and has_v[eid])
+        movers = self._movers
+        if not movers:
+            return
+
+        xs, ys = pos.arrays()
+        vxs, vys = vel.arrays()
+        rad = self._rad
+        if rad is None:
+            moved = _euler_kernel(movers, xs, ys, vxs, vys, self._dt)
+        else:
+            (rs,) = rad.arrays()
+            if rad.version != self._rad_ver:
+                self._rad_ver = rad.version
+                safe = self._arena_r - max(rs, default=0.0)
+                self._safe2 = safe * safe if safe > 0.0 else -1.0
+            moved = _euler_rim_kernel(movers, xs, ys, vxs, vys, self._dt,
+                                      rs, rad.mask(), self._arena_r, self._safe2)
+
+        # stamina drain samples – one locomotion batch per tick, not N events;
+        # the mover tuple is immutable, so every batch shares it until the
+        # roster changes and only the stride column is fresh per tick
+        world.post_event(_ASB(world.tick, "walk_step", movers, moved, _WALK_STEP_CODE))
+
+
+def _euler_kernel(movers, xs, ys, vxs, vys, dt: float, *, _hypot=math.hypot) -> array:
+    """
+    Integrator kernel: ``x += vx·dt`` for every eid in *movers* (in place);
+    returns the stride lengths as ``array('d')`` parallel to *movers*.
+
+    *xs*/*ys* and *vxs*/*vys* are eid-indexed position and velocity
+    columns; *dt* is the step in seconds.
+    """
+    moved = array("d")
+    put = moved.append
+    for eid in movers:
+        dx = vxs[eid] * dt
+        dy = vys[eid] * dt
+        xs[eid] += dx
+        ys[eid] += dy
+        put(_hypot(dx, dy))
+    return moved
+
+
+def _euler_rim_kernel(movers, xs, ys, vxs, vys, dt: float, rs, has_r,
+                      r_arena: float, safe2: float, *, _hypot=math.hypot) -> array:
+    """
+    :func:`_euler_kernel` with the arena rim clamp folded into the same pass,
+    so each position is read and written once.  Same clamp maths (and the
+    same *safe2* interior early-out) as the :class:`CollisionSystem` rim
+    step; stride lengths are pre-clamp.
+    """
+    moved = array("d")
+    put = moved.append
+    n_r = len(has_r)
+    for eid in movers:
+        dx = vxs[eid] * dt
+        dy = vys[eid] * dt
+        x = xs[eid] + dx
+        y = ys[eid] + dy
+        put(_hypot(dx, dy))
+        d2 = x * x + y * y
+        if d2 > safe2 and eid < n_r and has_r[eid]:
+            r_eff = r_arena - rs[eid]
+            if d2 > r_eff * r_eff:
+                dist = math.sqrt(d2)
+                if dist == 0.0:
+                    x, y = r_eff, 0.0
+                else:
+                    scale = r_eff / dist
+                    x *= scale
+                    y *= scale
+        xs[eid] = x
+        ys[eid] = y
+    return moved
 
 
 # ───────────────────────── CollisionSystem ────────────────────────
@@ -128,15 +273,18 @@ class MovementSystem:
 class CollisionSystem:
     """Spatial‑hash broad phase → circle‑circle resolve → rim clamp."""
 
-    __slots__ = ("_pos", "_vel", "_rad", "_arena_r", "_edge2", "_grid")
+    __slots__ = ("_pos", "_vel", "_rad", "_arena_r", "_edge2", "_grid",
+                 "_max_r", "_rad_ver", "_rim_clamp", "_pushed", "_wake_ver")
     priority = 20
+    GRID_THRESHOLD = 16   # collidable count below which all-pairs beats the hash
 
     def __init__(
         self,
-        pos: ComponentStore[Position2D],
-        vel: ComponentStore[Velocity2D],
-        rad: ComponentStore[CollisionRadius],
+        pos: DenseStore[Position2D],
+        vel: DenseStore[Velocity2D],
+        rad: DenseStore[CollisionRadius],
         arena_radius: float = ARENA_RADIUS,
+        rim_clamp: bool = True,
     ) -> None:
         self._pos = pos
         self._vel = vel
@@ -144,106 +292,174 @@ class CollisionSystem:
         self._arena_r = arena_radius
         self._edge2 = arena_radius * arena_radius
         self._grid = _SpatialHash(1.0)
+        self._rim_clamp = rim_clamp
+        self._pushed = bytearray()  # eid → pushed by the last overlap pass
+        self._wake_ver = (-1, -1)   # (pos, rad) versions last seen; change ⇒ wake all
+        self._max_r = 0.0
+        self._rad_ver = -1          # radius-store version _max_r was taken at
+
+    def _awake(self, n: int) -> bytearray | None:
+        """
+        Sleeping bodies: eid → 1 if it has a non-zero velocity or was pushed
+        last tick; ``None`` when every body is awake.  Any add/remove/view
+        write on the position or radius store wakes everyone for a tick (a
+        teleport may have created overlaps).
+        """
+        versions = (self._pos.version, self._rad.version)
+        if versions != self._wake_ver:
+            self._wake_ver = versions
+            return None
+        awake = self._pushed
+        if len(awake) < n:
+            awake.extend(bytes(n - len(awake)))
+        elif awake.find(0, 0, n) < 0:
+            return None
+        vxs, vys = self._vel.arrays()
+        for eid in self._vel.eids():
+            if eid < n and (vxs[eid] or vys[eid]):
+                awake[eid] = 1
+        return awake
 
     def __call__(self, world: World, dt_ns: int) -> None:  # noqa: D401
+        xs, ys = self._pos.arrays()
+        (rs,) = self._rad.arrays()
+        has_r = self._rad.mask()
+        eids = self._pos.eids()
+
         # 1 ⟶ cell size
-        max_r = max((c.r for c in self._rad._data.values()), default=0.0)  # type: ignore[attr-defined]
+        #     (max radius rescanned only when the radius store changed)
+        if self._rad.version != self._rad_ver:
+            self._rad_ver = self._rad.version
+            self._max_r = max(rs, default=0.0)
+        max_r = self._max_r
         cell = max(0.01, 2.0 * max_r)
         if abs(cell - self._grid.cell) > 1e-6:
-            self._grid = _SpatialHash(cell)
-
-        # 2 ⟶ populate
-        grid = self._grid
-        grid.clear()
-        for eid, p in self._pos.items():
-            grid.insert(eid, p.x, p.y)
-
-        # 3 ⟶ overlaps
-        pos_get, rad_get = self._pos.get, self._rad.get
-        for (ix, iy), bucket in grid._grid.items():
-            _resolve_pairs(bucket, bucket, pos_get, rad_get)
-            nb = grid._grid.get((ix + 1, iy))
-            if nb:
-                _resolve_pairs(bucket, nb, pos_get, rad_get)
-            for jy in (iy + 1, iy - 1):
-                nb = grid._grid.get((ix, jy))
-                if nb:
-                    _resolve_pairs(bucket, nb, pos_get, rad_get)
-                nb_d = grid._grid.get((ix + 1, jy))
-                if nb_d:
-                    _resolve_pairs(bucket, nb_d, pos_get, rad_get)
-
+            self._grid.resize(cell)
+
+        # small crowds: all pairs, no grid (building it costs more)
+        if len(self._rad) < self.GRID_THRESHOLD:
+            n_r = len(has_r)
+            live = [eid for eid in eids if eid < n_r and has_r[eid]]
+            _resolve_pairs(live, live, xs, ys, rs)
+        else:
+            # 2 ⟶ populate
+            #     (radius-less entities never collide, so they stay out of the grid)
+            hot = self._grid.fill(eids, xs, ys, has_r, self._awake(len(has_r)))
+
+            # 3 ⟶ overlaps – only cell pairs with an awake member; bodies
+            #     pushed this tick stay awake for the next one
+            cells = self._grid._grid
+            cell_at = cells.get
+            resolve = _resolve_pairs
+            row = _ROW
+            if hot is None or len(hot) == len(cells):
+                # nobody asleep: plain sweep without per-body bookkeeping; if
+                # anything was pushed, everyone stays awake next tick
+                pushes = 0
+                for key, bucket in cells.items():
+                    if len(bucket) > 1:
+                        pushes += resolve(bucket, bucket, xs, ys, rs)
+                    nb = cell_at(key + row)                 # (ix + 1, iy)
+                    if nb:
+                        pushes += resolve(bucket, nb, xs, ys, rs)
+                    for dy in (1.0, -1.0):                  # iy + 1, iy - 1
+                        nb = cell_at(key + dy)              # (ix, jy)
+                        if nb:
+                            pushes += resolve(bucket, nb, xs, ys, rs)
+                        nb = cell_at(key + row + dy)        # (ix + 1, jy)
+                        if nb:
+                            pushes += resolve(bucket, nb, xs, ys, rs)
+                self._pushed = bytearray(b"\x01" if pushes else b"\x00") * len(has_r)
+            else:
+                pushed = bytearray(len(has_r))
+                for key, bucket in cells.items():
+                    a_hot = key in hot
+                    if a_hot and len(bucket) > 1 and resolve(bucket, bucket, xs, ys, rs):
+                        for e in bucket:
+                            pushed[e] = 1
+                    for k in (key + row, key + 1.0, key + row + 1.0, key - 1.0, key + row - 1.0):
+                        nb = cell_at(k)
+                        if nb and (a_hot or k in hot) and resolve(bucket, nb, xs, ys, rs):
+                            for e in bucket:
+                                pushed[e] = 1
+                            for e in nb:
+                                pushed[e] = 1
+                self._pushed = pushed
+
+        if not self._rim_clamp:                   # done by MovementSystem (fused)
+            return
         # 4 ⟶ rim clamp
+        #     Nobody inside (arena − max_r) can touch the rim, so the bulk of
+        #     the crowd is rejected on one compare before any radius lookup.
         r_arena = self._arena_r
-        for eid, p in self._pos.items():
-            rc = rad_get(eid)
-            if rc is None:
+        safe = r_arena - max_r
+        safe2 = safe * safe if safe > 0.0 else -1.0
+        n_r = len(has_r)
+        for eid in eids:
+            x = xs[eid]
+            y = ys[eid]
+            d2 = x * x + y * y
+            if d2 <= safe2 or eid >= n_r or not has_r[eid]:
                 continue
-            r_eff = r_arena - rc.r
-            d2 = p.x * p.x + p.y * p.y
+            r_eff = r_arena - rs[eid]
             if d2 > r_eff * r_eff:
                 dist = math.sqrt(d2)
                 if dist == 0.0:
-                    p.x = r_eff
-                    p.y = 0.0
+                    xs[eid] = r_eff
+                    ys[eid] = 0.0
                 else:
                     scale = r_eff / dist
-                    p.x *= scale
-                    p.y *= scale
+                    xs[eid] = x * scale
+                    ys[eid] = y * scale
 
 
 # helper narrow‑phase ------------------------------------------------------
 
-def _resolve_pairs(bucket_a, bucket_b, pos_get, rad_get) -> None:  # type: ignore[override]
+def _resolve_pairs(bucket_a, bucket_b, xs, ys, rs, *, _sqrt=math.sqrt) -> int:
+    """
+    Narrow-phase kernel: push apart overlapping pairs of *bucket_a* × *bucket_b*.
+
+    *xs*/*ys* (written) and *rs* are eid-indexed position and radius
+    columns; callers pass collidable eids only.  The
+    a-side position is carried in locals across its inner loop and written
+    back once; the per-pair arithmetic is unchanged.  ``_sqrt`` is bound at
+    definition time (a fast local; this runs ~1.6k times a tick at n=500).
+    Returns how many pairs it pushed (0 ⇒ the two buckets are at rest).
+    """
+    same = bucket_a is bucket_b
+    pushes = 0
     for i, ea in enumerate(bucket_a):
-        pa = pos_get(ea)
-        ra_c = rad_get(ea)
-        if not pa or not ra_c:
-            continue
-        ra = ra_c.r
-        for eb in bucket_b[i + 1 :] if bucket_a is bucket_b else bucket_b:  # noqa: E203
-            pb = pos_get(eb)
-            rb_c = rad_get(eb)
-            if not pb or not rb_c:
-                continue
-            rb = rb_c.r
-            dx = pa.x - pb.x
-            dy = pa.y - pb.y
+        ra = rs[ea]
+        xa = xs[ea]
+        ya = ys[ea]
+        for eb in bucket_b[i + 1 :] if same else bucket_b:  # noqa: E203
+            # One squared-distance test per pair.  A per-axis |dx| early-out
+            # only adds a branch when most pairs overlap, and masking tricks
+            # buy nothing without SIMD.
+            dx = xa - xs[eb]
+            dy = ya - ys[eb]
             dist2 = dx * dx + dy * dy
-            sum_r = ra + rb
+            sum_r = ra + rs[eb]
             if dist2 >= sum_r * sum_r:
                 continue
+            pushes += 1
             if dist2 == 0.0:
-                pa.x += EPSILON_NUDGE
-                pb.x -= EPSILON_NUDGE
+                xa += EPSILON_NUDGE
+                xs[eb] -= EPSILON_NUDGE
                 continue
-            dist = math.sqrt(dist2)
+            # sqrt + one divide: the rsqrt form (inv = 1/sqrt; 0.5*(sum_r*inv - 1))
+            # is the same op count in bytecode, so there is nothing to gain
+            dist = _sqrt(dist2)
             push = 0.5 * (sum_r - dist) / dist
             nx = dx * push
             ny = dy * push
-            pa.x += nx
-            pa.y += ny
-            pb.x -= nx
-            pb.y -= ny
-
-
-# ───────────────────── Steering helper(s) ---------------------------------
-
-def orbit_velocity(
-    pos: Position2D,
-    centre: Tuple[float, float],
-    radius: float,
-    angular_speed: float,
-    gain: float = 2.0,
-) -> Tuple[float, float]:
-    cx, cy = centre
-    dx = pos.x - cx
-    dy = pos.y - cy
-    dist = math.hypot(dx, dy) or 1e-9
-    corr = (radius - dist) * gain
-    tx, ty = -dy / dist, dx / dist
-    v_tan = angular_speed * radius
-    return tx * v_tan + dx / dist * corr, ty * v_tan + dy / dist * corr
+            xa += nx
+            ya += ny
+            xs[eb] -= nx
+            ys[eb] -= ny
+        xs[ea] = xa
+        ys[ea] = ya
+    return pushes
 
 
 # ───────────────────────── Steering helper(s) ──────────────────────────
@@ -283,15 +499,58 @@ def orbit_velocity(
     return vx, vy
 
 
+def orbit_velocity_batch(
+    eids,
+    xs,
+    ys,
+    vxs,
+    vys,
+    centre: Tuple[float, float],
+    radius: float,
+    angular_speed: float,
+    *,
+    gain: float = 2.0,
+) -> None:
+    """Column form of :func:`orbit_velocity`: steer every eid in *eids*.
+
+    *xs*/*ys* are the Position2D columns and *vxs*/*vys* the Velocity2D
+    columns (``DenseStore.arrays()``), all indexed by eid; velocities are
+    written in place.  Same arithmetic as the scalar helper, without a
+    call and two view objects per entity.
+    """
+    cx, cy = centre
+    hypot = math.hypot
+    v_tan = angular_speed * radius
+    for eid in eids:
+        dx = xs[eid] - cx
+        dy = ys[eid] - cy
+        dist = hypot(dx, dy) or 1e-9
+        corr = (radius - dist) * gain
+        vxs[eid] = -dy / dist * v_tan + dx / dist * corr
+        vys[eid] = dx / dist * v_tan + dy / dist * corr
+
+
 # ───────────── Factory: attach stores + build systems ───────────────────
 def create_movement_collision_systems(
     world: World,
     arena_radius: float = ARENA_RADIUS,
+    *,
+    fused_rim: bool = False,
 ) -> Tuple[System, System]:
-    """Return `(movement_sys, collision_sys)` wired to *world*."""
+    """Return `(movement_sys, collision_sys)` wired to *world*.
+
+    With *fused_rim* the rim clamp runs inside the movement pass instead of
+    after collision: one sweep over positions fewer, but a fighter pushed
+    past the rim by a collision stays there until it next moves.
+    """
     pos_s = _require_store(world, Position2D)
     vel_s = _require_store(world, Velocity2D)
     rad_s = _require_store(world, CollisionRadius)
+    if fused_rim:
+        return (
+            MovementSystem(pos_s, vel_s, rad_s, arena_radius),
+            CollisionSystem(pos_s, vel_s, rad_s, arena_radius, rim_clamp=False),
+        )
     return (
         MovementSystem(pos_s, vel_s),
         CollisionSystem(pos_s, vel_s, rad_s, arena_radius),
@@ -332,16 +591,18 @@ if __name__ == "__main__":
     pos_s = _require_store(world, Position2D)
     vel_s = _require_store(world, Velocity2D)
 
+    xs, ys = pos_s.arrays()
+    vxs, vys = vel_s.arrays()
+
     TICKS  = 500                       # 10 s at 50 Hz
     start  = time.perf_counter_ns()
 
     for _ in range(TICKS):
         # steering update
-        for eid, pos in pos_s.items():
-            vel = vel_s.get(eid)
-            vel.vx, vel.vy = orbit_velocity(
-                pos, (0.0, 0.0), radius=2.0, angular_speed=math.tau / 5.0
-            )
+        orbit_velocity_batch(
+            pos_s.eids(), xs, ys, vxs, vys,
+            (0.0, 0.0), radius=2.0, angular_speed=math.tau / 5.0,
+        )
         sched.run(1, world)
 
     elapsed = time.perf_counter_ns() - start
@@ -368,16 +629,127 @@ def test_orbit_no_overlap(ticks: int) -> None:
     pos_s = _require_store(world, Position2D)
     vel_s = _require_store(world, Velocity2D)
 
+    xs, ys = pos_s.arrays()
+    vxs, vys = vel_s.arrays()
+
     for _ in range(ticks):
-        for eid, pos in pos_s.items():
-            vel = vel_s.get(eid)
-            vel.vx, vel.vy = orbit_velocity(
-                pos, (0.0, 0.0), 2.0, math.tau / 5.0
-            )
+        orbit_velocity_batch(
+            pos_s.eids(), xs, ys, vxs, vys, (0.0, 0.0), 2.0, math.tau / 5.0
+        )
         sched.run(1, world)
         assert _min_distance(world) >= 1.0  # 2 × 0.5 m radii
 
 
+def test_max_radius_follows_store_changes() -> None:
+    """The cached max radius (cell size) is refreshed on add and view edits."""
+    import random
+
+    world = World(rng=random.Random(1))
+    _, col_sys = create_movement_collision_systems(world)
+    pos_s = _require_store(world, Position2D)
+    rad_s = _require_store(world, CollisionRadius)
+    for eid in range(3):
+        pos_s.add(eid, Position2D(eid * 3.0, 0.0))
+        rad_s.add(eid, CollisionRadius(0.5))
+
+    col_sys(world, DEFAULT_DT_NS)
+    assert col_sys._max_r == 0.5
+    rad_s.get(1).r = 1.25
+    col_sys(world, DEFAULT_DT_NS)
+    assert col_sys._max_r == 1.25
+    rad_s.add(3, CollisionRadius(2.0))
+    col_sys(world, DEFAULT_DT_NS)
+    assert col_sys._max_r == 2.0
+
+
+def test_dense_store_rejects_negative_ids() -> None:
+    """Negative eids never alias the last entity; items() survives remove()."""
+    import pytest
+
+    pos_s = DenseStore(Position2D)
+    for eid in range(3):
+        pos_s.add(eid, Position2D(float(eid), 0.0))
+    with pytest.raises(ValueError):
+        pos_s.add(-1, Position2D(9.0, 9.0))
+    assert pos_s.get(-1) is None
+    assert pos_s.get(2).x == 2.0
+    for eid, _ in pos_s.items():
+        pos_s.remove(eid)
+    assert len(pos_s) == 0
+
+
+def test_fused_rim_clamps_like_collision_pass() -> None:
+    """Without collisions, the fused movement clamp lands where the
+    collision-pass clamp does."""
+    import random
+
+    final = []
+    for fused in (False, True):
+        world = World(rng=random.Random(3))
+        systems = create_movement_collision_systems(world, fused_rim=fused)
+        sched = FixedStepScheduler(list(systems), dt_ns=DEFAULT_DT_NS)
+        pos_s = _require_store(world, Position2D)
+        vel_s = _require_store(world, Velocity2D)
+        rad_s = _require_store(world, CollisionRadius)
+        for eid in range(4):                     # spread out, all heading for the rim
+            theta = eid * math.pi / 2
+            pos_s.add(eid, Position2D(5 * math.cos(theta), 5 * math.sin(theta)))
+            vel_s.add(eid, Velocity2D(9 * math.cos(theta), 9 * math.sin(theta)))
+            rad_s.add(eid, CollisionRadius(0.5))
+        sched.run(200, world)
+        final.append([(p.x, p.y) for _, p in pos_s.items()])
+    assert final[0] == final[1]
+    assert all(math.hypot(x, y) <= ARENA_RADIUS - 0.5 + 1e-9 for x, y in final[1])
+
+
+def test_sleeping_bodies_still_get_hit() -> None:
+    """Resting bodies are skipped, but a mover still shoves the one it meets."""
+    import random
+
+    world = World(rng=random.Random(2))
+    move_sys, col_sys = create_movement_collision_systems(world)
+    sched = FixedStepScheduler([move_sys, col_sys], dt_ns=DEFAULT_DT_NS)
+    pos_s = _require_store(world, Position2D)
+    vel_s = _require_store(world, Velocity2D)
+    rad_s = _require_store(world, CollisionRadius)
+    n = CollisionSystem.GRID_THRESHOLD + 4       # grid path
+    for eid in range(n):                         # a resting row, 2 m apart
+        pos_s.add(eid, Position2D(-15.0 + 2.0 * eid, 5.0))
+        vel_s.add(eid, Velocity2D(0.0, 0.0))
+        rad_s.add(eid, CollisionRadius(0.4))
+    pos_s.add(n, Position2D(1.0, 0.0))           # mover walking up into eid 8
+    vel_s.add(n, Velocity2D(0.0, 2.0))
+    rad_s.add(n, CollisionRadius(0.4))
+
+    sched.run(200, world)
+    assert col_sys._awake(len(rad_s.mask())) is not None     # the row went to sleep
+    hit = pos_s.get(8)
+    assert (hit.x, hit.y) != (1.0, 5.0)
+    assert pos_s.get(0).x == -15.0 and pos_s.get(0).y == 5.0
+
+
+def test_orbit_velocity_batch_matches_scalar() -> None:
+    """Column steering writes exactly what per-entity orbit_velocity returns."""
+    import random
+
+    world = World(rng=random.Random(5))
+    pos_s = _require_store(world, Position2D)
+    vel_s = _require_store(world, Velocity2D)
+    rng = random.Random(5)
+    for eid in range(20):
+        pos_s.add(eid, Position2D(rng.uniform(-5, 5), rng.uniform(-5, 5)))
+        vel_s.add(eid, Velocity2D(0.0, 0.0))
+    pos_s.add(20, Position2D(1.0, -2.0))          # on the centre → 1e-9 guard
+    vel_s.add(20, Velocity2D(0.0, 0.0))
+
+    xs, ys = pos_s.arrays()
+    vxs, vys = vel_s.arrays()
+    orbit_velocity_batch(pos_s.eids(), xs, ys, vxs, vys, (1.0, -2.0), 3.0, 0.7, gain=1.5)
+    for eid, pos in pos_s.items():
+        vel = vel_s.get(eid)
+        assert (vel.vx, vel.vy) == orbit_velocity(pos, (1.0, -2.0), 3.0, 0.7, gain=1.5)
+
+
 @pytest.mark.skipif(
     os.getenv("ARENA_FAST_MACHINE") != "1",
     reason="Performance test skipped on slow CI",
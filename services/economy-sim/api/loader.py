@@ -1,11 +1,21 @@
 """
 Loads arena-data tables exactly once, validates them against JSON-Schema
 (if present), and provides typed helpers.
+
+Parsed tables are also kept as a pickle next to each yaml
+(``<name>.cache.pickle``, shared with ``resource_loader`` via
+``table_cache``).  The entry records the schema stamp it was validated
+against, so later processes skip both PyYAML and validation.
+``build_table_cache()`` writes them ahead of time; ``load_table`` falls
+back to the yaml whenever a cache is missing, stale, or the data dir is
+not a plain directory.
 """
 from importlib import resources
 from pathlib import Path
 import yaml, jsonschema, json
 
+from table_cache import read_cached, write_cached, yaml_stamp
+
 _TABLE_DIR = resources.files("arena_data") / "tables"
 _SCHEMA_DIR = resources.files("arena_data") / "schema"
 
@@ -19,11 +29,44 @@ def _validate(name: str, data: dict):
                  else json.loads(schema_path.read_text())
         jsonschema.validate(data, schema)
 
+def _schema_stamp(name: str) -> tuple | None:
+    """(mtime_ns, size) of the table's schema; None if it has none."""
+    schema_path = _SCHEMA_DIR / f"{name}.schema.json"
+    if not schema_path.exists():
+        return None
+    sc = schema_path.stat()
+    return (sc.st_mtime_ns, sc.st_size)
+
 def load_table(name: str) -> dict:
     if name in _cache:
         return _cache[name]
     file_path = _TABLE_DIR / f"{name}.yaml"
-    data = yaml.safe_load(file_path.read_text(encoding="utf-8"))
-    _validate(name, data)
+    on_disk = isinstance(file_path, Path)   # not a zip: cacheable
+    stamp = yaml_stamp(file_path) if on_disk else None
+    cached = read_cached(file_path, stamp) if on_disk else None
+    if cached is None:
+        data = yaml.safe_load(file_path.read_text(encoding="utf-8"))
+        validated = None
+    else:
+        data, validated = cached
+    schema = _schema_stamp(name)
+    if cached is None or validated != ("schema", schema):
+        _validate(name, data)
+        if on_disk:
+            write_cached(file_path, stamp, data, ("schema", schema))
     _cache[name] = data
     return data
+
+def build_table_cache() -> list[str]:
+    """Parse + validate every table now and write its pickle cache."""
+    built = []
+    for file_path in sorted(_TABLE_DIR.iterdir(), key=lambda p: p.name):
+        if file_path.name.endswith(".yaml"):
+            name = file_path.name[:-len(".yaml")]
+            _cache.pop(name, None)
+            load_table(name)
+            built.append(name)
+    return built
+
+if __name__ == "__main__":
+    print("cached:", ", ".join(build_table_cache()))
@@ -1,5 +1,7 @@
 # economy_sim/sidecar/tool_calc.py
 import random, secrets
+from bisect import bisect_right
+from functools import lru_cache
 from .loader import load_table
 from .schemas import RoundConfigOut, GatherResultOut
 
@@ -9,17 +11,30 @@ repair_tbl  = load_table("repair_state")
 tools_tbl   = load_table("tools")
 goods_tbl   = load_table("goods")                 # so recipes can cross-verify
 
+# repair states by ascending durability floor; on equal floors the row listed
+# first in the yaml sorts last, so it is the one bisect lands on
+_REPAIR_ROWS   = sorted(
+    ((row["durabilityFloor"], -i, state) for i, (state, row) in enumerate(repair_tbl.items()))
+)
+_REPAIR_FLOORS = [floor for floor, _, _ in _REPAIR_ROWS]
+_REPAIR_NAMES  = [state for _, _, state in _REPAIR_ROWS]
+
 def _roll(lo: float, hi: float) -> float:
     return lo + random.random() * (hi - lo)
 
 def get_tool_row(tool_id: str) -> dict:          # helper
     return tools_tbl[tool_id]
 
-def compute_round_config(agent_id: int, tool_id: str, quality_id: str) -> RoundConfigOut:
+@lru_cache(maxsize=None)
+def _round_rows(tool_id: str, quality_id: str) -> tuple:
+    """Table rows behind a (tool, quality) pair – fixed for the process."""
     tool = get_tool_row(tool_id)
-    mat  = materials[tool["material"]]
-    qual = qualities[quality_id]
-    rep  = repair_tbl[tool.get("repair_state", "Used")]
+    return (tool, materials[tool["material"]], qualities[quality_id],
+            repair_tbl[tool.get("repair_state", "Used")])
+
+def compute_round_config(agent_id: int, tool_id: str, quality_id: str) -> RoundConfigOut:
+    # rows are cached; the rolls and seed below stay fresh per call
+    tool, mat, qual, rep = _round_rows(tool_id, quality_id)
 
     gather_mult   = (1 + _roll(*mat["harvestSpeedRange"])) \
                   * (1 + _roll(*qual["gatherSpeedRange"])) \
@@ -56,11 +71,11 @@ def apply_gather_use(cfg: RoundConfigOut, nodes_collected: int) -> GatherResultO
     dur_left  = max(cfg.tool.durability - nodes_collected, 0)
     pct_left  = dur_left / cfg.tool.max_durability
 
-    # look up first row whose floor ≤ pct_left
-    new_state = next(
-        state for state, row in repair_tbl.items()
-        if pct_left >= row["durabilityFloor"]
-    )
+    # highest floor ≤ pct_left
+    i = bisect_right(_REPAIR_FLOORS, pct_left) - 1
+    if i < 0:
+        raise ValueError(f"no repair state with durabilityFloor <= {pct_left}")
+    new_state = _REPAIR_NAMES[i]
 
 
     result = GatherResultOut(
@@ -1,10 +1,16 @@
 import logging
 import random
+from array import array
+from bisect import bisect
+from dataclasses import dataclass
+from itertools import accumulate
 from data_structures import (
     Profession, SkillLevel, SILVER_PER_GOLD
 )
 from resource_loader import CATALOG
 
+logger = logging.getLogger(__name__)
+
 INDUSTRY_CONFIG = {
     Profession.BLACKSMITH: {
         "recipes": [
@@ -79,58 +85,171 @@ INDUSTRY_CONFIG = {
     }
 }
 
+# Production stops once finished stock reaches SAFETY_BUFFER × the largest
+# min_stocks entry among a recipe's inputs (see parse_recipes_and_produce).
+SAFETY_BUFFER = 1.30
+# Hard cap on batches per recipe per call – prevents runaway loops.
+DAILY_BATCH_CAP = 10
+
+@dataclass(frozen=True, slots=True)
+class IndustryRecipe:
+    """One INDUSTRY_CONFIG recipe, flattened for the daily production loop."""
+    output_item: str
+    inputs: tuple[tuple[str, int], ...]   # ((raw_item, qty_per_batch), ...)
+    per_batch: int
+    threshold: float                      # SAFETY_BUFFER × max input min_stock
+    single_input: bool                    # len(inputs) == 1 → scalar fast path
+
+@dataclass(frozen=True, slots=True)
+class IndustryCfg:
+    recipes: tuple[IndustryRecipe, ...]
+    min_stocks: dict[str, int]
+    # ((raw_item, smallest per-batch qty of it across recipes), ...): if every
+    # raw is below its floor, no recipe can run a single batch today
+    input_floor: tuple[tuple[str, int], ...]
+
+def _industry_cfg(cfg) -> IndustryCfg:
+    min_stocks = cfg["min_stocks"]
+    floor: dict[str, int] = {}
+    for r in cfg["recipes"]:
+        for raw, qty in r["inputs"].items():
+            floor[raw] = min(qty, floor.get(raw, qty))
+    return IndustryCfg(
+        recipes=tuple(
+            IndustryRecipe(
+                output_item=r["output_item"],
+                inputs=tuple(r["inputs"].items()),
+                per_batch=r["out_per_batch"],
+                threshold=SAFETY_BUFFER * max(
+                    (min_stocks.get(raw, 0.0) for raw in r["inputs"]), default=0.0
+                ),
+                single_input=len(r["inputs"]) == 1,
+            )
+            for r in cfg["recipes"]
+        ),
+        min_stocks=min_stocks,
+        input_floor=tuple(floor.items()),
+    )
+
+# INDUSTRY_CONFIG as slotted records, keyed by Profession.value: a str key
+# hashes in C, an Enum member goes through Enum.__hash__.
+INDUSTRY_TABLE: dict[str, IndustryCfg] = {
+    prof.value: _industry_cfg(cfg) for prof, cfg in INDUSTRY_CONFIG.items()
+}
+
+# Raw ingredient -> the meal it is cooked into, read off the cook's recipes
+# (first recipe wins).  Other raws deliberately fall back to themselves in
+# raw_item_to_final: their bids are priced off the raw good, not the
+# finished item several units of it go into.
+_RAW_TO_FINAL: dict[str, str] = {}
+for _recipe in INDUSTRY_CONFIG[Profession.COOK]["recipes"]:
+    for _raw in _recipe["inputs"]:
+        _RAW_TO_FINAL.setdefault(_raw, _recipe["output_item"])
+del _recipe, _raw
+
+# Small int id per raw input, so per-guild counters can live in flat arrays.
+RAW_ITEM_ID: dict[str, int] = {
+    name: i for i, name in enumerate(sorted(
+        {raw for cfg in INDUSTRY_CONFIG.values() for raw in cfg["min_stocks"]}
+        | {raw for cfg in INDUSTRY_CONFIG.values()
+               for rec in cfg["recipes"] for raw in rec["inputs"]}
+    ))
+}
+
+# Procurement bid knobs (overhead & min_margin could later come from config).
+BID_OVERHEAD_PER_UNIT = .001           # placeholder low value
+BID_MIN_MARGIN        = .001
+BID_PRICE_FLOOR       = 0.01
+BID_BUMP_PER_DAY      = 1.02           # +2 % per day short
+
+# BID_BUMP_PER_DAY ** days_short, computed the same way, just once.
+_BUMP_TABLE = tuple(BID_BUMP_PER_DAY ** k for k in range(4096))
+
+def _buy_plan(min_stocks):
+    """((raw_item, raw_id, needed_amt, final_item), ...) for the daily buy loop."""
+    ids = RAW_ITEM_ID
+    extra = sorted(raw for raw in min_stocks if raw not in ids)
+    if extra:                          # caller-supplied raws: local ids past ours
+        ids = {**ids, **{raw: len(ids) + i for i, raw in enumerate(extra)}}
+    return tuple(
+        (raw, ids[raw], needed, raw_item_to_final(raw))
+        for raw, needed in min_stocks.items()
+    )
+
+# Raw-resource draw tables.  Same arithmetic as random.choices(weights=...)
+# (one random() scaled by the weight total, bisected into the running sum)
+# so seeded runs draw the same items, minus the per-call accumulate.
+_ORE_TYPES   = ("ore_iron", "ore_copper", "ore_tin", "ore_coal", "ore_silver", "ore_gold")
+_ORE_CUM     = tuple(accumulate((0.25, 0.15, 0.15, 0.15, 0.15, 0.15)))
+_ORE_TOTAL   = _ORE_CUM[-1]
+_FISH_TYPES  = ("sardine", "herring", "trout", "salmon", "swordfish", "shark")
+_FISH_CUM    = tuple(accumulate((0.30, 0.22, 0.18, 0.15, 0.10, 0.05)))
+_FISH_TOTAL  = _FISH_CUM[-1]
+
 def produce_raw_resources(person, guild, forest_capacity):
     """
     Mining, Logging, Fishing => produce raw items into guild.warehouse
     """
-    if person.profession == Profession.MINER:
+    wh = guild.warehouse
+    debug_enabled = logger.isEnabledFor(logging.DEBUG)
+    profession = person.profession
+    if profession == Profession.MINER:
         qty = 6 if person.skill_level == SkillLevel.LOW else 8
-        ore_type = random.choices(
-            ["ore_iron","ore_copper","ore_tin","ore_coal","ore_silver","ore_gold"],
-            weights=[0.25,0.15,0.15,0.15,0.15,0.15], k=1
-        )[0]
-        guild.warehouse[ore_type] += qty
-        logging.debug(f"{person.name} (ID={person.person_id}) => produced {qty} {ore_type}. Now guild has {guild.warehouse[ore_type]}")
-    elif person.profession == Profession.LUMBERJACK:
+        ore_type = _ORE_TYPES[
+            bisect(_ORE_CUM, random.random() * _ORE_TOTAL, 0, len(_ORE_CUM) - 1)
+        ]
+        wh[ore_type] += qty
+        if debug_enabled:
+            logger.debug(f"{person.name} (ID={person.person_id}) => produced {qty} {ore_type}. Now guild has {wh[ore_type]}")
+    elif profession == Profession.LUMBERJACK:
         qty = 6 if person.skill_level == SkillLevel.LOW else 8
         cut = min(qty, forest_capacity)
         if cut > 0:
-            guild.warehouse["wood"] += cut
+            wh["wood"] += cut
             forest_capacity -= cut
-            logging.debug(f"{person.name} cut {cut} wood => {guild.guild_name}. Now guild has {guild.warehouse['wood']}")
-    elif person.profession == Profession.FISHER:
+            if debug_enabled:
+                logger.debug(f"{person.name} cut {cut} wood => {guild.guild_name}. Now guild has {wh['wood']}")
+    elif profession == Profession.FISHER:
         qty = 6 if person.skill_level == SkillLevel.LOW else 8
-        fish_type = random.choices(
-            ["sardine","herring","trout","salmon","swordfish","shark"],
-            weights=[0.30,0.22,0.18,0.15,0.10,0.05], k=1
-        )[0]
-        guild.warehouse[fish_type] += qty
-        logging.debug(f"{person.name} (ID={person.person_id}) => produced {qty} {fish_type}. Now guild has {guild.warehouse[fish_type]}")
+        fish_type = _FISH_TYPES[
+            bisect(_FISH_CUM, random.random() * _FISH_TOTAL, 0, len(_FISH_CUM) - 1)
+        ]
+        wh[fish_type] += qty
+        if debug_enabled:
+            logger.debug(f"{person.name} (ID={person.person_id}) => produced {qty} {fish_type}. Now guild has {wh[fish_type]}")
 
     return forest_capacity
 
 def farmer_produce_daily(person, guild, season_factor):
+    wh = guild.warehouse
+    debug_enabled = logger.isEnabledFor(logging.DEBUG)
     base_qty = 6 if person.skill_level == SkillLevel.LOW else 8
     grain_qty = base_qty * season_factor
-    guild.warehouse["grain"] += grain_qty
-    logging.debug(f"{person.name} => +{grain_qty} grain. Now guild has {guild.warehouse['grain']}")
+    wh["grain"] += grain_qty
+    if debug_enabled:
+        logger.debug(f"{person.name} => +{grain_qty} grain. Now guild has {wh['grain']}")
 
     if person.cows > 0:
         milk = person.cows
-        guild.warehouse["milk"] += milk
-        logging.debug(f"{person.name} got {milk} milk from {person.cows} cows => {guild.guild_name}. Now guild has {guild.warehouse['milk']}")
-        # chance to slaughter
+        wh["milk"] += milk
+        if debug_enabled:
+            logger.debug(f"{person.name} got {milk} milk from {person.cows} cows => {guild.guild_name}. Now guild has {wh['milk']}")
+        # chance to slaughter.  Drawn here, not pre-drawn per day: the roll
+        # shares one stream with the miner/fisher draws in population order,
+        # so a batch would reorder every seeded run.
         if random.random() < 0.05 and person.cows > 0:
             person.cows -= 1
-            guild.warehouse["beef"] += 2
-            logging.debug(f"{person.name} slaughtered 1 cow => 2 beef => {guild.guild_name}. Now guild has {guild.warehouse['beef']}")
+            wh["beef"] += 2
+            if debug_enabled:
+                logger.debug(f"{person.name} slaughtered 1 cow => 2 beef => {guild.guild_name}. Now guild has {wh['beef']}")
 
     if person.sheep > 0:
         w = person.sheep
-        guild.warehouse["wool"] += w
-        logging.debug(f"{person.name} sheared {w} wool => {guild.guild_name}. Now guild has {guild.warehouse['wool']}")
+        wh["wool"] += w
+        if debug_enabled:
+            logger.debug(f"{person.name} sheared {w} wool => {guild.guild_name}. Now guild has {wh['wool']}")
 
-def parse_recipes_and_produce(person, guild, simulation) -> None:
+def parse_recipes_and_produce(person, guild, simulation, *, _cap=DAILY_BATCH_CAP) -> None:
     """
     Multi‑input production loop.
 
@@ -143,7 +262,7 @@ def parse_recipes_and_produce(person, guild, simulation) -> None:
 
         finished_on_hand ≥ safety_buffer × max(  min_stocks[input_i]  for input_i in recipe )
 
-    where *safety_buffer* = **1.10** (i.e. keep 10 % head‑room above the strict minimum).
+    where *safety_buffer* = ``SAFETY_BUFFER`` = **1.30** (i.e. keep 30 % head‑room above the strict minimum).
 
     This guarantees:
     1. We never run out of storage because we keep a margin.
@@ -152,137 +271,204 @@ def parse_recipes_and_produce(person, guild, simulation) -> None:
        which is exactly what we want.
     ────────────────────────────────────────────────────────────────────────────────────────────────────────────
     """
-    config = INDUSTRY_CONFIG.get(guild.profession)
+    config = INDUSTRY_TABLE.get(guild.profession.value)
     if not config:                     # professions like miners & farmers skip this path
         return
 
-    DAILY_BATCH_CAP = 10               # hard daily cap – prevents runaway loops
-    SAFETY_BUFFER  = 1.30              # <‑‑ “2‑b”              (30 %)
+    # hot loop: keep lookups in locals, skip f-strings unless DEBUG is on
+    wh            = guild.warehouse
+    wh_get        = wh.get
+    for_sale_map  = simulation.marketWarehouse.for_sale_map
+    debug         = logger.debug
+    debug_enabled = logger.isEnabledFor(logging.DEBUG)
+
+    # early out: not one batch of anything is possible (empty warehouse)
+    for raw_item, qty_needed in config.input_floor:
+        if wh_get(raw_item, 0.0) >= qty_needed:
+            break
+    else:
+        if debug_enabled:
+            debug(f"[{guild.guild_name}]  no inputs for any recipe")
+        return
 
     produced_anything = False
 
-    for recipe in config["recipes"]:
-        out_item  : str            = recipe["output_item"]
-        inputs    : dict[str,int]  = recipe["inputs"]
-        per_batch : int            = recipe["out_per_batch"]
+    for recipe in config.recipes:
+        out_item  = recipe.output_item
+        in_pairs  = recipe.inputs
+        per_batch = recipe.per_batch
 
         # ------------------------------------------------------------------
         #  Step 1 – how many finished goods are *already* around?
         # ------------------------------------------------------------------
-        local_finished   = guild.warehouse.get(out_item, 0.0)
-        listed_finished  = simulation.marketWarehouse.for_sale_map[out_item].get(guild, 0.0)
+        local_finished   = wh_get(out_item, 0.0)
+        listed_finished  = for_sale_map[out_item].get(guild, 0.0)
         finished_on_hand = local_finished + listed_finished           # 2‑b
 
         # ------------------------------------------------------------------
-        #  Step 2 – compute the threshold that blocks new production
-        #           ► max(min_stocks of all required inputs) * 1.30
+        #  Step 2 – the threshold that blocks new production
+        #           ► max(min_stocks of all required inputs) * SAFETY_BUFFER
+        #             (precomputed per recipe at import)
         # ------------------------------------------------------------------
-        raw_min_levels = [
-            config["min_stocks"].get(raw, 0.0)
-            for raw in inputs
-        ]
-        threshold = SAFETY_BUFFER * max(raw_min_levels, default=0.0)
+        threshold = recipe.threshold
 
         # If we already meet / exceed the threshold, skip this recipe
         if finished_on_hand >= threshold:
-            logging.debug(
-                f"[{guild.guild_name}]  skip {out_item:>14s}: "
-                f"finished={finished_on_hand:.1f}  threshold={threshold:.1f}"
-            )
+            if debug_enabled:
+                debug(
+                    f"[{guild.guild_name}]  skip {out_item:>14s}: "
+                    f"finished={finished_on_hand:.1f}  threshold={threshold:.1f}"
+                )
             continue
 
         # ------------------------------------------------------------------
         #  Step 3 – how many batches can we realistically run today?
         # ------------------------------------------------------------------
-        max_batches = DAILY_BATCH_CAP
-        for raw_item, qty_needed in inputs.items():
-            available = guild.warehouse.get(raw_item, 0.0)
-            max_from_this_input = int(available // qty_needed)
-            max_batches = min(max_batches, max_from_this_input)
+        if recipe.single_input:        # most recipes: one raw, no reduction
+            (raw_item, qty_needed), = in_pairs
+            max_batches = int(wh_get(raw_item, 0.0) // qty_needed)
+            if max_batches > _cap:
+                max_batches = _cap
+        else:
+            max_batches = _cap
+            for raw_item, qty_needed in in_pairs:
+                available = wh_get(raw_item, 0.0)
+                max_from_this_input = int(available // qty_needed)
+                max_batches = min(max_batches, max_from_this_input)
 
         if max_batches == 0:
-            logging.debug(
-                f"[{guild.guild_name}]  no inputs for {out_item}; requirements={inputs}"
-            )
+            if debug_enabled:
+                debug(
+                    f"[{guild.guild_name}]  no inputs for {out_item}; requirements={dict(in_pairs)}"
+                )
             continue
 
         # ------------------------------------------------------------------
         #  Step 4 – consume inputs & add outputs
         # ------------------------------------------------------------------
-        for raw_item, qty_needed in inputs.items():
-            guild.warehouse[raw_item] -= qty_needed * max_batches
+        if recipe.single_input:
+            wh[raw_item] -= qty_needed * max_batches
+        else:
+            for raw_item, qty_needed in in_pairs:
+                wh[raw_item] -= qty_needed * max_batches
 
-        guild.warehouse[out_item] += per_batch * max_batches
+        wh[out_item] += per_batch * max_batches
         produced_qty = per_batch * max_batches
         produced_anything = True
 
-        logging.debug(
-            f"[{guild.guild_name}]  produced {produced_qty:>6.1f}  {out_item:<14s}  "
-            f"(batches={max_batches},  now={guild.warehouse[out_item]:.1f})"
-        )
+        if debug_enabled:
+            debug(
+                f"[{guild.guild_name}]  produced {produced_qty:>6.1f}  {out_item:<14s}  "
+                f"(batches={max_batches},  now={wh[out_item]:.1f})"
+            )
 
     # flag for wage calculation
     if produced_anything:
         guild.did_produce_today = True
 
-def guild_buy_raw_materials(guild, simulation):
+_RAW_PROFESSIONS = (Profession.MINER, Profession.LUMBERJACK, Profession.FISHER)
+
+def daily_production(simulation, season_factor) -> None:
+    """
+    One production pass over the whole population (step 3 of a work day).
+
+    Each person's guild comes from the simulation's person → guild map
+    (kept at hiring time); dispatch and population order are the same as
+    calling the per-person functions above one by one, so random draws
+    line up.  The pass is mostly dict updates on guild warehouses, which is
+    why it is not split into per-profession array kernels.
+    """
+    guild_of = simulation.find_guild_for_person
+
+    forest = simulation.forest_capacity
+    for p in simulation.people:
+        g = guild_of(p)
+        if g is None:
+            continue
+        profession = p.profession
+        if profession in _RAW_PROFESSIONS:
+            forest = produce_raw_resources(p, g, forest)
+        elif profession == Profession.FARMER:
+            farmer_produce_daily(p, g, season_factor)
+        elif profession == g.profession and profession != Profession.UNEMPLOYED:
+            parse_recipes_and_produce(p, g, simulation)
+    simulation.forest_capacity = forest
+
+def guild_buy_raw_materials(guild, simulation, prices=None, *,
+                            _overhead=BID_OVERHEAD_PER_UNIT, _margin=BID_MIN_MARGIN,
+                            _floor=BID_PRICE_FLOOR, _bump=_BUMP_TABLE):
     """
     This replaces the old "place_bid(1.10 * ref_price)" logic
     with a profit-based approach that adaptively increases
     if the guild remains short for multiple days.
+
+    *prices* is an optional ``{item: reference price}`` snapshot
+    (``MarketWarehouse.price_snapshot()``) shared by every guild in the
+    procurement step; without it the function takes its own snapshot.
     """
     config = simulation.INDUSTRY_CONFIG.get(guild.profession, None)
     if not config:
         return  # no multi-ingredient production => skip
 
-    # overhead & min_margin can come from config or a guess:
-    overhead_per_unit = .001 # placeholder low value
-    min_margin = .001
+    if config is INDUSTRY_CONFIG.get(guild.profession):
+        buy_plan = _BUY_PLAN[guild.profession]
+        width = len(RAW_ITEM_ID)
+    else:                              # caller-supplied config: derive it
+        buy_plan = _buy_plan(config["min_stocks"])
+        width = len(RAW_ITEM_ID) + len(buy_plan)   # bounds any local ids
 
-    # We'll store short-days in a dictionary on the simulation
+    # Short-day counters live on the simulation: one array('i') row per
+    # guild, indexed by raw_id.
     if not hasattr(simulation, "guild_days_short"):
-        simulation.guild_days_short = {}  # { (guild, raw_item): int }
-
-    min_stocks = config["min_stocks"]
-    for raw_item, needed_amt in min_stocks.items():
-        current = guild.warehouse[raw_item]
+        simulation.guild_days_short = {}  # { guild: array('i') }
+    days_short_row = simulation.guild_days_short.get(guild)
+    if days_short_row is None:
+        days_short_row = simulation.guild_days_short[guild] = array("i", [0]) * width
+    elif len(days_short_row) < width:
+        days_short_row.extend([0] * (width - len(days_short_row)))
+
+    wh            = guild.warehouse
+    market        = simulation.marketWarehouse
+    if prices is None:
+        prices = market.price_snapshot()
+    debug_enabled = logger.isEnabledFor(logging.DEBUG)
+
+    for raw_item, raw_id, needed_amt, final_item in buy_plan:
+        current = wh[raw_item]
         if current >= needed_amt:
             # Not short => reset the days_short count
-            simulation.guild_days_short[(guild, raw_item)] = 0
+            days_short_row[raw_id] = 0
             continue
 
         # We are short
         shortfall = needed_amt - current
 
-        # 1) Identify the final product(s) that use this raw_item:
-        #    For example, if raw_item="sardine" => final_item="meal_sardine"
-        #    Or do a more general approach if multiple recipes use 'sardine'.
-        #    We'll just guess a single mapping, or you can code a lookup:
-        final_item = raw_item_to_final(raw_item)  # Your custom function
+        # 1) final_item: the product this raw_item is sold as, e.g.
+        #    "sardine" => "meal_sardine" (precomputed in _BUY_PLAN via
+        #    raw_item_to_final's table)
 
         # 2) Grab the potential sale price from the market reference
         #    or from recent trades. We'll do the naive approach:
-        final_price = simulation.marketWarehouse.goods[final_item]["price"]
+        final_price = prices[final_item]
 
         # 3) Base max bid = final_price - overhead - margin
         #    If negative => set to a small positive or 0
-        max_bid_base = final_price - overhead_per_unit - min_margin
-        if max_bid_base < 0.01:
-            max_bid_base = 0.01
+        max_bid_base = final_price - _overhead - _margin
+        if max_bid_base < _floor:
+            max_bid_base = _floor
 
         # 4) See how many days we've been short
-        key = (guild, raw_item)
-        days_short = simulation.guild_days_short.get(key, 0)
-        days_short += 1
-        simulation.guild_days_short[key] = days_short
+        days_short = days_short_row[raw_id] + 1
+        days_short_row[raw_id] = days_short
 
         # 5) Bump factor => 2% per day short
-        bump_factor = 1.02 ** days_short
+        bump_factor = (_bump[days_short] if days_short < 4096
+                       else BID_BUMP_PER_DAY ** days_short)
         max_bid_price = max_bid_base * bump_factor
 
         # 6) Place the BID with that price
         #    We'll assume your place_bid(...) now has a 'current_day' param
-        simulation.marketWarehouse.place_bid(
+        market.place_bid(
             owner=guild,
             item=raw_item,
             quantity=shortfall,
@@ -290,26 +476,38 @@ def guild_buy_raw_materials(guild, simulation):
             current_day=simulation.current_day  # for expiry
         )
 
-        logging.debug(
-            f"{guild.guild_name} is short of {raw_item} by {shortfall}, "
-            f"days_short={days_short}, overhead={overhead_per_unit}, "
-            f"min_margin={min_margin}, final_price={final_price}, "
-            f"max_bid_base={max_bid_base:.2f}, bump_factor={bump_factor:.2f}, "
-            f"placing BID={max_bid_price:.2f} for {shortfall}"
-        )
+        if debug_enabled:
+            logger.debug(
+                f"{guild.guild_name} is short of {raw_item} by {shortfall}, "
+                f"days_short={days_short}, overhead={_overhead}, "
+                f"min_margin={_margin}, final_price={final_price}, "
+                f"max_bid_base={max_bid_base:.2f}, bump_factor={bump_factor:.2f}, "
+                f"placing BID={max_bid_price:.2f} for {shortfall}"
+            )
+
+def daily_procurement(simulation) -> None:
+    """
+    Procurement step for every guild: one price snapshot for the whole
+    step, and guilds whose profession buys nothing are skipped before
+    the call.  Bids go out in guild order, as with per-guild calls.
+    """
+    prices = simulation.marketWarehouse.price_snapshot()
+    config = simulation.INDUSTRY_CONFIG
+    for g in simulation.guilds:
+        if g.profession in config:
+            guild_buy_raw_materials(g, simulation, prices)
 
 def raw_item_to_final(raw_item):
     """
     Quick mapping from raw fish to the final meal item.
     e.g. 'sardine' -> 'meal_sardine'
-    This can be more sophisticated if multiple recipes use 'sardine'.
+    Built from the cook's recipes (``_RAW_TO_FINAL``); anything else maps
+    to itself.
     """
-    if raw_item in ["sardine", "herring", "trout", "salmon", "swordfish", "shark"]:
-        return f"meal_{raw_item}"
-    elif raw_item == "beef":
-        return "meal_meat"
-    # fallback if we can't find a direct final item:
-    return raw_item
+    return _RAW_TO_FINAL.get(raw_item, raw_item)
+
+# Per profession buy plan, see _buy_plan().
+_BUY_PLAN = {prof: _buy_plan(cfg["min_stocks"]) for prof, cfg in INDUSTRY_CONFIG.items()}
 
 # Gameplayer notes:
 # - The guild's profession determines the recipes it can produce.
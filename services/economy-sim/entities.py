@@ -2,8 +2,48 @@ import logging
 import random
 from collections import defaultdict
 from data_structures import Profession, SkillLevel, DAILY_WAGES, SILVER_PER_GOLD
+from settings import MEAL_ITEMS, DRINK_ITEMS
+
+# float copy of the rate: x / 100.0 rounds exactly like x / 100 but skips the
+# int -> float conversion (a reciprocal multiply would not round the same)
+_SPG = float(SILVER_PER_GOLD)
+
+_MEALS = frozenset(MEAL_ITEMS)
+_DRINKS = frozenset(DRINK_ITEMS)
+
+def _pay_in_silver(payer, amount):
+    """
+    Shared ``pay_in_silver`` for Person and Guild: take *amount* from
+    silver first, then gold at SILVER_PER_GOLD; returns what was paid.
+    """
+    if amount <= 0:
+        return 0.0
+    silver = payer.silver
+    if silver >= amount:               # common case: silver covers it
+        payer.silver = silver - amount
+        return amount
+    needed = amount - silver
+    paid = 0.0 + silver
+    payer.silver = 0
+    gold_in_silver = payer.gold * _SPG
+    if gold_in_silver >= needed:
+        payer.gold -= needed / _SPG
+        return amount
+    paid += gold_in_silver
+    payer.gold = 0
+    return paid
+
 
 class Person:
+    # Fixed attribute layout: ~1/3 the per-object footprint of a __dict__
+    # instance, and a typo'd attribute now raises instead of silently sticking.
+    __slots__ = (
+        "person_id", "name", "profession", "skill_level", "silver", "gold",
+        "training_target", "months_training_remaining", "inventory",
+        "food_total", "drink_total", "food_need_daily", "drink_need_daily", "housing_cost_weekly",
+        "clothing_maintenance_monthly", "cows", "pigs", "sheep",
+    )
+
     def __init__(
         self, person_id, name, profession, skill_level,
         silver=0.0, gold=0.0,
@@ -19,8 +59,11 @@ class Person:
         self.training_target = training_target
         self.months_training_remaining = months_training_remaining
 
-        # personal inventory
+        # personal inventory; food/drink totals track the MEAL_ITEMS /
+        # DRINK_ITEMS part of it, so go through gain_item()/use_item()
         self.inventory = defaultdict(float)
+        self.food_total = 0.0
+        self.drink_total = 0.0
 
         # Basic consumption
         self.food_need_daily = 2.0
@@ -33,29 +76,25 @@ class Person:
         self.pigs = pigs
         self.sheep = sheep
 
+    @classmethod
+    def new_bulk(cls, ids, prefix, profession, skill_level, **kw):
+        """One Person per id, named ``f"{prefix}_{id}"``, sharing *kw*."""
+        return [cls(i, f"{prefix}_{i}", profession, skill_level, **kw) for i in ids]
+
+    def gain_item(self, item, qty):
+        self.inventory[item] += qty
+        if item in _MEALS:
+            self.food_total += qty
+        elif item in _DRINKS:
+            self.drink_total += qty
+
+    def use_item(self, item, qty):
+        self.gain_item(item, -qty)
+
     def total_silver_equivalent(self):
         return self.silver + self.gold * SILVER_PER_GOLD
 
-    def pay_in_silver(self, amount):
-        if amount <= 0:
-            return 0.0
-        paid = 0.0
-        if self.silver >= amount:
-            self.silver -= amount
-            return amount
-        else:
-            needed = amount - self.silver
-            paid += self.silver
-            self.silver = 0
-            gold_in_silver = self.gold * SILVER_PER_GOLD
-            if gold_in_silver >= needed:
-                gold_needed = needed / SILVER_PER_GOLD
-                self.gold -= gold_needed
-                return amount
-            else:
-                paid += gold_in_silver
-                self.gold = 0
-                return paid
+    pay_in_silver = _pay_in_silver
 
     def receive_silver(self, amount):
         self.silver += amount
@@ -83,16 +122,31 @@ class Person:
 
 
 class Guild:
+    __slots__ = (
+        "guild_id", "guild_name", "profession", "employees", "haulers",
+        "silver", "gold", "loan_balance", "warehouse", "did_produce_today",
+        "num_wagons", "num_horses", "num_wagons_in_use", "num_horses_in_use",
+    )
+
     def __init__(self, guild_id, guild_name, profession):
         self.guild_id = guild_id
         self.guild_name = guild_name
         self.profession = profession
+        # roster in hiring order (wages are paid in it).  Nothing tests
+        # membership here: "whose guild is this?" is Simulation's
+        # person -> guild dict, so no parallel set is kept.
         self.employees = []
+        # roster subset the transport handlers use every day; filled by
+        # add_employee (only the unemployed retrain, and they are never hired)
+        self.haulers = []
         self.silver = 0.0
         self.gold = 50.0
         self.loan_balance = 0.0
 
-        self.warehouse = defaultdict(float)  # local items, e.g. before transport
+        # local items, e.g. before transport.  Kept as a str-keyed dict: an
+        # array('d') column per item id is slower for `wh[item] += q`, since
+        # every read boxes a new float, and a mapping wrapper slower still.
+        self.warehouse = defaultdict(float)
         self.did_produce_today = False
         self.num_wagons = 0
         self.num_horses = 0
@@ -101,27 +155,10 @@ class Guild:
 
     def add_employee(self, person):
         self.employees.append(person)
+        if person.profession == Profession.HAULER:
+            self.haulers.append(person)
 
-    def pay_in_silver(self, amount):
-        if amount <= 0:
-            return 0.0
-        paid = 0.0
-        if self.silver >= amount:
-            self.silver -= amount
-            return amount
-        else:
-            needed = amount - self.silver
-            paid += self.silver
-            self.silver = 0
-            gold_in_silver = self.gold * SILVER_PER_GOLD
-            if gold_in_silver >= needed:
-                gold_needed = needed / SILVER_PER_GOLD
-                self.gold -= gold_needed
-                return amount
-            else:
-                paid += gold_in_silver
-                self.gold = 0
-                return paid
+    pay_in_silver = _pay_in_silver
 
     def receive_silver(self, amount):
         self.silver += amount
@@ -129,12 +166,17 @@ class Guild:
     def pay_wages(self):
         pay_factor = 1.0 if self.did_produce_today else 0.6
         total_paid = 0.0
+        # Paid one by one in roster order: once the guild runs dry the
+        # employees at the end of the list get less (same as before).
+        relevant = (self.profession, Profession.HAULER)
+        wage_of = DAILY_WAGES.get
+        pay = self.pay_in_silver
         for emp in self.employees:
             # Pay full if they're relevant, partial if not
-            if emp.profession in [self.profession, Profession.HAULER]:
-                weekly = emp.daily_wage() * 5 * pay_factor
-                paid = self.pay_in_silver(weekly)
-                emp.receive_silver(paid)
+            if emp.profession in relevant:
+                weekly = wage_of(emp.skill_level, 0) * 5 * pay_factor
+                paid = pay(weekly)
+                emp.silver += paid
                 total_paid += paid
         self.did_produce_today = False
         return total_paid
@@ -149,16 +191,14 @@ class Treasury:
         self.silver += amount
 
     def pay_tournament_prizes(self, gladiators, distribution_map, logger):
-        import random
         total_gold_coins = 100
         random.shuffle(gladiators)
-        for rank in range(1, 31):
-            if rank <= len(gladiators):
-                g = gladiators[rank - 1]
-                pct = distribution_map.get(rank, 0)
-                payout = total_gold_coins * (pct / 100)
-                g.receive_gold(payout)
-                logger.debug(f"Treasury pays {payout:.2f} gold to {g.name} (Rank {rank}).")
+        # payout per rank 1..30 up front, then one pass over the podium
+        payouts = [total_gold_coins * (distribution_map.get(rank, 0) / 100)
+                   for rank in range(1, 31)]
+        for rank, (g, payout) in enumerate(zip(gladiators, payouts), 1):
+            g.gold += payout
+            logger.debug("Treasury pays %.2f gold to %s (Rank %d).", payout, g.name, rank)
 
     def mint_coins_from_ore(self, gold_ore_amount, silver_ore_amount):
         self.gold += gold_ore_amount * 100
@@ -1,27 +1,24 @@
 from collections import defaultdict
+from itertools import accumulate
 from data_structures import Profession # Assuming Profession enum from your existing data_structures.py
 
 # --- EXP Curve ---
 # Scaled Option 3 (Base 800 for first step, effective multiplier ~2.16)
 # XP needed for each specific benchmark step i (where i from 1 to 10)
-SCALED_EXP_CURVE_BENCHMARK_CHUNKS = [
+SCALED_EXP_CURVE_BENCHMARK_CHUNKS = (
     800, 1726, 3724, 8036, 17338, 37412, 80720, 174168, 376024, 811360
-]
+)
 
 # Total EXP accumulated to reach the END of benchmark step i
-TOTAL_EXP_TO_REACH_BENCHMARK = []
-current_total_exp_val = 0
-for chunk_val in SCALED_EXP_CURVE_BENCHMARK_CHUNKS:
-    current_total_exp_val += chunk_val
-    TOTAL_EXP_TO_REACH_BENCHMARK.append(current_total_exp_val)
+TOTAL_EXP_TO_REACH_BENCHMARK = tuple(accumulate(SCALED_EXP_CURVE_BENCHMARK_CHUNKS))
 
 def get_total_exp_for_benchmark_level(benchmark_level: int) -> int:
-    if not 1 <= benchmark_level <= 10: return 0
-    return TOTAL_EXP_TO_REACH_BENCHMARK[benchmark_level - 1]
+    i = benchmark_level - 1
+    return TOTAL_EXP_TO_REACH_BENCHMARK[i] if 0 <= i < 10 else 0
 
 def get_exp_chunk_for_benchmark_level(benchmark_level: int) -> int:
-    if not 1 <= benchmark_level <= 10: return 0
-    return SCALED_EXP_CURVE_BENCHMARK_CHUNKS[benchmark_level - 1]
+    i = benchmark_level - 1
+    return SCALED_EXP_CURVE_BENCHMARK_CHUNKS[i] if 0 <= i < 10 else 0
 
 BASE_EXP_REWARD_GATHERING_NODE = 16 # Example base EXP for one "node" collected from minigame
 
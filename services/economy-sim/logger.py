@@ -4,37 +4,80 @@ logger.py
 Configures Python's standard logging to:
  - Write all logs (DEBUG+) to a file.
  - Print only INFO+ to console.
+
+Set ``SIM_QUIET=1`` (or pass ``quiet=True``) for long runs: the file then
+only gets WARNING+, and the root logger drops DEBUG records before any
+message is formatted.
+
+The root logger only enqueues records (``QueueHandler``); a
+``QueueListener`` thread does the formatting and file/console writes, so
+the simulation loop never waits on disk.
 """
 
+import atexit
 import logging
+import logging.handlers
+import os
+import queue
+
+_listener = None  # QueueListener from the last setup_logging() call
 
-def setup_logging(logfile="detailed.log"):
+def setup_logging(logfile="detailed.log", *, quiet=None):
     """
     Set up a root logger that:
-     - Writes all logs (DEBUG and above) to `logfile`.
+     - Writes all logs (DEBUG and above) to `logfile`
+       (WARNING and above when quiet).
      - Prints only INFO and above to console.
     """
+    if quiet is None:
+        quiet = os.getenv("SIM_QUIET") == "1"
+
+    # no thread / process lookups in every LogRecord – the formatters never use them
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
+
     logger = logging.getLogger()       # root logger
-    logger.setLevel(logging.DEBUG)     # capture everything in the file
+    # capture everything in the file, unless quiet
+    logger.setLevel(logging.INFO if quiet else logging.DEBUG)
 
     # Clear existing handlers (avoid duplication if re-run)
+    global _listener
+    shutdown_logging()
     for handler in logger.handlers[:]:
         logger.removeHandler(handler)
 
     # 1) File handler for detailed logs
     fh = logging.FileHandler(logfile, mode="w")
-    fh.setLevel(logging.DEBUG)
+    fh.setLevel(logging.WARNING if quiet else logging.DEBUG)
     file_formatter = logging.Formatter(
         "%(asctime)s [%(levelname)s] %(message)s", datefmt="%Y-%m-%d %H:%M:%S"
     )
     fh.setFormatter(file_formatter)
-    logger.addHandler(fh)
 
     # 2) Console handler for summaries
     ch = logging.StreamHandler()
     ch.setLevel(logging.INFO)
     console_formatter = logging.Formatter("[%(levelname)s] %(message)s")
     ch.setFormatter(console_formatter)
-    logger.addHandler(ch)
+
+    # 3) Root only enqueues; the listener thread feeds both handlers
+    q = queue.SimpleQueue()
+    logger.addHandler(logging.handlers.QueueHandler(q))
+    _listener = logging.handlers.QueueListener(q, fh, ch, respect_handler_level=True)
+    _listener.start()
 
     return logger
+
+
+def shutdown_logging():
+    """Flush queued records and stop the writer thread (also run at exit)."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()               # drains whatever is still queued
+        for handler in _listener.handlers:
+            handler.close()
+        _listener = None
+
+
+atexit.register(shutdown_logging)
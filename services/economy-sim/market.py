@@ -16,13 +16,22 @@ from __future__ import annotations
 import csv
 import logging
 import time
-from collections import defaultdict
-from typing import Dict, List, Any
+from array import array
+from bisect import bisect_left, insort
+from collections import defaultdict, deque
+from typing import Deque, Dict, Iterator, List, Any
 
 from resource_loader import CATALOG
 
 logger = logging.getLogger(__name__)
 
+PRICE_CAP = 5           # reference price never exceeds base_price × this
+PRICE_STEP = 0.02       # max daily move of the reference price
+PRICE_FLOOR = 0.01
+RELIST_LOOKBACK_DAYS = 2    # trades this recent feed the relist price
+_INF = float("inf")
+_NO_NAME = object()
+
 
 # ──────────────────────────────────────────────────────────────────────────────
 # Data classes
@@ -30,6 +39,13 @@ logger = logging.getLogger(__name__)
 class MarketOrder:
     """One bid or ask in the order book."""
 
+    # thousands rest in the book at once and the matching/expiry paths read
+    # these fields constantly: fixed slots instead of a per-order __dict__
+    __slots__ = (
+        "owner", "item", "quantity", "price", "is_bid", "timestamp",
+        "order_id", "posted_day", "valid_until_day",
+    )
+
     def __init__(
         self,
         owner: Any,                 # a Person or Guild – just needs .pay_in_silver()
@@ -53,6 +69,125 @@ class MarketOrder:
         self.valid_until_day = current_day + valid_days
 
 
+class BookSide:
+    """
+    One side of one item's order book, bucketed by price level.
+
+    ``levels[key]`` is a FIFO ``deque`` of the orders resting at that exact
+    price and ``keys`` is the ascending list of live level keys (kept with
+    ``bisect``), where *key* is ``-price`` for bids and ``price`` for asks.  Orders reach a
+    level in arrival order, so the left end of the top level is the best
+    order under the usual price-then-time priority.
+
+    ``qty`` is the running total of open quantity on this side.  Whoever
+    shrinks a resting order's quantity must take it off ``qty`` too; it
+    snaps back to exactly 0.0 whenever the side empties, so rounding
+    residue never outlives the orders.
+    """
+    __slots__ = ("sign", "levels", "keys", "qty")
+
+    def __init__(self, sign: float) -> None:
+        self.sign = sign
+        self.levels: Dict[float, Deque[MarketOrder]] = {}
+        self.keys: List[float] = []
+        self.qty = 0.0
+
+    def push(self, o: MarketOrder) -> None:
+        key = self.sign * o.price
+        level = self.levels.get(key)
+        if level is None:
+            level = self.levels[key] = deque()
+            insort(self.keys, key)
+        level.append(o)
+        self.qty += o.quantity
+
+    def best(self) -> MarketOrder:
+        """Best resting order; the side must not be empty."""
+        return self.levels[self.keys[0]][0]
+
+    def pop_best(self) -> None:
+        key = self.keys[0]
+        level = self.levels[key]
+        self.qty -= level.popleft().quantity
+        if not level:
+            del self.levels[key]
+            del self.keys[0]
+            if not self.keys:
+                self.qty = 0.0
+
+    def discard(self, o: MarketOrder) -> bool:
+        """Take *o* out of its level; ``False`` if it is no longer resting."""
+        key = self.sign * o.price
+        level = self.levels.get(key)
+        if level is None:
+            return False
+        try:
+            level.remove(o)
+        except ValueError:
+            return False
+        self.qty -= o.quantity
+        if not level:
+            del self.levels[key]
+            del self.keys[bisect_left(self.keys, key)]
+            if not self.keys:
+                self.qty = 0.0
+        return True
+
+    def __bool__(self) -> bool:
+        return bool(self.keys)
+
+    def __len__(self) -> int:
+        return sum(map(len, self.levels.values()))
+
+    def __iter__(self) -> Iterator[MarketOrder]:
+        """Orders in priority order (best first)."""
+        for level in self.iter_levels():
+            yield from level
+
+    def iter_levels(self) -> Iterator[Deque[MarketOrder]]:
+        """Price levels in priority order (best first); each is non-empty."""
+        return map(self.levels.__getitem__, self.keys)
+
+
+class TradeLog:
+    """
+    Append-only trade history, stored column-wise.
+
+    Numbers live in ``array`` columns and names in plain lists (references
+    to shared strings) – ~70 bytes per trade instead of a 9-key dict plus
+    its float objects.  Indexing and iteration still hand back the classic
+    per-trade dict, built on demand; bulk readers can use ``columns``.
+    """
+    FIELDS = ("id", "time", "sim_day", "item", "quantity", "price", "cost",
+              "buyer", "seller")
+    _TYPECODES = {"id": "q", "time": "d", "sim_day": "q",
+                  "quantity": "d", "price": "d", "cost": "d"}
+    __slots__ = ("columns", "_appends")
+
+    def __init__(self) -> None:
+        self.columns: Dict[str, Any] = {
+            f: array(self._TYPECODES[f]) if f in self._TYPECODES else []
+            for f in self.FIELDS
+        }
+        self._appends = tuple(col.append for col in self.columns.values())
+
+    def append(self, *values: Any) -> None:
+        """Record one trade; *values* in ``FIELDS`` order."""
+        for add, v in zip(self._appends, values, strict=True):
+            add(v)
+
+    def __len__(self) -> int:
+        return len(self.columns["id"])
+
+    def __getitem__(self, i: int) -> dict:
+        return {f: col[i] for f, col in self.columns.items()}
+
+    def __iter__(self) -> Iterator[dict]:
+        fields = self.FIELDS
+        for row in zip(*self.columns.values()):
+            yield dict(zip(fields, row))
+
+
 # ──────────────────────────────────────────────────────────────────────────────
 # Helpers
 # ──────────────────────────────────────────────────────────────────────────────
@@ -61,16 +196,10 @@ def _compute_relist_price(item: str, old_price: float, simulation) -> float:
     Simple heuristic: average of (current reference price, recent‑trade average),
     nudged down 2 %, capped within ±5 % of the reference price.
     """
-    market_price = simulation.marketWarehouse.goods[item]["price"]
-    cutoff_day = simulation.current_day - 2
-    recent = [
-        t for t in simulation.marketWarehouse.trades
-        if t["item"] == item and t["sim_day"] >= cutoff_day
-    ]
-    avg_trade = (
-        sum(t["price"] for t in recent) / len(recent)
-        if recent else market_price
-    )
+    mw = simulation.marketWarehouse
+    market_price = mw.goods[item]["price"]
+    recent = mw.recent_trade_prices(item, simulation.current_day - RELIST_LOOKBACK_DAYS)
+    avg_trade = sum(recent) / len(recent) if recent else market_price
     candidate = ((market_price + avg_trade) / 2.0) * 0.95   # 5 % below mid‑point
     candidate = min(candidate, old_price * 0.90)            # ↘   max 10 % drop
     candidate = max(candidate, 0.01)                               # hard floor
@@ -86,30 +215,56 @@ class MarketWarehouse:
 
     Physical stock lives in ``owner_map[item][owner]``.
     Anything flagged for sale also appears in ``for_sale_map``.
+    Both auto-create the per-item map on lookup, but the per-owner maps
+    are plain dicts: read them with ``.get(owner, 0.0)``.
+
+    ``bids[item]`` / ``asks[item]`` are price-level ``BookSide`` objects,
+    so matching only ever touches the top level of each side.
     """
 
     def __init__(self) -> None:
         # physical ownership
-        self.owner_map: Dict[str, Dict[Any, float]] = defaultdict(lambda: defaultdict(float))
+        self.owner_map: Dict[str, Dict[Any, float]] = defaultdict(dict)
         # subset of owner_map that is listed for sale
-        self.for_sale_map: Dict[str, Dict[Any, float]] = defaultdict(lambda: defaultdict(float))
+        self.for_sale_map: Dict[str, Dict[Any, float]] = defaultdict(dict)
 
-        # order book
-        self.bids: Dict[str, List[MarketOrder]] = defaultdict(list)
-        self.asks: Dict[str, List[MarketOrder]] = defaultdict(list)
+        # order book (price levels – see BookSide)
+        self.bids: Dict[str, BookSide] = defaultdict(lambda: BookSide(-1.0))
+        self.asks: Dict[str, BookSide] = defaultdict(lambda: BookSide(1.0))
+        # items with at least one resting order, in first-listed order
+        self._active_items: Dict[str, None] = {}
 
         # IDs
         self.next_order_id: int = 1
         self.trade_id_counter: int = 1
 
-        # trade history
-        self.trades: List[dict] = []
+        # trade history (+ a per-item (sim_day, price) window for relisting)
+        self.trades = TradeLog()
+        self._recent_trades: Dict[str, Deque[tuple]] = defaultdict(deque)
+
+        # owner -> guild_name / name (or _NO_NAME), resolved on first use
+        self._owner_names: Dict[Any, Any] = {}
+
+        # day of the last matching pass, and whether an order has been placed
+        # since; a second pass that day with nothing new would be a no-op
+        self._matched_day: int | None = None
+        self._book_dirty = False
+
+        # valid_until_day -> orders placed with that expiry, in id order;
+        # orders that were filled in the meantime are skipped on expiry
+        self._expiry: Dict[int, List[MarketOrder]] = defaultdict(list)
 
         # dynamic reference price & rolling supply/demand tallies
         self.goods: Dict[str, Dict[str, float]] = {
             name: {"price": g.base_price, "supply": 0.0, "demand": 0.0}
             for name, g in CATALOG.goods.items()
         }
+        # (record, price cap) per good, so the daily adjustment is one flat
+        # pass with no catalog lookups
+        self._price_rows: List[tuple] = [
+            (self.goods[name], g.base_price * PRICE_CAP)
+            for name, g in CATALOG.goods.items()
+        ]
 
     # ──────────────────────────────────────────────────────────────
     # 1) Physical stock helpers
@@ -118,20 +273,25 @@ class MarketWarehouse:
         """Move goods *into* the market warehouse."""
         if quantity <= 0:
             return
-        self.owner_map[item][owner] += quantity
+        held = self.owner_map[item]
+        held[owner] = held.get(owner, 0.0) + quantity
         if for_sale:
-            self.for_sale_map[item][owner] += quantity
+            listed = self.for_sale_map[item]
+            listed[owner] = listed.get(owner, 0.0) + quantity
 
     def withdraw(self, owner: Any, item: str, qty: float) -> float:
         """Remove up to *qty* units if the owner has them on site; returns actual withdrawn."""
         if qty <= 0:
             return 0.0
-        have = self.owner_map[item].get(owner, 0.0)
+        held = self.owner_map[item]
+        have = held.get(owner, 0.0)
         take = min(qty, have)
         if take:
-            self.owner_map[item][owner] -= take
-            if self.owner_map[item][owner] <= 1e-6:
-                del self.owner_map[item][owner]
+            left = have - take
+            if left <= 1e-6:
+                del held[owner]
+            else:
+                held[owner] = left
             # keep "for sale" flag accurate
             self._decrease_for_sale(owner, item, take)
         return take
@@ -145,14 +305,15 @@ class MarketWarehouse:
     # ------------------------------------------------------------------ #
     def _decrease_for_sale(self, seller: Any, item: str, qty_sold: float) -> None:
         """Decrease seller's for‑sale flag when a sale closes."""
-        fs = self.for_sale_map[item].get(seller, 0.0)
+        listed = self.for_sale_map[item]
+        fs = listed.get(seller, 0.0)
         if not fs:
             return
         remaining = fs - qty_sold
         if remaining <= 1e-6:
-            del self.for_sale_map[item][seller]
+            del listed[seller]
         else:
-            self.for_sale_map[item][seller] = remaining
+            listed[seller] = remaining
 
     # ──────────────────────────────────────────────────────────────
     # 2) Placing orders
@@ -165,8 +326,10 @@ class MarketWarehouse:
                         current_day, valid_days)
         o.order_id = self.next_order_id
         self.next_order_id += 1
-        self.bids[item].append(o)
-        self.bids[item].sort(key=lambda x: (-x.price, x.timestamp))
+        self.bids[item].push(o)
+        self._active_items[item] = None
+        self._book_dirty = True
+        self._expiry[o.valid_until_day].append(o)
         return o.order_id
 
     def place_ask(self, owner: Any, item: str, quantity: float, ask_price: float,
@@ -180,28 +343,51 @@ class MarketWarehouse:
                         current_day, valid_days)
         o.order_id = self.next_order_id
         self.next_order_id += 1
-        self.asks[item].append(o)
-        self.asks[item].sort(key=lambda x: (x.price, x.timestamp))
+        self.asks[item].push(o)
+        self._active_items[item] = None
+        self._book_dirty = True
+        self._expiry[o.valid_until_day].append(o)
         # flag those units as “for sale”
-        self.for_sale_map[item][owner] += quantity
+        listed = self.for_sale_map[item]
+        listed[owner] = listed.get(owner, 0.0) + quantity
         return o.order_id
 
     # ──────────────────────────────────────────────────────────────
     # 3) Matching engine
     # ──────────────────────────────────────────────────────────────
     def match_orders_for_day(self, current_day: int, *, simulation=None) -> None:
-        """Public entry point – first purge expirations, then match per item."""
+        """Public entry point – first purge expirations, then match per item.
+
+        A repeat call on the same day returns at once unless an order was
+        placed in between: the previous pass left every book uncrossed and
+        today's expiries already purged.
+        """
+        if current_day == self._matched_day and not self._book_dirty:
+            return
+        self._trim_recent_trades(current_day - RELIST_LOOKBACK_DAYS)
         self._remove_expired_orders(current_day, simulation)
-        for itm in set(self.bids) | set(self.asks):
-            self._match_item(itm, current_day)
+        bids, asks = self.bids, self.asks
+        for itm in list(self._active_items):
+            b, a = bids.get(itm), asks.get(itm)
+            # most books are one-sided or uncrossed: skip those outright
+            if b and a and b.best().price >= a.best().price:
+                self._match_item(itm, current_day)
+            if not b and not a:
+                del self._active_items[itm]
+        self._matched_day = current_day
+        self._book_dirty = False
 
     # -- internal -------------------------------------------------- #
+    # Kept as plain Python on purpose: every fill moves silver between
+    # Person/Guild objects, so there is no array-shaped inner loop for a
+    # JIT (numba/Cython) to take over.  Payment stays per fill because
+    # pay_in_silver caps a short buyer's fill (and per-counterparty sums
+    # would round silver balances differently).
     def _match_item(self, item: str, sim_day: int) -> None:
         bids, asks = self.bids[item], self.asks[item]
-        i = j = 0
-        while i < len(bids) and j < len(asks):
-            best_bid = bids[i]
-            best_ask = asks[j]
+        while bids and asks:
+            best_bid = bids.best()
+            best_ask = asks.best()
 
             if best_bid.price < best_ask.price:
                 break  # no more matches today
@@ -216,20 +402,16 @@ class MarketWarehouse:
                 trade_qty = paid / trade_price
                 cost = paid
             if trade_qty <= 1e-6:
+                bids.pop_best()
                 best_bid.quantity = 0
-                i += 1
                 continue
 
             self._fill_order(best_bid, best_ask, trade_qty, trade_price, cost, sim_day)
 
             if best_bid.quantity <= 1e-6:
-                i += 1
+                bids.pop_best()
             if best_ask.quantity <= 1e-6:
-                j += 1
-
-        # prune empty orders
-        self.bids[item] = [b for b in bids if b.quantity > 1e-6]
-        self.asks[item] = [a for a in asks if a.quantity > 1e-6]
+                asks.pop_best()
 
     def _fill_order(self, bid: MarketOrder, ask: MarketOrder,
                     qty: float, price: float, cost: float, sim_day: int) -> None:
@@ -239,55 +421,75 @@ class MarketWarehouse:
         # pay seller
         ask.owner.receive_silver(cost)
 
-        # update physical ownership
-        self.owner_map[item][ask.owner] -= qty
-        if self.owner_map[item][ask.owner] <= 1e-6:
-            del self.owner_map[item][ask.owner]
-        self.owner_map[item][bid.owner] += qty
+        # update physical ownership (the seller may have withdrawn stock
+        # behind a resting ask, hence .get)
+        held = self.owner_map[item]
+        left = held.get(ask.owner, 0.0) - qty
+        if left <= 1e-6:
+            held.pop(ask.owner, None)
+        else:
+            held[ask.owner] = left
+        held[bid.owner] = held.get(bid.owner, 0.0) + qty
 
         # fix for_sale_map –––––––––––––––––––––––––––––––––––––––––
         self._decrease_for_sale(ask.owner, item, qty)
 
-        # shrink open order quantities
+        # shrink open order quantities (and the book-side totals)
         ask.quantity -= qty
         bid.quantity -= qty
+        self.asks[item].qty -= qty
+        self.bids[item].qty -= qty
 
         # record trade
         trade_id = self.trade_id_counter
         self.trade_id_counter += 1
-        self.trades.append({
-            "id": trade_id,
-            "time": time.time(),
-            "sim_day": sim_day,
-            "item": item,
-            "quantity": qty,
-            "price": price,
-            "cost": cost,
-            "buyer": getattr(bid.owner, "guild_name", getattr(bid.owner, "name", "???")),
-            "seller": getattr(ask.owner, "guild_name", getattr(ask.owner, "name", "???")),
-        })
-        logger.debug(f"[Trade #{trade_id}] {qty:.2f} {item} @ {price:.2f} (day {sim_day})")
+        self.trades.append(
+            trade_id, time.time(), sim_day, item, qty, price, cost,
+            self._owner_name(bid.owner, "???"),
+            self._owner_name(ask.owner, "???"),
+        )
+        self._recent_trades[item].append((sim_day, price))
+        logger.debug("[Trade #%d] %.2f %s @ %.2f (day %d)", trade_id, qty, item, price, sim_day)
+
+    def recent_trade_prices(self, item: str, since_day: int) -> List[float]:
+        """Prices of *item* trades on or after *since_day*, oldest first."""
+        return [p for d, p in self._recent_trades.get(item, ()) if d >= since_day]
+
+    def _trim_recent_trades(self, since_day: int) -> None:
+        """Forget window entries older than *since_day* (days only move forward)."""
+        for window in self._recent_trades.values():
+            while window and window[0][0] < since_day:
+                window.popleft()
+
+    def _owner_name(self, owner: Any, default: str) -> str:
+        """``owner.guild_name``, else ``owner.name``, else *default* (memoized)."""
+        name = self._owner_names.get(owner, _NO_NAME)
+        if name is _NO_NAME:
+            name = getattr(owner, "guild_name", _NO_NAME)
+            if name is _NO_NAME:
+                name = getattr(owner, "name", _NO_NAME)
+            self._owner_names[owner] = name
+        return default if name is _NO_NAME else name
 
     # ──────────────────────────────────────────────────────────────
     # 3b) order expiry / relist
     # ──────────────────────────────────────────────────────────────
     def _remove_expired_orders(self, today: int, simulation=None) -> None:
-        # bids
-        for itm in list(self.bids):
-            self.bids[itm] = [o for o in self.bids[itm] if o.valid_until_day >= today]
-
-        # asks – collect those that expired so we can optionally relist
+        # take only the due day buckets (oldest first, then by order id);
+        # asks are collected for optional relist
+        buckets = self._expiry
         expired: List[MarketOrder] = []
-        for itm in list(self.asks):
-            keep: List[MarketOrder] = []
-            for o in self.asks[itm]:
-                if o.valid_until_day >= today:
-                    keep.append(o)
-                else:
+        for day in sorted(d for d in buckets if d < today):
+            for o in buckets.pop(day):
+                if o.is_bid:
+                    self.bids[o.item].discard(o)
+                elif self.asks[o.item].discard(o):
                     expired.append(o)
-            self.asks[itm] = keep
 
         if simulation and expired:
+            # relist in book order (price, then age) like the old per-item
+            # scan, so FIFO priority at the new price level is unchanged
+            expired.sort(key=lambda o: (o.price, o.order_id))
             self._relist_expired_asks(expired, simulation)
 
     def _relist_expired_asks(self, expired_asks: List[MarketOrder], simulation) -> None:
@@ -302,36 +504,46 @@ class MarketWarehouse:
                 ask_price=new_price,
                 current_day=simulation.current_day,
             )
-            logger.debug(f"{ask.owner} relisted {ask.quantity:.2f} {ask.item} @ {new_price:.2f}")
+            logger.debug("%s relisted %.2f %s @ %.2f", ask.owner, ask.quantity, ask.item, new_price)
 
     # ──────────────────────────────────────────────────────────────
     # 4) Dynamic reference price
     # ──────────────────────────────────────────────────────────────
     def update_supply_demand(self) -> None:
-        # reset tallies
-        for rec in self.goods.values():
+        # BookSide.qty is maintained on every insert/fill/expiry, so this is
+        # one read per item rather than a sum over resting orders
+        goods = self.goods
+        for rec in goods.values():
             rec["supply"] = rec["demand"] = 0.0
-        for itm, lst in self.asks.items():
-            self.goods[itm]["supply"] += sum(a.quantity for a in lst)
-        for itm, lst in self.bids.items():
-            self.goods[itm]["demand"] += sum(b.quantity for b in lst)
+        for itm, side in self.asks.items():
+            goods[itm]["supply"] += side.qty
+        for itm, side in self.bids.items():
+            goods[itm]["demand"] += side.qty
+
+    def best_ask_price(self, item: str) -> float | None:
+        """Lowest resting ask for *item*, or ``None`` if nobody is selling."""
+        side = self.asks.get(item)
+        return side.best().price if side else None
+
+    def price_snapshot(self) -> Dict[str, float]:
+        """Current reference prices as ``{item: price}`` (a copy)."""
+        return {itm: rec["price"] for itm, rec in self.goods.items()}
 
     def do_dynamic_price_adjustment(self) -> None:
-        CAP = 5  # ×base_price
-        for itm, rec in self.goods.items():
+        step, floor = PRICE_STEP, PRICE_FLOOR
+        for rec, cap in self._price_rows:
             sup, dem, p = rec["supply"], rec["demand"], rec["price"]
             if sup < 1e-4 and dem > 0:
-                new_p = p * 1.02
+                new_p = p * (1 + step)
             else:
-                ratio = dem / sup if sup > 0 else float("inf")
+                ratio = dem / sup if sup > 0 else _INF
                 if ratio > 1:
-                    new_p = p * (1 + min(0.02, ratio - 1))
+                    new_p = p * (1 + min(step, ratio - 1))
                 elif 0 < ratio < 1:
-                    new_p = p * (1 - min(0.02, 1 - ratio))
+                    new_p = p * (1 - min(step, 1 - ratio))
                 else:
                     new_p = p
-            base = CATALOG.goods[itm].base_price
-            rec["price"] = max(0.01, min(new_p, base * CAP))
+            rec["price"] = max(floor, min(new_p, cap))
 
     # ──────────────────────────────────────────────────────────────
     # 5) CSV dump (debug / viz)
@@ -339,15 +551,18 @@ class MarketWarehouse:
     def write_order_book_to_csv(self, day: int | None = None) -> None:
         day_str = "NA" if day is None else str(day)
         fname = f"order_book_day_{day_str}.csv"
-        with open(fname, "w", newline="") as f:
+        with open(fname, "w", newline="", buffering=1 << 20) as f:
             w = csv.writer(f)
             w.writerow(["Item", "Type", "Price", "Quantity", "Owner"])
-            for itm, lst in self.bids.items():
-                for b in lst:
-                    w.writerow([itm, "BID", f"{b.price:.2f}", f"{b.quantity:.2f}",
-                                getattr(b.owner, 'guild_name', getattr(b.owner, 'name', '?'))])
-            for itm, lst in self.asks.items():
-                for a in lst:
-                    w.writerow([itm, "ASK", f"{a.price:.2f}", f"{a.quantity:.2f}",
-                                getattr(a.owner, 'guild_name', getattr(a.owner, 'name', '?'))])
+            w.writerows(self._csv_rows(self.bids, "BID"))
+            w.writerows(self._csv_rows(self.asks, "ASK"))
         logger.debug("Wrote order book to %s", fname)
+
+    def _csv_rows(self, book: Dict[str, BookSide], kind: str) -> Iterator[tuple]:
+        """CSV rows for one side of the book; the price is formatted once per level."""
+        owner_name = self._owner_name
+        for itm, side in book.items():
+            for level in side.iter_levels():
+                price = f"{level[0].price:.2f}"
+                for o in level:
+                    yield (itm, kind, price, f"{o.quantity:.2f}", owner_name(o.owner, "?"))
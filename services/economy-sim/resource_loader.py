@@ -6,15 +6,29 @@ and exposes a global CATALOG. Requires: `pip install pyyaml numpy arena_data`.
 """
 
 from __future__ import annotations
+import sys
 from dataclasses import dataclass, field
+from pathlib import Path
 from typing import Dict, List, Any, Optional, Tuple # Added Tuple
 
 import yaml
 import numpy as np
 from importlib import resources
 
+from table_cache import read_cached, write_cached, yaml_stamp
+
+try:                    # libyaml-backed parser when PyYAML was built with it
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+
+# shared answer for ResourceCatalog.vec() on unknown items
+_ZERO_VEC = np.zeros(9, dtype=float)
+_ZERO_VEC.flags.writeable = False
+
 # --- Dataclasses (incorporating new fields) ---
-@dataclass
+@dataclass(slots=True)
 class Good:
     name: str
     vec: List[float]
@@ -25,7 +39,7 @@ class Good:
     tool_type: Optional[str] = None # NEW: e.g., "AXE", "PICKAXE", "SAW" (for tools)
     # Add any other common fields from goods.yaml if consistently present
 
-@dataclass
+@dataclass(slots=True)
 class Station:
     name: str
     slots: int
@@ -34,7 +48,7 @@ class Station:
     build_labour: float
     build_capital: float # Renamed from 'build_cap'
 
-@dataclass
+@dataclass(slots=True)
 class Recipe:
     key: str
     output: str
@@ -48,28 +62,28 @@ class Recipe:
     exp_yield: int
     tool_type_required: Optional[str] = None # e.g., "SAW", "FORGE_HAMMER"
 
-@dataclass
+@dataclass(slots=True)
 class Material:
     name: str
     harvest_speed_range: Tuple[float, float] = field(default_factory=lambda: (0.0, 0.0))
     durability_modifier_range: Tuple[float, float] = field(default_factory=lambda: (0.0, 0.0))
     weight_factor: float = 1.0
 
-@dataclass
+@dataclass(slots=True)
 class CraftQuality: # From craft_quality.yaml
     name: str
     gather_speed_range: Tuple[float, float]
     durability_range: Tuple[float, float]
     move_speed_range: Tuple[float, float]
 
-@dataclass
+@dataclass(slots=True)
 class RepairState: # From repair_state.yaml
     name: str
     gather_speed_mult: float
     move_speed_mult: float
     durability_floor: float
 
-@dataclass
+@dataclass(slots=True)
 class ToolDefinition: # From tools.yaml
     name: str # Key from tools.yaml, e.g., "bronze_pickaxe"
     tool_class: str # e.g., "pickaxe", "hatchet" (gameplay system usage)
@@ -85,9 +99,21 @@ def _load_yaml_from_package(file_name: str) -> Dict:
     """Loads a YAML file from the 'arena_data.tables' subpackage."""
     try:
         # The package name is 'arena_data', and 'tables' is a directory within it.
-        with resources.open_text("arena_data.tables", file_name, encoding='utf-8') as f:
-            data = yaml.safe_load(f)
-            return data if data is not None else {}
+        path = resources.files("arena_data.tables") / file_name
+        # Parsed tables are pickled beside each yaml (see table_cache), so
+        # later runs skip PyYAML; only a plain directory (not a zip) caches.
+        stamp = None
+        if isinstance(path, Path):
+            stamp = yaml_stamp(path)
+            cached = read_cached(path, stamp)
+            if cached is not None:
+                return cached[0]
+        with path.open("r", encoding='utf-8') as f:
+            data = yaml.load(f, Loader=_YamlLoader)
+        data = data if data is not None else {}
+        if stamp:
+            write_cached(path, stamp, data)
+        return data
     except FileNotFoundError:
         print(f"ERROR: YAML file not found in package: arena_data.tables/{file_name}")
         raise # Or return {} and handle upstream
@@ -110,16 +136,21 @@ class ResourceCatalog:
 
         if self.goods:
             valid_goods_for_vec = [g for g in self.goods.values() if g.vec and len(g.vec) == 9]
-            self._vec_matrix = np.array([g.vec for g in valid_goods_for_vec])
+            self._vec_matrix = np.array([g.vec for g in valid_goods_for_vec], dtype=float)
             self._item_index = {g.name: i for i, g in enumerate(valid_goods_for_vec)}
         else:
             self._vec_matrix = np.array([])
             self._item_index = {}
+        # vec() hands out rows of this matrix, so nobody may write through them
+        self._vec_matrix.flags.writeable = False
 
     def _load_all_data(self):
+        # Item names end up as dict keys all over the sim (market books,
+        # warehouses, recipe tables), so they are interned here once.
         # Goods
         goods_data_raw = _load_yaml_from_package("goods.yaml")
         for name, entry in goods_data_raw.items():
+            name = sys.intern(name)
             self.goods[name] = Good(
                 name=name,
                 vec=entry.get("vec", [0.0]*9),
@@ -145,11 +176,12 @@ class ResourceCatalog:
         # Recipes
         recipes_data_raw = _load_yaml_from_package("recipes.yaml")
         for key, entry in recipes_data_raw.items():
+            key = sys.intern(key)
             self.recipes[key] = Recipe(
                 key=key,
-                output=entry["output"],
+                output=sys.intern(entry["output"]),
                 out_per_batch=entry["out"],
-                inputs=entry["inputs"],
+                inputs={sys.intern(k): v for k, v in entry["inputs"].items()},
                 labour=entry["labour"],
                 station_required=entry.get("station"), # station_required for clarity
                 time=entry["time"],
@@ -237,11 +269,11 @@ class ResourceCatalog:
         return self.repair_states.get(state_name)
 
     def vec(self, item: str) -> np.ndarray: # Kept for compatibility
-        good = self.get_good(item)
-        if good and good.vec and len(good.vec) == 9:
-            return np.asarray(good.vec, dtype=float)
-        # print(f"Warning: Item '{item}' not found or has invalid vector in CATALOG.goods for vec() method.")
-        return np.zeros(9, dtype=float)
+        """Read-only view of *item*'s 9-vector (zeros if unknown); ``.copy()`` to mutate."""
+        idx = self._item_index.get(item)
+        if idx is not None:
+            return self._vec_matrix[idx]
+        return _ZERO_VEC
 
 
 # Global CATALOG instance, created when this module is imported.
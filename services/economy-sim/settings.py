@@ -7,11 +7,12 @@ Keeping them here means no more magic numbers sprinkled everywhere.
 TRANSPORT_CAPACITY = {"hand": 8, "horse_cart": 30, "wagon": 60}
 
 # Economy / survival ---------------------------------------------------------
-MEAL_ITEMS  = [
+# Tuples, not sets: order is preference (eaten first, cheapest-ask ties).
+MEAL_ITEMS  = (
     "bread", "meal_meat", "meal_sardine", "meal_herring",
     "meal_trout", "meal_salmon", "meal_swordfish", "meal_shark",
-]
-DRINK_ITEMS = ["beer", "milk"]
+)
+DRINK_ITEMS = ("beer", "milk")
 
 DEFAULT_KEEP_STOCK         = 5     # fallback when no min_stocks entry
 PERSON_FOOD_NEED_DAILY     = 2
@@ -28,8 +28,9 @@ from __future__ import annotations
 import csv
 import logging
 import random
+from array import array
 from collections import defaultdict
-from typing import List
+from typing import Dict, List, Sequence
 
 # ── local modules ────────────────────────────────────────────────────────────
 from data_structures import (
@@ -41,10 +42,8 @@ from data_structures import (
 from entities import Person, Guild, Treasury
 from market import MarketWarehouse
 from economy import (
-    produce_raw_resources,
-    farmer_produce_daily,
-    parse_recipes_and_produce,
-    guild_buy_raw_materials,
+    daily_production,
+    daily_procurement,
     INDUSTRY_CONFIG,
 )
 from settings import (
@@ -58,6 +57,40 @@ from settings import (
     TRANSPORT_CAPACITY,
 )
 
+
+def _farm_animals() -> dict:
+    # draw order (cows, pigs, sheep) is part of the seeded run
+    return dict(
+        cows=random.randint(0, 2),
+        pigs=random.randint(0, 4),
+        sheep=random.randint(0, 5),
+    )
+
+
+# Starting workforce: (profession, name prefix, head count, extra Person
+# kwargs factory or None).  Everyone starts LOW-skilled with 1000 silver;
+# the rest of the 400 are filled with unemployed.
+POP_TABLE = (
+    (Profession.GLADIATOR,        "Gladiator",       100, None),
+    (Profession.MINER,            "Miner",            20, None),
+    (Profession.LUMBERJACK,       "Lumberjack",       15, None),
+    (Profession.FARMER,           "Farmer",           40, _farm_animals),
+    (Profession.FISHER,           "Fisher",           40, None),
+    (Profession.CARPENTER,        "Carpenter",         4, None),
+    (Profession.BLACKSMITH,       "Blacksmith",        4, None),
+    (Profession.JEWELER,          "Jeweler",           4, None),
+    (Profession.BAKER,            "Baker",             4, None),
+    (Profession.BREWER,           "Brewer",            3, None),
+    (Profession.COOK,             "Cook",              6, None),
+    (Profession.TAILOR,           "Tailor",            5, None),
+    (Profession.TREASURY_OFFICER, "TreasuryOfficer",   5, None),
+    (Profession.HAULER,           "Hauler",           22, None),
+)
+INITIAL_POPULATION = 400
+
+# what gladiators spend their prize money on (shuffled per shopper)
+LUX_ITEMS = ("beer", "meal_meat", "furniture", "clothing", "weapon_basic", "armor_basic")
+
 class TransportJob:
     """A single logistics task (direction = 'outbound' | 'inbound')."""
 
@@ -87,40 +120,55 @@ def _use_vehicle(guild: Guild, method: str, delta: int) -> None:
         guild.num_horses_in_use += delta
 
 
-def _one_outbound_trip(
-    hauler: Person, job: TransportJob, sim: "Simulation"
-) -> float:
-    """Move goods *to* the market, return the moved quantity."""
+def _haul_outbound(
+    haulers: Sequence[Person], job: TransportJob, sim: "Simulation"
+) -> None:
+    """
+    Move *job* to the market in vehicle-sized trips, haulers taking turns.
+
+    The vehicle is picked once: trips are sequential, so the same one is
+    free for every trip.  The job is clamped to local stock up front (a
+    shortfall used to spin the trip loop forever); each trip still books
+    its own warehouse/market movement so the float totals are unchanged.
+    """
     g = job.guild
+    item = job.item
+    stock = g.warehouse[item]
+    if job.quantity_remaining > stock:
+        logging.warning(
+            "Stalled haul: %s planned %s but local stock =%.2f (remain %.2f)",
+            g.guild_name,
+            item,
+            stock,
+            job.quantity_remaining,
+        )
+        job.quantity_remaining = stock
+    if job.quantity_remaining <= 0:
+        return
+
     method = _pick_vehicle(g)
+    cap = TRANSPORT_CAPACITY[method]
+    deposit = sim.marketWarehouse.deposit
+    wh = g.warehouse
+    n = len(haulers)
+    trip = 0
     _use_vehicle(g, method, +1)
     try:
-        cap = TRANSPORT_CAPACITY[method]
-        to_load = min(cap, job.quantity_remaining, g.warehouse[job.item])
-        if to_load <= 0:
-            logging.warning(
-                "Stalled haul: %s planned %s but local stock =0 (remain %.2f)",
-                g.guild_name,
-                job.item,
+        while job.quantity_remaining > 0:
+            to_load = min(cap, job.quantity_remaining)
+            wh[item] -= to_load
+            job.quantity_remaining -= to_load
+            job.delivered_amount += to_load
+            deposit(g, item, to_load, for_sale=True)
+            logging.debug(
+                "%s hauled %.2f %s -> market with %s (remain %.2f)",
+                haulers[trip % n].name,
+                to_load,
+                item,
+                method,
                 job.quantity_remaining,
             )
-            return 0.0
-
-        g.warehouse[job.item] -= to_load
-        job.quantity_remaining -= to_load
-        job.delivered_amount += to_load
-
-        sim.marketWarehouse.deposit(g, job.item, to_load, for_sale=True)
-
-        logging.debug(
-            "%s hauled %.2f %s -> market with %s (remain %.2f)",
-            hauler.name,
-            to_load,
-            job.item,
-            method,
-            job.quantity_remaining,
-        )
-        return to_load
+            trip += 1
     finally:
         _use_vehicle(g, method, -1)
 
@@ -160,18 +208,18 @@ def _one_inbound_trip(
 def handle_transport_jobs(sim: "Simulation") -> None:
     """
     Execute *outbound* jobs and auto‑place a single ASK when done.
+
+    Guilds are handled one after another on purpose: the market deposits
+    and asks must land in guild order to keep order ids (and so matching
+    priority) deterministic, and the work never releases the GIL.
     """
     for g in sim.guilds:
-        haulers = [p for p in g.employees if p.profession == Profession.HAULER]
+        haulers = g.haulers
         if not haulers:
             continue
 
-        for job in [j for j in sim.transport_jobs if j.guild == g]:
-            while job.quantity_remaining > 0:
-                for h in haulers:
-                    _one_outbound_trip(h, job, sim)
-                    if job.quantity_remaining <= 0:
-                        break
+        for job in sim.transport_jobs.get(g, ()):
+            _haul_outbound(haulers, job, sim)
             if job.delivered_amount > 0:  # finished
                 ref_p = sim.marketWarehouse.goods[job.item]["price"]
                 sim.marketWarehouse.place_ask(
@@ -182,25 +230,35 @@ def handle_transport_jobs(sim: "Simulation") -> None:
                     current_day=sim.current_day,
                 )
         # prune finished
-    sim.transport_jobs = [j for j in sim.transport_jobs if j.quantity_remaining > 0]
+    sim.transport_jobs = _prune_jobs(sim.transport_jobs, 0.0)
 
 
 def handle_inbound_jobs(sim: "Simulation") -> None:
     """Execute *inbound* jobs until all are done for the day."""
     for g in sim.guilds:
-        haulers = [p for p in g.employees if p.profession == Profession.HAULER]
+        haulers = g.haulers
         if not haulers:
             continue
 
-        for job in [j for j in sim.inbound_transport_jobs if j.guild == g]:
+        for job in sim.inbound_transport_jobs.get(g, ()):
             while job.quantity_remaining > 0:
                 for h in haulers:
                     _one_inbound_trip(h, job, sim)
                     if job.quantity_remaining <= 0:
                         break
-    sim.inbound_transport_jobs = [
-        j for j in sim.inbound_transport_jobs if j.quantity_remaining > 1e-6
-    ]
+    sim.inbound_transport_jobs = _prune_jobs(sim.inbound_transport_jobs, 1e-6)
+
+
+def _prune_jobs(
+    jobs: Dict[Guild, List[TransportJob]], eps: float
+) -> Dict[Guild, List[TransportJob]]:
+    """Drop jobs with at most *eps* left (and guilds left with none)."""
+    pruned: Dict[Guild, List[TransportJob]] = defaultdict(list)
+    for g, lst in jobs.items():
+        left = [j for j in lst if j.quantity_remaining > eps]
+        if left:
+            pruned[g] = left
+    return pruned
 
 
 # ============================================================================
@@ -223,7 +281,13 @@ class Simulation:
     def __init__(self, logger: logging.Logger | None = None):
         self.logger = logger or logging.getLogger()
         self.people: List[Person] = []
+        self._next_person_id = 1
+        # profession → people, in population order; see _index_professions()
+        self.people_by_profession: Dict[Profession, List[Person]] = {}
         self.guilds: List[Guild] = []
+        self._guild_set: frozenset = frozenset()
+        # profession → first guild of that trade, filled by create_guilds()
+        self._guild_by_profession: Dict[Profession, Guild] = {}
         self.treasury = Treasury()
 
         self.INDUSTRY_CONFIG = INDUSTRY_CONFIG
@@ -233,16 +297,20 @@ class Simulation:
         self.current_day = 1
         self.tax_rate_percent = 10.0
 
-        # telemetry
-        self.day_list: List[int] = []
-        self.forest_capacity_list: List[int] = []
-        self.hungry_list: List[int] = []
-        self.total_silver_list: List[float] = []
-        self.total_gold_list: List[float] = []
+        # telemetry: one entry per day, as unboxed typed arrays (plain
+        # sequences to the GUI; matplotlib takes them as-is)
+        self.day_list = array("l")
+        self.forest_capacity_list = array("l")
+        self.hungry_list = array("l")
+        self.total_silver_list = array("d")
+        self.total_gold_list = array("d")
 
-        # dynamic queues
-        self.transport_jobs: List[TransportJob] = []
-        self.inbound_transport_jobs: List[TransportJob] = []
+        # dynamic queues, grouped by guild (in generation order)
+        self.transport_jobs: Dict[Guild, List[TransportJob]] = defaultdict(list)
+        self.inbound_transport_jobs: Dict[Guild, List[TransportJob]] = defaultdict(list)
+
+        # employee → guild (first guild to hire them), kept by _hire()
+        self._person_to_guild: Dict[Person, Guild] = {}
 
     # ─────────────────────────────────────────────────────────── logistics
     def _get_keep_amount(self, guild: Guild, item: str) -> float:
@@ -258,23 +326,29 @@ class Simulation:
                     continue
                 keep = 0 if item.startswith("meal_") else self._get_keep_amount(g, item)
                 if qty > keep:
-                    self.transport_jobs.append(
+                    self.transport_jobs[g].append(
                         TransportJob(g, item, qty - keep, direction="outbound")
                     )
 
     def generate_inbound_transport_jobs(self) -> None:
-        self.inbound_transport_jobs.clear()
-        for g in self.guilds:
-            for item, owners in self.marketWarehouse.owner_map.items():
-                owned = owners.get(g, 0.0)
+        # One pass over the market's items, touching only the guilds that
+        # actually hold each one; per-guild job lists stay in item order.
+        jobs = self.inbound_transport_jobs
+        jobs.clear()
+        guilds = self._guild_set
+        for_sale_map = self.marketWarehouse.for_sale_map
+        for item, owners in self.marketWarehouse.owner_map.items():
+            held = owners.keys() & guilds
+            if not held:
+                continue
+            listed = for_sale_map.get(item)     # .get: don't grow the defaultdict
+            for g in held:
+                owned = owners[g]
                 if owned <= 1e-6:
                     continue
-                for_sale = self.marketWarehouse.for_sale_map[item].get(g, 0.0)
-                to_haul = owned - for_sale
+                to_haul = owned - listed.get(g, 0.0) if listed else owned
                 if to_haul > 1e-6:
-                    self.inbound_transport_jobs.append(
-                        TransportJob(g, item, to_haul, direction="inbound")
-                    )
+                    jobs[g].append(TransportJob(g, item, to_haul, direction="inbound"))
 
     # ─────────────────────────────────────────────────────────── people helpers
     @staticmethod
@@ -282,86 +356,105 @@ class Simulation:
         # eat
         for m in MEAL_ITEMS:
             if person.inventory[m] >= PERSON_FOOD_NEED_DAILY:
-                person.inventory[m] -= PERSON_FOOD_NEED_DAILY
+                person.use_item(m, PERSON_FOOD_NEED_DAILY)
                 return True
         # drink
         for d in DRINK_ITEMS:
             if person.inventory[d] >= PERSON_DRINK_NEED_DAILY:
-                person.inventory[d] -= PERSON_DRINK_NEED_DAILY
+                person.use_item(d, PERSON_DRINK_NEED_DAILY)
                 return True
         return False
 
     def move_purchases_to_inventory(self) -> None:
-        for item, owners in list(self.marketWarehouse.owner_map.items()):
-            for owner, qty in list(owners.items()):
-                if qty <= 1e-6 or not hasattr(owner, "inventory"):
-                    continue
-                picked = self.marketWarehouse.withdraw(owner, item, qty)
-                owner.inventory[item] += picked
+        mw = self.marketWarehouse
+        # one flat snapshot first: withdraw() deletes emptied owner entries
+        picks = [
+            (owner, item, qty)
+            for item, owners in mw.owner_map.items()
+            for owner, qty in owners.items()
+            if qty > 1e-6 and hasattr(owner, "gain_item")
+        ]
+        for owner, item, qty in picks:
+            owner.gain_item(item, mw.withdraw(owner, item, qty))
 
     # ►►►  buying food/drink --------------------------------------------------
     def people_buy_food_stockpile(self) -> None:
+        # Balances are read live here and in _gladiator_luxury_spending: the
+        # matching pass between the two moves silver, so a once-a-day
+        # snapshot would go stale (and the method is two attribute reads).
+        # Asks, on the other hand, only change in match_orders_for_day --
+        # place_bid just rests the order -- so the cheapest meal/drink is
+        # looked up once for the whole pass.
+        food, food_price = self._cheapest_ask(MEAL_ITEMS)
+        drink, drink_price = self._cheapest_ask(DRINK_ITEMS)
         for p in self.people:
             if p.total_silver_equivalent() < 1.0:
                 continue
 
             # -------- food
             need = 7 * p.food_need_daily
-            have = sum(p.inventory[m] for m in MEAL_ITEMS)
+            have = p.food_total
             short = need - have
-            if short > 0.1:
-                cheapest, price = self._cheapest_ask(MEAL_ITEMS)
-                if cheapest:
-                    self.marketWarehouse.place_bid(
-                        owner=p,
-                        item=cheapest,
-                        quantity=int(short + 1),
-                        bid_price=round(price * 1.10, 2),
-                        current_day=self.current_day,
-                    )
+            if short > 0.1 and food:
+                self.marketWarehouse.place_bid(
+                    owner=p,
+                    item=food,
+                    quantity=int(short + 1),
+                    bid_price=round(food_price * 1.10, 2),
+                    current_day=self.current_day,
+                )
 
             # -------- drink
             need = 7 * p.drink_need_daily
-            have = sum(p.inventory[d] for d in DRINK_ITEMS)
+            have = p.drink_total
             short = need - have
-            if short > 0.1:
-                cheapest, price = self._cheapest_ask(DRINK_ITEMS)
-                if cheapest:
-                    self.marketWarehouse.place_bid(
-                        owner=p,
-                        item=cheapest,
-                        quantity=int(short + 1),
-                        bid_price=round(price * 1.10, 2),
-                        current_day=self.current_day,
-                    )
+            if short > 0.1 and drink:
+                self.marketWarehouse.place_bid(
+                    owner=p,
+                    item=drink,
+                    quantity=int(short + 1),
+                    bid_price=round(drink_price * 1.10, 2),
+                    current_day=self.current_day,
+                )
 
-    def _cheapest_ask(self, items: List[str]) -> tuple[str | None, float | None]:
+    def _cheapest_ask(self, items: Sequence[str]) -> tuple[str | None, float | None]:
+        # A plain scan on purpose: this runs twice a day over ten items, while
+        # a cross-item (price, item) heap would need a push on every
+        # place_ask and lazy pops after every fill to stay current.
         cheapest, best_price = None, None
         for it in items:
-            asks = self.marketWarehouse.asks.get(it, [])
-            if not asks:
+            p = self.marketWarehouse.best_ask_price(it)
+            if p is None:
                 continue
-            p = asks[0].price  # sorted ascending
             if best_price is None or p < best_price:
                 cheapest, best_price = it, p
         return cheapest, best_price
 
     # ►►►  gladiator luxury spending -----------------------------------------
     def _gladiator_luxury_spending(self) -> None:
-        lux_items = ["beer", "meal_meat", "furniture", "clothing", "weapon_basic", "armor_basic"]
-
-        for gl in (x for x in self.people if x.profession == Profession.GLADIATOR):
+        # One list per day, reshuffled in place for each gladiator who can
+        # afford to shop: every shuffle starts from the previous one's
+        # order, and the seeded run depends on that draw sequence (a fresh
+        # random.sample per gladiator would draw differently).
+        lux_items = list(LUX_ITEMS)
+        shuffle = random.shuffle
+        mw = self.marketWarehouse
+        goods, owner_map = mw.goods, mw.owner_map
+        place_bid, withdraw = mw.place_bid, mw.withdraw
+        day = self.current_day
+
+        for gl in self.people_by_profession.get(Profession.GLADIATOR, ()):
             total_eq  = gl.total_silver_equivalent()
             if total_eq < 100:
                 continue
 
             budget = min(total_eq * 0.5, 500.0)
             spent  = 0.0
-            random.shuffle(lux_items)
+            shuffle(lux_items)
 
             for item in lux_items:
                 # estimated cost of this purchase
-                ref_p     = self.marketWarehouse.goods[item]["price"]
+                ref_p     = goods[item]["price"]
                 est_cost  = 3 * ref_p
 
                 # stop if this buy would bust either the personal budget or the gladiator’s cash
@@ -369,106 +462,40 @@ class Simulation:
                     continue
 
                 # place BID
-                self.marketWarehouse.place_bid(
+                place_bid(
                     owner      = gl,
                     item       = item,
                     quantity   = 3,
                     bid_price  = round(ref_p * 1.10, 2),
-                    current_day= self.current_day,
+                    current_day= day,
                 )
 
                 # immediate pickup (simplified)
-                owned = self.marketWarehouse.owner_map[item].get(gl, 0.0)
+                owned = owner_map[item].get(gl, 0.0)
                 if owned:
-                    picked = self.marketWarehouse.withdraw(gl, item, owned)
-                    gl.inventory[item] += picked
+                    picked = withdraw(gl, item, owned)
+                    gl.gain_item(item, picked)
                     spent += picked * ref_p
 
    
     # ───────────────────────────────────────────────────── population & guilds
     def create_initial_population(self):
-        next_id = 1
         people = []
-        # 100 gladiators
-        for _ in range(100):
-            p = Person(next_id, f"Gladiator_{next_id}", Profession.GLADIATOR, SkillLevel.LOW, silver=1000)
-            people.append(p)
-            next_id += 1
-        # 20 miners
-        for _ in range(20):
-            p = Person(next_id, f"Miner_{next_id}", Profession.MINER, SkillLevel.LOW, silver=1000)
-            people.append(p)
-            next_id += 1
-        # 15 lumberjacks
-        for _ in range(15):
-            p = Person(next_id, f"Lumberjack_{next_id}", Profession.LUMBERJACK, SkillLevel.LOW, silver=1000)
-            people.append(p)
-            next_id += 1
-        # 30 farmers
-        for _ in range(40):
-            cows = random.randint(0, 2)
-            pigs = random.randint(0, 4)
-            sheep = random.randint(0, 5)
-            p = Person(next_id, f"Farmer_{next_id}", Profession.FARMER, SkillLevel.LOW, silver=1000,
-                       cows=cows, pigs=pigs, sheep=sheep)
-            people.append(p)
-            next_id += 1
-        # 40 fishers
-        for _ in range(40):
-            p = Person(next_id, f"Fisher_{next_id}", Profession.FISHER, SkillLevel.LOW, silver=1000)
-            people.append(p)
-            next_id += 1
-        # 4 carpenters
-        for _ in range(4):
-            p = Person(next_id, f"Carpenter_{next_id}", Profession.CARPENTER, SkillLevel.LOW, silver=1000)
-            people.append(p)
-            next_id += 1
-        # 8 blacksmiths
-        for _ in range(4):
-            p = Person(next_id, f"Blacksmith_{next_id}", Profession.BLACKSMITH, SkillLevel.LOW, silver=1000)
-            people.append(p)
-            next_id += 1
-        # 4 jewelers
-        for _ in range(4):
-            p = Person(next_id, f"Jeweler_{next_id}", Profession.JEWELER, SkillLevel.LOW, silver=1000)
-            people.append(p)
-            next_id += 1
-        # 4 bakers
-        for _ in range(4):
-            p = Person(next_id, f"Baker_{next_id}", Profession.BAKER, SkillLevel.LOW, silver=1000)
-            people.append(p)
-            next_id += 1
-        # 4 brewers
-        for _ in range(3):
-            p = Person(next_id, f"Brewer_{next_id}", Profession.BREWER, SkillLevel.LOW, silver=1000)
-            people.append(p)
-            next_id += 1
-        # 6 cooks
-        for _ in range(6):
-            p = Person(next_id, f"Cook_{next_id}", Profession.COOK, SkillLevel.LOW, silver=1000)
-            people.append(p)
-            next_id += 1
-        # 5 tailors
-        for _ in range(5):
-            p = Person(next_id, f"Tailor_{next_id}", Profession.TAILOR, SkillLevel.LOW, silver=1000)
-            people.append(p)
-            next_id += 1
-        # 5 treasury officers
-        for _ in range(5):
-            p = Person(next_id, f"TreasuryOfficer_{next_id}", Profession.TREASURY_OFFICER, SkillLevel.LOW, silver=1000)
-            people.append(p)
-            next_id += 1
-        # 22 haulers
-        for _ in range(22):
-            p = Person(next_id, f"Hauler_{next_id}", Profession.HAULER, SkillLevel.LOW, silver=1000)
-            people.append(p)
-            next_id += 1
-        # fill up to 400 unemployed
-        while len(people) < 400:
-            p = Person(next_id, f"Unemployed_{next_id}", Profession.UNEMPLOYED, SkillLevel.NONE)
-            people.append(p)
-            next_id += 1
+        for prof, prefix, count, extras in POP_TABLE:
+            ids = range(len(people) + 1, len(people) + 1 + count)
+            if extras is None:
+                people.extend(Person.new_bulk(ids, prefix, prof, SkillLevel.LOW, silver=1000))
+                continue
+            for pid in ids:      # per-person draws, in id order
+                people.append(Person(pid, f"{prefix}_{pid}", prof, SkillLevel.LOW,
+                                     silver=1000, **extras()))
+        people.extend(Person.new_bulk(
+            range(len(people) + 1, INITIAL_POPULATION + 1),
+            "Unemployed", Profession.UNEMPLOYED, SkillLevel.NONE,
+        ))
         self.people = people
+        self._next_person_id = max((p.person_id for p in people), default=0) + 1
+        self._index_professions()
 
     def create_guilds(self):
         from collections import defaultdict
@@ -489,23 +516,39 @@ class Simulation:
             g = Guild(gid, f"{prof.value.capitalize()}_Guild", prof)
             # add all matching employees
             for x in prof_map[prof]:
-                g.add_employee(x)
+                self._hire(g, x)
             guilds.append(g)
             gid += 1
 
         # also add some haulers
         for g in guilds:
             for _ in range(2):
-                new_id = max(p.person_id for p in self.people) + 1
+                new_id = self._next_person_id
+                self._next_person_id += 1
                 h = Person(new_id, f"Hauler_{new_id}", Profession.HAULER, SkillLevel.LOW, 30)
                 self.people.append(h)
-                g.add_employee(h)
+                self._hire(g, h)
+        self._index_professions()
 
         self.guilds = guilds
+        self._guild_set = frozenset(guilds)
+        for g in guilds:
+            self._guild_by_profession.setdefault(g.profession, g)
+
+    def _index_professions(self) -> None:
+        """Rebuild people_by_profession (after hiring or retraining)."""
+        index: Dict[Profession, List[Person]] = {}
+        for p in self.people:
+            index.setdefault(p.profession, []).append(p)
+        self.people_by_profession = index
+
+    def _hire(self, guild: Guild, person: Person) -> None:
+        guild.add_employee(person)
+        self._person_to_guild.setdefault(person, guild)
 
     # ────────────────────────────────────────────────────────────── helpers
     def find_guild_for_person(self, person: Person) -> Guild | None:
-        return next((g for g in self.guilds if person in g.employees), None)
+        return self._person_to_guild.get(person)
     
     def find_guild_by_id(self, guild_id: int) -> Guild | None:
         """Return the Guild with the given id, or None."""
@@ -520,28 +563,12 @@ class Simulation:
         # 1) refresh demand curves / ref‑prices
         self.marketWarehouse.update_supply_demand()
 
-        # 2) guild procurement
-        for g in self.guilds:
-            guild_buy_raw_materials(g, self)
+        # 2) guild procurement (prices don't move until step 6)
+        daily_procurement(self)
 
         # 3) production (Mon‑Fri)
         if dow < 5:
-            for p in self.people:
-                g = self.find_guild_for_person(p)
-                if not g:
-                    continue
-                if p.profession in (
-                    Profession.MINER,
-                    Profession.LUMBERJACK,
-                    Profession.FISHER,
-                ):
-                    self.forest_capacity = produce_raw_resources(
-                        p, g, self.forest_capacity
-                    )
-                elif p.profession == Profession.FARMER:
-                    farmer_produce_daily(p, g, season_factor)
-                elif p.profession == g.profession and p.profession != Profession.UNEMPLOYED:
-                    parse_recipes_and_produce(p, g, self)
+            daily_production(self, season_factor)
 
         # 4) outbound logistics
         self.generate_transport_jobs()
@@ -585,6 +612,9 @@ class Simulation:
 
         # 13) telemetry
         self.marketWarehouse.write_order_book_to_csv(self.current_day)
+        # Plain sums: a mirrored numpy column would have to follow every
+        # silver/gold write in guilds, market and treasury, and a pairwise
+        # sum would change the rounding of the reported totals.
         total_silver = sum(p.silver for p in self.people)
         total_gold = sum(p.gold for p in self.people)
         self.day_list.append(self.current_day)
@@ -645,7 +675,8 @@ class Simulation:
         for p in self.people:
             self.pay_taxes_monthly(p)
         # tournament
-        glads = [x for x in self.people if x.profession == Profession.GLADIATOR]
+        # a copy: pay_tournament_prizes shuffles the list it is given
+        glads = list(self.people_by_profession.get(Profession.GLADIATOR, ()))
         self.treasury.pay_tournament_prizes(glads, GLADIATOR_PRIZE_DISTRIBUTION, logging)
         # clothing
         for p in self.people:
@@ -653,6 +684,7 @@ class Simulation:
         # training
         for p in self.people:
             p.train_one_month()
+        self._index_professions()      # graduates change profession
 
         # treasury buys ore from the warehouse if you wish, etc. (omitted here for brevity)
 
@@ -671,33 +703,33 @@ class Simulation:
         if cost <= 0:
             return
 
-        tailor_guild = None
-        for g in self.guilds:
-            if g.profession == Profession.TAILOR:
-                tailor_guild = g
-                break
+        tailor_guild = self._guild_by_profession.get(Profession.TAILOR)
 
         paid = person.pay_in_silver(cost)
         if tailor_guild:
             tailor_guild.receive_silver(paid)
             if paid < cost:
                 logging.debug(
-                    f"{person.name} couldn't afford full clothing upkeep (paid={paid:.2f}/{cost:.2f})."
+                    "%s couldn't afford full clothing upkeep (paid=%.2f/%.2f).",
+                    person.name, paid, cost,
                 )
             else:
                 logging.debug(
-                    f"{person.name} paid {paid:.2f} to {tailor_guild.guild_name} for clothing upkeep."
+                    "%s paid %.2f to %s for clothing upkeep.",
+                    person.name, paid, tailor_guild.guild_name,
                 )
         else:
             # fallback: deposit into treasury or just vanish
             self.treasury.collect_tax(paid)
             if paid < cost:
                 logging.debug(
-                    f"{person.name} lacked full clothing payment. Paid {paid:.2f}/{cost:.2f}."
+                    "%s lacked full clothing payment. Paid %.2f/%.2f.",
+                    person.name, paid, cost,
                 )
             else:
                 logging.debug(
-                    f"{person.name} paid {paid:.2f} for clothing upkeep (no tailor guild)."
+                    "%s paid %.2f for clothing upkeep (no tailor guild).",
+                    person.name, paid,
                 )
 
     def get_season(self, day):
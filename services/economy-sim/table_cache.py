@@ -0,0 +1,64 @@
+"""
+table_cache.py
+
+Pickle cache for parsed arena-data yaml tables, shared by
+``resource_loader`` and ``api.loader`` so each yaml gets exactly one
+``<name>.cache.pickle`` beside it.
+
+An entry is ``(stamp, data, validated)``: *stamp* is the yaml's
+``(mtime_ns, size)``, and *validated* is whatever the writer wants to
+record about checks already run on *data* (``api.loader`` stores its
+schema stamp there; ``None`` means unchecked).  Writes go to a temp file
+in the same directory and are moved into place with ``os.replace``, so a
+concurrent reader never sees a half-written pickle.
+"""
+
+from __future__ import annotations
+
+import os
+import pickle
+import tempfile
+from pathlib import Path
+from typing import Any
+
+CACHE_SUFFIX = ".cache.pickle"
+
+
+def cache_path(yaml_path: Path) -> Path:
+    return yaml_path.with_name(yaml_path.stem + CACHE_SUFFIX)
+
+
+def yaml_stamp(yaml_path: Path) -> tuple:
+    st = yaml_path.stat()
+    return (st.st_mtime_ns, st.st_size)
+
+
+def read_cached(yaml_path: Path, stamp: tuple) -> tuple[Any, Any] | None:
+    """``(data, validated)`` if the cache matches *stamp*, else None."""
+    try:
+        cached_stamp, data, validated = pickle.loads(
+            cache_path(yaml_path).read_bytes())
+    except (OSError, pickle.UnpicklingError, EOFError, ValueError, TypeError):
+        return None
+    return (data, validated) if cached_stamp == stamp else None
+
+
+def write_cached(yaml_path: Path, stamp: tuple, data: Any,
+                 validated: Any = None) -> None:
+    target = cache_path(yaml_path)
+    blob = pickle.dumps((stamp, data, validated),
+                        protocol=pickle.HIGHEST_PROTOCOL)
+    try:
+        fd, tmp = tempfile.mkstemp(prefix=target.name + ".",
+                                   suffix=".tmp", dir=target.parent)
+    except OSError:                    # read-only install: yaml path still works
+        return
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(blob)
+        os.replace(tmp, target)
+    except OSError:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass